@@ -0,0 +1,207 @@
+"""Numeric kernels over EvidenceSet columns.
+
+Kernels take the plain column tuples from ``EvidenceSet.columns`` and
+return raw accumulators; wrapping results into dataclasses is left to
+the callers.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Hashable, Iterable, Mapping, Sequence, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+def aggregate_kernel(
+    valence: tuple[float, ...],
+    weight: tuple[float, ...],
+    time: tuple[float, ...],
+    now: float,
+    decay_rate: float,
+) -> tuple[float, float, float]:
+    """Return (pos_mass, neg_mass, total_weight) with unit relevance.
+
+    The sign split is branchless: only the positive mass is accumulated
+    (masked by ``v >= 0``) and the negative mass is derived from the total,
+    so ``pos_mass + neg_mass == total_weight`` holds by construction.
+
+    Dispatches once on ``decay_rate`` so the common no-decay case never
+    evaluates ``exp`` or the loop-invariant rate test per item.
+    """
+    if decay_rate > 0.0:
+        return _aggregate_decay(valence, weight, time, now, decay_rate)
+    return _aggregate_no_decay(valence, weight)
+
+
+def _aggregate_no_decay(
+    valence: tuple[float, ...],
+    weight: tuple[float, ...],
+) -> tuple[float, float, float]:
+    pos_mass = 0.0
+    total_weight = 0.0
+    for v, weighted in zip(valence, weight):
+        pos_mass += weighted * (v >= 0.0)
+        total_weight += weighted
+    return pos_mass, total_weight - pos_mass, total_weight
+
+
+def _aggregate_decay(
+    valence: tuple[float, ...],
+    weight: tuple[float, ...],
+    time: tuple[float, ...],
+    now: float,
+    decay_rate: float,
+) -> tuple[float, float, float]:
+    # Evidence timestamps cluster heavily (batches share a clock reading),
+    # so the decay factor is computed once per distinct time and reused.
+    exp = math.exp
+    decay_by_time: dict[float, float] = {}
+    pos_mass = 0.0
+    total_weight = 0.0
+    for v, w, t in zip(valence, weight, time):
+        decay = decay_by_time.get(t)
+        if decay is None:
+            decay = decay_by_time[t] = exp(-decay_rate * max(0.0, now - t))
+        weighted = w * decay
+        pos_mass += weighted * (v >= 0.0)
+        total_weight += weighted
+    return pos_mass, total_weight - pos_mass, total_weight
+
+
+def aggregate_relevance_kernel(
+    valence: tuple[float, ...],
+    weight: tuple[float, ...],
+    time: tuple[float, ...],
+    relevance: Sequence[float],
+    now: float,
+    decay_rate: float,
+) -> tuple[float, float, float]:
+    """aggregate_kernel with a per-item relevance column.
+
+    Items with relevance <= 0 contribute nothing, as in the scalar loop.
+    """
+    pos_mass = 0.0
+    total_weight = 0.0
+    if decay_rate > 0.0:
+        exp = math.exp
+        decay_by_time: dict[float, float] = {}
+        for v, w, t, r in zip(valence, weight, time, relevance):
+            if r <= 0.0:
+                continue
+            decay = decay_by_time.get(t)
+            if decay is None:
+                decay = decay_by_time[t] = exp(-decay_rate * max(0.0, now - t))
+            weighted = w * r * decay
+            pos_mass += weighted * (v >= 0.0)
+            total_weight += weighted
+    else:
+        for v, w, r in zip(valence, weight, relevance):
+            if r <= 0.0:
+                continue
+            weighted = w * r
+            pos_mass += weighted * (v >= 0.0)
+            total_weight += weighted
+    return pos_mass, total_weight - pos_mass, total_weight
+
+
+def aggregate_by_kind_kernel(
+    valence: tuple[float, ...],
+    weight: tuple[float, ...],
+    time: tuple[float, ...],
+    kind: tuple[K, ...],
+    kinds: Iterable[K],
+    now: float,
+    decay_rate: float,
+) -> tuple[float, float, float, dict[K, float], dict[K, int]]:
+    """aggregate_kernel plus per-kind undecayed weight sums and counts.
+
+    The per-kind totals are accumulated in item order, exactly as
+    kind_totals_kernel does, so they can seed ``EvidenceSet.kind_totals``.
+    """
+    weights = dict.fromkeys(kinds, 0.0)
+    counts = dict.fromkeys(kinds, 0)
+    pos_mass = 0.0
+    total_weight = 0.0
+    if decay_rate > 0.0:
+        exp = math.exp
+        decay_by_time: dict[float, float] = {}
+        for v, w, t, k in zip(valence, weight, time, kind):
+            weights[k] += w
+            counts[k] += 1
+            decay = decay_by_time.get(t)
+            if decay is None:
+                decay = decay_by_time[t] = exp(-decay_rate * max(0.0, now - t))
+            weighted = w * decay
+            pos_mass += weighted * (v >= 0.0)
+            total_weight += weighted
+    else:
+        for v, w, k in zip(valence, weight, kind):
+            weights[k] += w
+            counts[k] += 1
+            pos_mass += w * (v >= 0.0)
+            total_weight += w
+    return pos_mass, total_weight - pos_mass, total_weight, weights, counts
+
+
+def kind_totals_kernel(
+    kind: tuple[K, ...],
+    weight: tuple[float, ...],
+    kinds: Iterable[K],
+) -> tuple[dict[K, float], dict[K, int]]:
+    """Per-kind weight sums and counts over the kind/weight columns."""
+    weights = dict.fromkeys(kinds, 0.0)
+    counts = dict.fromkeys(kinds, 0)
+    for k, w in zip(kind, weight):
+        weights[k] += w
+        counts[k] += 1
+    return weights, counts
+
+
+def unit(x: float) -> float:
+    """clamp(x) to [0, 1] without the two builtin calls."""
+    return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
+
+
+def nu_kernel(nu_raw: float, penalties: Mapping[K, float], summed: bool = False) -> float:
+    """ν = clamp(ν_raw + penalty); penalty is the max of the penalties, or
+    their sum capped at 1 when summed."""
+    if not penalties:
+        nu_penalty = 0.0
+    elif summed:
+        nu_penalty = min(1.0, sum(penalties.values()))
+    else:
+        nu_penalty = max(penalties.values())
+    return max(0.0, min(1.0, nu_raw + nu_penalty))
+
+
+def default_def_sem(n_definitional: int, n_constraints: int) -> float:
+    """DefaultSemanticProvider's four scores and their mean, from the counts.
+
+    Counts are non-negative, so each score only needs its upper bound.
+    """
+    oc = min(1.0, n_definitional * 0.15) + min(0.5, n_constraints * 0.1)
+    if oc > 1.0:
+        oc = 1.0
+    amb = min(1.0, n_constraints * 0.12)
+    cc = min(1.0, n_constraints * 0.1)
+    bp = min(1.0, (n_definitional * 0.1) + (n_constraints * 0.08))
+    return unit((oc + (1.0 - amb) + cc + bp) / 4.0)
+
+
+def definedness_kernel(
+    epistemic_weight: float,
+    procedural_weight: float,
+    n_definitional: int,
+    n_constraints: int,
+    w_sem: float,
+    w_ep: float,
+    w_proc: float,
+) -> float:
+    """Def with the default provider and no overrides, from per-kind totals."""
+    x = (
+        w_sem * default_def_sem(n_definitional, n_constraints)
+        + w_ep * unit(epistemic_weight / 2.0)
+        + w_proc * unit(procedural_weight / 2.0)
+    )
+    return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
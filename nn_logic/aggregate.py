@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
-import math
+from typing import Optional
 
+from nn_logic._kernels import (
+    aggregate_by_kind_kernel,
+    aggregate_kernel,
+    aggregate_relevance_kernel,
+)
+from nn_logic.definedness import DefEpFn, DefProcFn, DefSemFn, definedness
 from nn_logic.types import (
     AggregateResult,
     ContextID,
-    Evidence,
+    EvidenceKind,
     EvidenceSet,
     RelevanceFn,
+    SemanticDefinednessProvider,
     TargetID,
     default_relevance_fn,
 )
@@ -30,28 +37,80 @@ def aggregate(
     now: float = 0.0,
     decay_rate: float = 0.0,
 ) -> AggregateResult:
-    pos_mass = 0.0
-    neg_mass = 0.0
-    total_weight = 0.0
+    if not evidence.items or not evidence.has_mass:
+        # Nothing can contribute mass, whatever the relevance or decay.
+        return _result(0.0, 0.0, 0.0)
 
-    for e in evidence:
-        relevance = relevance_fn(e, target, context)
-        if relevance <= 0.0:
-            continue
+    if relevance_fn is default_relevance_fn:
+        # Fast path: relevance is constant 1.0, so reduce over the cached
+        # columns instead of the Evidence objects.
+        cols = evidence.columns
+        pos_mass, neg_mass, total_weight = aggregate_kernel(
+            cols.valence, cols.weight, cols.time, now, decay_rate
+        )
+        return _result(pos_mass, neg_mass, total_weight)
 
-        # Apply time decay
-        age = max(0.0, now - e.time)
-        decay = math.exp(-decay_rate * age) if decay_rate > 0.0 else 1.0
+    # Evaluate the relevance column once, then reduce over columns.
+    relevance = [relevance_fn(e, target, context) for e in evidence.items]
+    cols = evidence.columns
+    pos_mass, neg_mass, total_weight = aggregate_relevance_kernel(
+        cols.valence, cols.weight, cols.time, relevance, now, decay_rate
+    )
+    return _result(pos_mass, neg_mass, total_weight)
 
-        weighted = abs(e.valence) * e.trust * relevance * decay
 
-        if e.valence >= 0.0:
-            pos_mass += weighted
-        else:
-            neg_mass += weighted
+def aggregate_and_definedness(
+    evidence: EvidenceSet,
+    target: TargetID,
+    context: ContextID,
+    relevance_fn: RelevanceFn = default_relevance_fn,
+    now: float = 0.0,
+    decay_rate: float = 0.0,
+    constraints: tuple[str, ...] = (),
+    w_sem: float = 0.4,
+    w_ep: float = 0.35,
+    w_proc: float = 0.25,
+    sem_provider: Optional[SemanticDefinednessProvider] = None,
+    def_sem_override: Optional[DefSemFn] = None,
+    def_ep_override: Optional[DefEpFn] = None,
+    def_proc_override: Optional[DefProcFn] = None,
+) -> tuple[AggregateResult, float]:
+    """aggregate() and definedness() over the same evidence, sharing one scan.
+
+    With the default relevance the aggregate pass also accumulates the
+    per-kind totals that definedness reads, and seeds them into the
+    evidence set's cache, so the evidence is walked once instead of twice.
+    """
+    if (
+        relevance_fn is default_relevance_fn
+        and evidence.items
+        and "kind_totals" not in evidence.__dict__
+    ):
+        cols = evidence.columns
+        pos_mass, neg_mass, total_weight, weights, counts = aggregate_by_kind_kernel(
+            cols.valence, cols.weight, cols.time, cols.kind, EvidenceKind, now, decay_rate
+        )
+        evidence.__dict__["kind_totals"] = (weights, counts)
+        agg = _result(pos_mass, neg_mass, total_weight)
+    else:
+        agg = aggregate(evidence, target, context, relevance_fn, now, decay_rate)
+
+    def_value = definedness(
+        target,
+        evidence,
+        constraints,
+        w_sem,
+        w_ep,
+        w_proc,
+        sem_provider,
+        def_sem_override,
+        def_ep_override,
+        def_proc_override,
+    )
+    return agg, def_value
 
-        total_weight += weighted
 
+def _result(pos_mass: float, neg_mass: float, total_weight: float) -> AggregateResult:
     conflict = compute_conflict(pos_mass, neg_mass)
 
     # Def_ep: epistemic definedness from evidence mass
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import dataclasses
+from typing import Mapping, Optional
 
 from nn_logic.types import (
     AgentID,
@@ -20,49 +21,15 @@ def boundary_transform_evidence(
     policy: Policy,
 ) -> Evidence:
     """Apply boundary transform to a single evidence item based on source role."""
-    if role == Role.I:
+    factor = _role_factors(policy)[role]
+    if factor == 1.0:
         return e
-    elif role == Role.NOT_I:
-        new_trust = e.trust * policy.not_i_trust_factor
-        return Evidence(
-            id=e.id,
-            kind=e.kind,
-            claim=e.claim,
-            valence=e.valence,
-            src=e.src,
-            time=e.time,
-            trust=new_trust,
-            metadata=e.metadata,
-        )
-    elif role == Role.BOTH:
-        new_trust = e.trust * policy.coalition_factor
-        return Evidence(
-            id=e.id,
-            kind=e.kind,
-            claim=e.claim,
-            valence=e.valence,
-            src=e.src,
-            time=e.time,
-            trust=new_trust,
-            metadata=e.metadata,
-        )
-    else:  # UNKNOWN
-        new_trust = e.trust * policy.unknown_trust_factor
-        return Evidence(
-            id=e.id,
-            kind=e.kind,
-            claim=e.claim,
-            valence=e.valence,
-            src=e.src,
-            time=e.time,
-            trust=new_trust,
-            metadata=e.metadata,
-        )
+    return dataclasses.replace(e, trust=e.trust * factor)
 
 
 def boundary_transform(
     evidence: EvidenceSet,
-    roles: dict[AgentID, Role],
+    roles: Mapping[AgentID, Role],
     policy: Policy,
     scope: Optional[frozenset[TargetID]] = None,
 ) -> EvidenceSet:
@@ -70,13 +37,39 @@ def boundary_transform(
 
     If scope is provided, only evidence relevant to targets in scope is included.
     """
-    transformed: list[Evidence] = []
-    for e in evidence:
-        role = roles.get(e.src, Role.UNKNOWN)
-        t = boundary_transform_evidence(e, role, policy)
-        transformed.append(t)
-
-    if not transformed:
+    if not evidence.items:
         return EvidenceSet.empty()
 
-    return EvidenceSet(items=tuple(transformed))
+    # Resolve role -> factor once per known source; unlisted sources fall
+    # back to the UNKNOWN factor with a single dict lookup per item.
+    role_factor = _role_factors(policy)
+    src_factor = {src: role_factor[r] for src, r in roles.items()}
+    unknown = role_factor[Role.UNKNOWN]
+    cols = evidence.columns
+    factors = [src_factor.get(src, unknown) for src in cols.src]
+    if all(f == 1.0 for f in factors):
+        # Identity transform (e.g. every source is Role.I): nothing to copy.
+        return evidence
+
+    new_trust = tuple([t * f for t, f in zip(cols.trust, factors)])
+    items = tuple([
+        e if f == 1.0 else dataclasses.replace(e, trust=trust)
+        for e, f, trust in zip(evidence.items, factors, new_trust)
+    ])
+
+    # Only trust (and the weight derived from it) changes; the other
+    # columns are shared with the input.
+    new_weight = tuple([e._weight0 for e in items])
+    return EvidenceSet.with_columns(
+        items, cols._replace(trust=new_trust, weight=new_weight)
+    )
+
+
+def _role_factors(policy: Policy) -> dict[Role, float]:
+    """Trust multiplier applied to evidence from each role."""
+    return {
+        Role.I: 1.0,
+        Role.NOT_I: policy.not_i_trust_factor,
+        Role.BOTH: policy.coalition_factor,
+        Role.UNKNOWN: policy.unknown_trust_factor,
+    }
@@ -14,7 +14,7 @@ from nn_logic.types import (
     SemanticDefinednessProvider,
     TargetID,
 )
-from nn_logic.evidence import partition_by_kind
+from nn_logic._kernels import default_def_sem, definedness_kernel, unit
 from nn_logic.helpers import clamp
 
 
@@ -27,8 +27,7 @@ class DefaultSemanticProvider:
     def ontology_coverage(
         self, target: TargetID, evidence: EvidenceSet, constraints: tuple[str, ...]
     ) -> float:
-        definitional = [e for e in evidence if e.kind == EvidenceKind.DEFINITIONAL]
-        base = min(1.0, len(definitional) * 0.15)
+        base = min(1.0, evidence.definitional_count * 0.15)
         constraint_bonus = min(0.5, len(constraints) * 0.1)
         return clamp(base + constraint_bonus)
 
@@ -50,10 +49,10 @@ class DefaultSemanticProvider:
     def boundary_precision(
         self, target: TargetID, evidence: EvidenceSet, constraints: tuple[str, ...]
     ) -> float:
-        definitional = [e for e in evidence if e.kind == EvidenceKind.DEFINITIONAL]
-        if not definitional and not constraints:
+        n_definitional = evidence.definitional_count
+        if not n_definitional and not constraints:
             return 0.0
-        return clamp((len(definitional) * 0.1) + (len(constraints) * 0.08))
+        return clamp((n_definitional * 0.1) + (len(constraints) * 0.08))
 
 
 _DEFAULT_PROVIDER = DefaultSemanticProvider()
@@ -81,12 +80,17 @@ def def_sem(
         return override(target, evidence, constraints)
 
     p = provider or _DEFAULT_PROVIDER
+    if type(p) is DefaultSemanticProvider:
+        # Subclasses may override any of the four scores, so only the exact
+        # default takes the fused path.
+        return default_def_sem(evidence.definitional_count, len(constraints))
+
     oc = p.ontology_coverage(target, evidence, constraints)
     amb = p.ambiguity_score(target, evidence, constraints)
     cc = p.constraint_coverage(target, evidence, constraints)
     bp = p.boundary_precision(target, evidence, constraints)
 
-    return clamp((oc + (1.0 - amb) + cc + bp) / 4.0)
+    return unit((oc + (1.0 - amb) + cc + bp) / 4.0)
 
 
 def def_ep(
@@ -98,11 +102,7 @@ def def_ep(
     if override is not None:
         return override(target, evidence)
 
-    epistemic = [e for e in evidence if e.kind == EvidenceKind.EPISTEMIC]
-    if not epistemic:
-        return 0.0
-    total_weight = sum(abs(e.valence) * e.trust for e in epistemic)
-    return clamp(total_weight / 2.0)
+    return unit(evidence.kind_totals[0][EvidenceKind.EPISTEMIC] / 2.0)
 
 
 def def_proc(
@@ -114,11 +114,26 @@ def def_proc(
     if override is not None:
         return override(target, evidence)
 
-    procedural = [e for e in evidence if e.kind == EvidenceKind.PROCEDURAL]
-    if not procedural:
-        return 0.0
-    total_weight = sum(abs(e.valence) * e.trust for e in procedural)
-    return clamp(total_weight / 2.0)
+    return unit(evidence.kind_totals[0][EvidenceKind.PROCEDURAL] / 2.0)
+
+
+def uses_default_definedness(
+    sem_provider: Optional[SemanticDefinednessProvider] = None,
+    def_sem_override: Optional[DefSemFn] = None,
+    def_ep_override: Optional[DefEpFn] = None,
+    def_proc_override: Optional[DefProcFn] = None,
+) -> bool:
+    """True when definedness() takes the built-in path.
+
+    That path depends only on the evidence, the constraints and the weights,
+    never on the target id.
+    """
+    return (
+        def_sem_override is None
+        and def_ep_override is None
+        and def_proc_override is None
+        and (sem_provider is None or type(sem_provider) is DefaultSemanticProvider)
+    )
 
 
 def definedness(
@@ -137,12 +152,47 @@ def definedness(
 
     Returns a value in [0, 1] where 1 = fully defined.
     """
+    if uses_default_definedness(
+        sem_provider, def_sem_override, def_ep_override, def_proc_override
+    ):
+        # Depends only on the evidence, the constraint count and the weights,
+        # so decay/recontextualize steps that leave the evidence alone reuse
+        # the value cached on the (shared, immutable) evidence set.
+        memo = evidence.memo
+        key = ("definedness", len(constraints), w_sem, w_ep, w_proc)
+        value = memo.get(key)
+        if value is None:
+            weights, counts = evidence.kind_totals
+            value = memo[key] = definedness_kernel(
+                weights[EvidenceKind.EPISTEMIC],
+                weights[EvidenceKind.PROCEDURAL],
+                counts[EvidenceKind.DEFINITIONAL],
+                len(constraints),
+                w_sem,
+                w_ep,
+                w_proc,
+            )
+        return value
+
     ds = def_sem(target, evidence, constraints, sem_provider, def_sem_override)
     de = def_ep(target, evidence, override=def_ep_override)
     dp = def_proc(target, evidence, override=def_proc_override)
-    return clamp(w_sem * ds + w_ep * de + w_proc * dp)
+    return combine_definedness(ds, de, dp, w_sem, w_ep, w_proc)
+
+
+def combine_definedness(
+    ds: float,
+    de: float,
+    dp: float,
+    w_sem: float = 0.4,
+    w_ep: float = 0.35,
+    w_proc: float = 0.25,
+) -> float:
+    """Weighted Def from already-known components, clamped to [0, 1]."""
+    x = w_sem * ds + w_ep * de + w_proc * dp
+    return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
 
 
 def nu_raw_from_definedness(def_value: float) -> float:
     """ν_raw = 1 - Def. Higher definedness → lower vagueness."""
-    return clamp(1.0 - def_value)
+    return unit(1.0 - def_value)
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import hashlib
 import math
-from typing import Optional
+import sys
+from typing import Callable, Iterable, Optional, Sequence, Union
 
 from nn_logic.types import (
+    _EMPTY_MAPPING,
     AgentID,
     DedupMode,
     Evidence,
@@ -20,16 +22,56 @@ def time_bucket(t: float, granularity: float) -> int:
     return int(math.floor(t / granularity))
 
 
+def _sha256_id(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def _blake2b_id(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+# Identity hashes only need to be stable, not cryptographic. sha256 stays
+# the default so persisted ids remain valid; blake2b is a faster opt-in
+# producing ids of the same width.
+ID_HASHES: dict[str, Callable[[bytes], str]] = {
+    "sha256": _sha256_id,
+    "blake2b": _blake2b_id,
+}
+
+
 def compute_evidence_id(
     kind: EvidenceKind,
     claim: str,
     src: AgentID,
     t: float,
     granularity: float = 60.0,
+    id_hash: str = "sha256",
 ) -> EvidenceID:
     bucket = time_bucket(t, granularity)
     raw = f"{kind.value}:{claim}:{src}:{bucket}"
-    return EvidenceID(hashlib.sha256(raw.encode()).hexdigest()[:16])
+    return EvidenceID(sys.intern(ID_HASHES[id_hash](raw.encode())))
+
+
+def compute_evidence_ids_batch(
+    kinds: Sequence[EvidenceKind],
+    claims: Sequence[str],
+    srcs: Sequence[AgentID],
+    times: Sequence[float],
+    granularity: float = 60.0,
+    id_hash: str = "sha256",
+) -> list[EvidenceID]:
+    """compute_evidence_id over parallel columns, for bulk ingestion.
+
+    Produces the same ids as calling compute_evidence_id row by row, with
+    the hash lookup and floor binding hoisted out of the loop.
+    """
+    digest = ID_HASHES[id_hash]
+    floor = math.floor
+    intern = sys.intern
+    return [
+        EvidenceID(intern(digest(f"{k.value}:{c}:{s}:{int(floor(t / granularity))}".encode())))
+        for k, c, s, t in zip(kinds, claims, srcs, times)
+    ]
 
 
 def should_add(
@@ -37,13 +79,13 @@ def should_add(
     existing: EvidenceSet,
     mode: DedupMode,
 ) -> bool:
-    for e in existing:
-        if e.id == new.id:
-            if mode == DedupMode.STRICT:
-                return False
-            if mode == DedupMode.CORROBORATION:
-                if e.src == new.src:
-                    return False
+    srcs = existing.sources_by_id.get(new.id)
+    if srcs is None:
+        return True
+    if mode == DedupMode.STRICT:
+        return False
+    if mode == DedupMode.CORROBORATION:
+        return new.src not in srcs
     return True
 
 
@@ -57,6 +99,56 @@ def add_evidence(
     return evidence_set
 
 
+def add_evidence_many(
+    evidence_set: EvidenceSet,
+    items: Union[Iterable[Evidence], EvidenceSet],
+    mode: DedupMode,
+) -> EvidenceSet:
+    """Equivalent to folding add_evidence over items, building one new set.
+
+    Dedup runs against a single working copy of the id -> sources index,
+    so later items in the batch also dedup against earlier accepted ones.
+    items may be a prebuilt EvidenceSet batch; if all of it is accepted,
+    its column view is spliced on instead of re-reading each item.
+    """
+    batch = items if isinstance(items, EvidenceSet) else None
+    index = dict(evidence_set.sources_by_id)
+    accepted: list[Evidence] = []
+    for e in (batch.items if batch is not None else items):
+        srcs = index.get(e.id)
+        if srcs is not None:
+            if mode == DedupMode.STRICT:
+                continue
+            if mode == DedupMode.CORROBORATION and e.src in srcs:
+                continue
+            index[e.id] = srcs + (e.src,)
+        else:
+            index[e.id] = (e.src,)
+        accepted.append(e)
+
+    if not accepted:
+        return evidence_set
+
+    cols = evidence_set.__dict__.get("columns")
+    if batch is not None and len(accepted) == len(batch.items):
+        items_all = evidence_set.items + batch.items
+        if not evidence_set.items:
+            result = EvidenceSet.with_columns(items_all, batch.columns)
+        elif cols is not None:
+            result = EvidenceSet.with_columns(items_all, cols.concat(batch.columns))
+        else:
+            result = EvidenceSet(items=items_all)
+    else:
+        added = tuple(accepted)
+        items_all = evidence_set.items + added
+        if cols is None:
+            result = EvidenceSet(items=items_all)
+        else:
+            result = EvidenceSet.with_columns(items_all, cols.extend(added))
+    result.__dict__["sources_by_id"] = index
+    return result
+
+
 def make_evidence(
     kind: EvidenceKind,
     claim: str,
@@ -67,8 +159,13 @@ def make_evidence(
     granularity: float = 60.0,
     evidence_id: Optional[EvidenceID] = None,
     metadata: Optional[dict] = None,
+    id_hash: str = "sha256",
 ) -> Evidence:
-    eid = evidence_id or compute_evidence_id(kind, claim, src, t, granularity)
+    # Ids and sources are dict/set keys throughout (dedup index, roles,
+    # Context sides); interning makes repeats share one object, so lookups
+    # hit the identity fast path.
+    src = AgentID(sys.intern(str(src)))
+    eid = evidence_id or compute_evidence_id(kind, claim, src, t, granularity, id_hash)
     return Evidence(
         id=eid,
         kind=kind,
@@ -77,12 +174,11 @@ def make_evidence(
         src=src,
         time=t,
         trust=trust,
-        metadata=metadata or {},
+        metadata=metadata or _EMPTY_MAPPING,
     )
 
 
 def partition_by_kind(es: EvidenceSet) -> dict[EvidenceKind, list[Evidence]]:
-    result: dict[EvidenceKind, list[Evidence]] = {k: [] for k in EvidenceKind}
-    for e in es:
-        result[e.kind].append(e)
-    return result
+    # Gather from the cached per-kind row indices.
+    get = es.items.__getitem__
+    return {k: list(map(get, rows)) for k, rows in es.kind_rows.items()}
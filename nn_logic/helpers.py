@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from nn_logic._kernels import nu_kernel
 from nn_logic.types import (
+    _EMPTY_MAPPING,
     PenaltyMode,
     PenaltySource,
     RefinementRecord,
@@ -10,7 +12,7 @@ from nn_logic.types import (
     TargetID,
     ContextID,
 )
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
 
 
 def clamp(v: float, lo: float = 0.0, hi: float = 1.0) -> float:
@@ -19,22 +21,20 @@ def clamp(v: float, lo: float = 0.0, hi: float = 1.0) -> float:
 
 def compute_nu(
     nu_raw: float,
-    nu_penalties: dict[PenaltySource, float],
+    nu_penalties: Mapping[PenaltySource, float],
     mode: PenaltyMode = PenaltyMode.MAX,
 ) -> float:
-    if not nu_penalties:
-        nu_penalty = 0.0
-    elif mode == PenaltyMode.MAX:
-        nu_penalty = max(nu_penalties.values())
-    else:  # SUM
-        nu_penalty = min(1.0, sum(nu_penalties.values()))
-    return clamp(nu_raw + nu_penalty, 0.0, 1.0)
+    return nu_kernel(nu_raw, nu_penalties, mode != PenaltyMode.MAX)
 
 
 def recompute_nu(state: State, mode: PenaltyMode = PenaltyMode.MAX) -> float:
     return compute_nu(state.nu_raw, state.nu_penalties, mode)
 
 
+def _snapshot(penalties: Mapping[PenaltySource, float]) -> Mapping[PenaltySource, float]:
+    return dict(penalties) if penalties else _EMPTY_MAPPING
+
+
 def make_refinement_record(
     state_before: State,
     state_after: State,
@@ -42,16 +42,19 @@ def make_refinement_record(
     timestamp: float,
     details: Optional[dict[str, Any]] = None,
 ) -> RefinementRecord:
+    nu_before = state_before.nu
+    # A no-op hands back the same state; don't derive ν twice.
+    nu_after = nu_before if state_after is state_before else state_after.nu
     return RefinementRecord(
         target_id=state_after.target_id,
         context_id=state_after.context_id,
         operator=operator,
-        nu_before=state_before.nu,
-        nu_after=state_after.nu,
+        nu_before=nu_before,
+        nu_after=nu_after,
         nu_raw_before=state_before.nu_raw,
         nu_raw_after=state_after.nu_raw,
-        penalties_before=dict(state_before.nu_penalties),
-        penalties_after=dict(state_after.nu_penalties),
+        penalties_before=_snapshot(state_before.nu_penalties),
+        penalties_after=_snapshot(state_after.nu_penalties),
         timestamp=timestamp,
-        details=details or {},
+        details=details or _EMPTY_MAPPING,
     )
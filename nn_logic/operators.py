@@ -6,7 +6,10 @@ Operators never mutate their inputs.
 
 from __future__ import annotations
 
-from typing import Any, Callable, Optional
+import sys
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence, Union
 
 from nn_logic.types import (
     AgentID,
@@ -17,10 +20,13 @@ from nn_logic.types import (
     EvidenceID,
     EvidenceKind,
     EvidenceSet,
+    EMPTY_HISTORY,
+    EMPTY_PENALTIES,
     Metadata,
     MockClock,
     PenaltyMode,
     PenaltySource,
+    PenaltyVec,
     RelevanceFn,
     RefinementRecord,
     Role,
@@ -28,34 +34,49 @@ from nn_logic.types import (
     TargetID,
     default_relevance_fn,
 )
-from nn_logic.aggregate import aggregate, compute_conflict
+from nn_logic.aggregate import aggregate, aggregate_and_definedness, compute_conflict
 from nn_logic.boundary import boundary_transform
 from nn_logic.definedness import (
     DefEpFn,
     DefProcFn,
     DefSemFn,
+    combine_definedness,
     definedness,
     nu_raw_from_definedness,
     SemanticDefinednessProvider,
+    uses_default_definedness,
 )
-from nn_logic.evidence import add_evidence
+from nn_logic.evidence import add_evidence_many
 from nn_logic.helpers import clamp, compute_nu, make_refinement_record
 from nn_logic.policy import PI_DEFAULT, Policy
+from nn_logic.state import InformationState
+
+
+# Operator names, interned once and shared by every history entry and record.
+_INCORPORATE = sys.intern("incorporate")
+_NEG_DEFINE = sys.intern("neg_define")
+_MERGE = sys.intern("merge")
+_SPLIT = sys.intern("split")
+_CONFLICT = sys.intern("conflict")
+_RECONTEXTUALIZE = sys.intern("recontextualize")
+_DECAY = sys.intern("decay")
+_PENALTY_DECAY = sys.intern("penalty_decay")
 
 
 # ---------- Incorporate (§8.1) ----------
 
 def incorporate(
     state: State,
-    new_evidence: list[Evidence],
+    new_evidence: Union[list[Evidence], EvidenceSet],
     policy: Policy = PI_DEFAULT,
-    roles: Optional[dict[AgentID, Role]] = None,
+    roles: Optional[Mapping[AgentID, Role]] = None,
     clock: Optional[Clock] = None,
     relevance_fn: Optional[RelevanceFn] = None,
     sem_provider: Optional[SemanticDefinednessProvider] = None,
     def_sem_override: Optional[DefSemFn] = None,
     def_ep_override: Optional[DefEpFn] = None,
     def_proc_override: Optional[DefProcFn] = None,
+    def_overrides: Optional[tuple[float, float, float]] = None,
 ) -> tuple[State, RefinementRecord]:
     """Incorporate new evidence into a state.
 
@@ -63,51 +84,65 @@ def incorporate(
     2. Dedup and add to evidence set
     3. Recompute definedness and ν_raw
     4. Emit refinement record
+
+    def_overrides=(def_sem, def_ep, def_proc) fixes all three components
+    to constants, like overrides that ignore their arguments, without
+    building callables.
     """
     now = (clock or MockClock(0.0)).now()
     rfn = relevance_fn or policy.relevance_fn
 
-    # Apply boundary transform if roles provided
-    if roles:
-        transformed = boundary_transform(
-            EvidenceSet(items=tuple(new_evidence)),
-            roles,
-            policy,
-        )
-        to_add = list(transformed)
+    # A prebuilt EvidenceSet batch keeps its column view through the add.
+    if isinstance(new_evidence, EvidenceSet):
+        batch: Optional[EvidenceSet] = new_evidence
+        items: Sequence[Evidence] = new_evidence.items
     else:
-        to_add = new_evidence
-
-    # Add evidence with dedup
-    updated_evidence = state.evidence
-    for e in to_add:
-        updated_evidence = add_evidence(updated_evidence, e, policy.dedup_mode)
+        batch, items = None, new_evidence
+
+    # Apply boundary transform if roles provided. Evidence whose sources are
+    # all Role.I passes through unchanged, so skip building the set for it.
+    if roles and not all(roles.get(e.src) is Role.I for e in items):
+        if batch is None:
+            batch = EvidenceSet(items=items if isinstance(items, tuple) else tuple(items))
+        batch = boundary_transform(batch, roles, policy)
+        items = batch.items
+
+    # Add evidence with dedup; an empty batch keeps the set (and its memo)
+    updated_evidence = (
+        add_evidence_many(state.evidence, batch or items, policy.dedup_mode)
+        if items else state.evidence
+    )
 
     # Recompute definedness
-    def_value = definedness(
-        state.target_id,
-        updated_evidence,
-        state.constraints,
-        policy.w_sem,
-        policy.w_ep,
-        policy.w_proc,
-        sem_provider,
-        def_sem_override,
-        def_ep_override,
-        def_proc_override,
-    )
+    if def_overrides is not None:
+        def_value = combine_definedness(
+            *def_overrides, policy.w_sem, policy.w_ep, policy.w_proc
+        )
+    else:
+        def_value = definedness(
+            state.target_id,
+            updated_evidence,
+            state.constraints,
+            policy.w_sem,
+            policy.w_ep,
+            policy.w_proc,
+            sem_provider,
+            def_sem_override,
+            def_ep_override,
+            def_proc_override,
+        )
     new_nu_raw = nu_raw_from_definedness(def_value)
 
     new_state = state.replace(
         nu_raw=new_nu_raw,
         evidence=updated_evidence,
-        metadata=state.metadata.with_update(
+        metadata=state.metadata.append_history(
+            _INCORPORATE,
             last_modified=now,
-            history=state.metadata.history + ("incorporate",),
         ),
     )
 
-    record = make_refinement_record(state, new_state, "incorporate", now)
+    record = make_refinement_record(state, new_state, _INCORPORATE, now)
     return new_state, record
 
 
@@ -130,11 +165,8 @@ def neg_define(
     """
     now = (clock or MockClock(0.0)).now()
 
-    # Merge constraints (dedup)
-    existing = set(state.constraints)
-    new_constraints = tuple(state.constraints) + tuple(
-        c for c in constraints if c not in existing
-    )
+    # Merge constraints (dedup, first occurrence wins)
+    new_constraints = tuple(dict.fromkeys(chain(state.constraints, constraints)))
 
     # Recompute definedness with new constraints
     def_value = definedness(
@@ -154,13 +186,13 @@ def neg_define(
     new_state = state.replace(
         nu_raw=new_nu_raw,
         constraints=new_constraints,
-        metadata=state.metadata.with_update(
+        metadata=state.metadata.append_history(
+            _NEG_DEFINE,
             last_modified=now,
-            history=state.metadata.history + ("neg_define",),
         ),
     )
 
-    record = make_refinement_record(state, new_state, "neg_define", now)
+    record = make_refinement_record(state, new_state, _NEG_DEFINE, now)
     return new_state, record
 
 
@@ -185,29 +217,26 @@ def merge(
     """
     now = (clock or MockClock(0.0)).now()
     rfn = relevance_fn or policy.relevance_fn
+    target_id = TargetID(sys.intern(str(target_id)))
+    context_id = ContextID(sys.intern(str(context_id)))
 
     # Union all evidence
-    merged_evidence = EvidenceSet.empty()
-    for s in states:
-        merged_evidence = merged_evidence.union(s.evidence)
-
-    # Merge constraints
-    all_constraints: list[str] = []
-    seen: set[str] = set()
-    for s in states:
-        for c in s.constraints:
-            if c not in seen:
-                seen.add(c)
-                all_constraints.append(c)
-
-    # Compute aggregate to check conflict
-    agg = aggregate(merged_evidence, target_id, context_id, rfn, now, policy.decay_rate)
-
-    # Compute definedness
-    def_value = definedness(
-        target_id,
+    merged_evidence = EvidenceSet.union_many(s.evidence for s in states)
+
+    # Merge constraints (dedup, first occurrence wins)
+    all_constraints = tuple(
+        dict.fromkeys(chain.from_iterable(s.constraints for s in states))
+    )
+
+    # Aggregate (for the conflict check) and definedness in one evidence scan
+    agg, def_value = aggregate_and_definedness(
         merged_evidence,
-        tuple(all_constraints),
+        target_id,
+        context_id,
+        rfn,
+        now,
+        policy.decay_rate,
+        all_constraints,
         policy.w_sem,
         policy.w_ep,
         policy.w_proc,
@@ -219,17 +248,17 @@ def merge(
     new_nu_raw = nu_raw_from_definedness(def_value)
 
     # Apply merge_rupture penalty if conflict is high
-    penalties: dict[PenaltySource, float] = {}
+    penalties = EMPTY_PENALTIES
     if agg.conflict > policy.theta_conflict:
         penalty = min(policy.max_conflict_penalty, agg.conflict * policy.max_conflict_penalty)
-        penalties[PenaltySource.MERGE_RUPTURE] = penalty
+        penalties = penalties.set(PenaltySource.MERGE_RUPTURE, penalty)
 
     # Create a dummy "before" state for record
     before_state = State(
         target_id=target_id,
         context_id=context_id,
         nu_raw=1.0,
-        nu_penalties={},
+        nu_penalties=EMPTY_PENALTIES,
         evidence=EvidenceSet.empty(),
     )
 
@@ -239,16 +268,16 @@ def merge(
         nu_raw=new_nu_raw,
         nu_penalties=penalties,
         evidence=merged_evidence,
-        constraints=tuple(all_constraints),
+        constraints=all_constraints,
         metadata=Metadata(
             creation=now,
             last_modified=now,
-            history=("merge",),
+            history=EMPTY_HISTORY.append(_MERGE),
             tags={"merged_from": [s.target_id for s in states]},
         ),
     )
 
-    record = make_refinement_record(before_state, new_state, "merge", now)
+    record = make_refinement_record(before_state, new_state, _MERGE, now)
     return new_state, record
 
 
@@ -280,40 +309,60 @@ def split(
     children: list[State] = []
     records: list[RefinementRecord] = []
 
-    for child_id in child_ids:
-        child_rfn = relevance_map.get(child_id, policy.relevance_fn)
-
-        # Per-child overrides
-        child_def_sem = (per_child_def_sem or {}).get(child_id, def_sem_override)
-        child_def_ep = (per_child_def_ep or {}).get(child_id, def_ep_override)
-        child_def_proc = (per_child_def_proc or {}).get(child_id, def_proc_override)
-
-        # Recompute definedness with child's relevance function
-        def_value = definedness(
-            child_id,
-            state.evidence,  # copy of parent's evidence
+    # Without per-child calibration the built-in definedness is the same for
+    # every child (it never reads the target id), so compute it once.
+    shared_nu_raw: Optional[float] = None
+    if not (per_child_def_sem or per_child_def_ep or per_child_def_proc) and (
+        uses_default_definedness(
+            sem_provider, def_sem_override, def_ep_override, def_proc_override
+        )
+    ):
+        shared_nu_raw = nu_raw_from_definedness(definedness(
+            state.target_id,
+            state.evidence,
             state.constraints,
             policy.w_sem,
             policy.w_ep,
             policy.w_proc,
-            sem_provider,
-            child_def_sem,
-            child_def_ep,
-            child_def_proc,
-        )
-        new_nu_raw = nu_raw_from_definedness(def_value)
+        ))
+
+    for child_id in child_ids:
+        child_rfn = relevance_map.get(child_id, policy.relevance_fn)
+
+        if shared_nu_raw is not None:
+            new_nu_raw = shared_nu_raw
+        else:
+            # Per-child overrides
+            child_def_sem = (per_child_def_sem or {}).get(child_id, def_sem_override)
+            child_def_ep = (per_child_def_ep or {}).get(child_id, def_ep_override)
+            child_def_proc = (per_child_def_proc or {}).get(child_id, def_proc_override)
+
+            # Recompute definedness with child's relevance function
+            def_value = definedness(
+                child_id,
+                state.evidence,  # copy of parent's evidence
+                state.constraints,
+                policy.w_sem,
+                policy.w_ep,
+                policy.w_proc,
+                sem_provider,
+                child_def_sem,
+                child_def_ep,
+                child_def_proc,
+            )
+            new_nu_raw = nu_raw_from_definedness(def_value)
 
         child_state = State(
             target_id=child_id,
             context_id=state.context_id,
             nu_raw=new_nu_raw,
-            nu_penalties={},  # fresh start
+            nu_penalties=EMPTY_PENALTIES,  # fresh start
             evidence=state.evidence,  # copy, not partition
             constraints=state.constraints,
             metadata=Metadata(
                 creation=now,
                 last_modified=now,
-                history=("split",),
+                history=EMPTY_HISTORY.append(_SPLIT),
                 tags={
                     "parent": state.target_id,
                     "relevance_override": True,
@@ -321,7 +370,7 @@ def split(
             ),
         )
 
-        record = make_refinement_record(state, child_state, "split", now, {
+        record = make_refinement_record(state, child_state, _SPLIT, now, {
             "child_id": child_id,
             "parent_id": state.target_id,
         })
@@ -350,7 +399,7 @@ def apply_conflict(
 
     agg = aggregate(state.evidence, state.target_id, state.context_id, rfn, now, policy.decay_rate)
 
-    new_penalties = dict(state.nu_penalties)
+    new_penalties = PenaltyVec.of(state.nu_penalties)
     new_metadata = state.metadata
 
     if agg.conflict > policy.theta_conflict:
@@ -362,7 +411,7 @@ def apply_conflict(
         else:
             # Apply conflict penalty
             penalty = min(policy.max_conflict_penalty, agg.conflict * policy.max_conflict_penalty)
-            new_penalties[PenaltySource.CONFLICT] = penalty
+            new_penalties = new_penalties.set(PenaltySource.CONFLICT, penalty)
             new_metadata = new_metadata.with_update(
                 conflict_last_applied=now,
                 penalty_clear_start=None,  # reset decay timer
@@ -379,12 +428,10 @@ def apply_conflict(
 
     new_state = state.replace(
         nu_penalties=new_penalties,
-        metadata=new_metadata.with_update(
-            history=state.metadata.history + ("conflict",),
-        ),
+        metadata=new_metadata.append_history(_CONFLICT),
     )
 
-    record = make_refinement_record(state, new_state, "conflict", now, {
+    record = make_refinement_record(state, new_state, _CONFLICT, now, {
         "conflict": agg.conflict,
         "pos_mass": agg.pos_mass,
         "neg_mass": agg.neg_mass,
@@ -408,6 +455,7 @@ def recontextualize(
     """Move a state to a new context, recomputing relevance."""
     now = (clock or MockClock(0.0)).now()
     rfn = relevance_fn or policy.relevance_fn
+    new_context_id = ContextID(sys.intern(str(new_context_id)))
 
     # Recompute definedness in new context
     def_value = definedness(
@@ -424,21 +472,20 @@ def recontextualize(
     )
     new_nu_raw = nu_raw_from_definedness(def_value)
 
-    # Scope expansion penalty if context changes significantly
-    penalties = dict(state.nu_penalties)
-
+    # Penalties carry over unchanged; the frozen state's mapping is shared.
     new_state = state.replace(
         context_id=new_context_id,
         nu_raw=new_nu_raw,
-        nu_penalties=penalties,
-        metadata=state.metadata.with_update(
+        metadata=state.metadata.append_history(
+            _RECONTEXTUALIZE,
             last_modified=now,
-            history=state.metadata.history + ("recontextualize",),
-            crossings=state.metadata.crossings + (f"{state.context_id}->{new_context_id}",),
+            crossings=state.metadata.crossings + (
+                sys.intern(f"{state.context_id}->{new_context_id}"),
+            ),
         ),
     )
 
-    record = make_refinement_record(state, new_state, "recontextualize", now)
+    record = make_refinement_record(state, new_state, _RECONTEXTUALIZE, now)
     return new_state, record
 
 
@@ -478,13 +525,13 @@ def decay(
 
     new_state = state.replace(
         nu_raw=new_nu_raw,
-        metadata=state.metadata.with_update(
+        metadata=state.metadata.append_history(
+            _DECAY,
             last_modified=now,
-            history=state.metadata.history + ("decay",),
         ),
     )
 
-    record = make_refinement_record(state, new_state, "decay", now)
+    record = make_refinement_record(state, new_state, _DECAY, now)
     return new_state, record
 
 
@@ -503,11 +550,12 @@ def penalty_decay(
     """
     now = (clock or MockClock(0.0)).now()
 
-    if not policy.penalty_decay_enabled:
-        record = make_refinement_record(state, state, "penalty_decay", now)
+    if not policy.penalty_decay_enabled or not state.nu_penalties:
+        # Nothing to decay: leave the state (and its history) untouched.
+        record = make_refinement_record(state, state, _PENALTY_DECAY, now)
         return state, record
 
-    new_penalties = dict(state.nu_penalties)
+    new_penalties = PenaltyVec.of(state.nu_penalties)
     new_metadata = state.metadata
 
     # Check if penalty clear window has elapsed for conflict penalty
@@ -516,35 +564,36 @@ def penalty_decay(
         elapsed = now - new_metadata.penalty_clear_start
         if elapsed >= policy.penalty_clear_window:
             # Apply decay factor
-            new_penalties[PenaltySource.CONFLICT] *= policy.penalty_decay_factor
-            if new_penalties[PenaltySource.CONFLICT] < policy.penalty_cleanup_threshold:
-                del new_penalties[PenaltySource.CONFLICT]
+            decayed = new_penalties[PenaltySource.CONFLICT] * policy.penalty_decay_factor
+            if decayed < policy.penalty_cleanup_threshold:
+                new_penalties = new_penalties.delete(PenaltySource.CONFLICT)
                 new_metadata = new_metadata.with_update(penalty_clear_start=None)
+            else:
+                new_penalties = new_penalties.set(PenaltySource.CONFLICT, decayed)
 
     # Decay other penalty types (non-conflict) if they have been present
-    for source in list(new_penalties.keys()):
-        if source == PenaltySource.CONFLICT:
-            continue
-        new_penalties[source] *= policy.penalty_decay_factor
-        if new_penalties[source] < policy.penalty_cleanup_threshold:
-            del new_penalties[source]
+    new_penalties = new_penalties.decay_all(
+        policy.penalty_decay_factor,
+        policy.penalty_cleanup_threshold,
+        skip=PenaltySource.CONFLICT,
+    )
 
     new_state = state.replace(
         nu_penalties=new_penalties,
-        metadata=new_metadata.with_update(
-            last_modified=now,
-            history=state.metadata.history + ("penalty_decay",),
-        ),
+        metadata=new_metadata.append_history(_PENALTY_DECAY, last_modified=now),
     )
 
-    record = make_refinement_record(state, new_state, "penalty_decay", now)
+    record = make_refinement_record(state, new_state, _PENALTY_DECAY, now)
     return new_state, record
 
 
 # ---------- QueryNext (§8.7) ----------
 
+_get_nu_raw = attrgetter("nu_raw")
+
+
 def query_next(
-    states: list[State],
+    states: Union[Iterable[State], InformationState],
     policy: Policy = PI_DEFAULT,
 ) -> Optional[State]:
     """Determine which target to refine next.
@@ -552,14 +601,13 @@ def query_next(
     Returns the state with highest ν_raw (most vague) that is above θ_null.
     If none are above θ_null, returns the one with highest ν_raw overall.
     Returns None if states is empty.
-    """
-    if not states:
-        return None
 
-    # Prefer targets above θ_null (most in need of refinement)
-    above_null = [s for s in states if s.nu_raw > policy.theta_null]
-    if above_null:
-        return max(above_null, key=lambda s: s.nu_raw)
+    ``states`` may be any iterable of states or a whole Σ.
+    """
+    if isinstance(states, InformationState):
+        states = states.iter_states()
 
-    # Otherwise, highest ν_raw
-    return max(states, key=lambda s: s.nu_raw)
+    # Anything above θ_null beats everything at or below it, so the overall
+    # maximum is the answer whichever bucket it lands in: one pass, no
+    # filtered copy, and max() keeps the first of equal maxima as before.
+    return max(states, key=_get_nu_raw, default=None)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -12,11 +13,12 @@ from nn_logic.types import (
     RelevanceFn,
     TargetID,
     ContextID,
+    _SLOTS,
     default_relevance_fn,
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Policy:
     # Evaluation thresholds
     theta_eval: float = 0.4
@@ -58,11 +60,7 @@ class Policy:
     relevance_fn: RelevanceFn = field(default=default_relevance_fn)
 
     def replace(self, **kwargs: Any) -> Policy:
-        d: dict[str, Any] = {}
-        for f in self.__dataclass_fields__:
-            d[f] = getattr(self, f)
-        d.update(kwargs)
-        return Policy(**d)
+        return dataclasses.replace(self, **kwargs)
 
 
 # Default policy singleton
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from operator import itemgetter
+from typing import Any, Mapping, Optional
 
 from nn_logic.types import (
     ContextID,
@@ -27,26 +28,35 @@ def is_licensed(state: State, policy: Policy = PI_DEFAULT) -> bool:
 
     This distinguishes "structurally vague" from "clear but penalized."
     """
-    nu = state.nu_with_mode(policy.penalty_mode)
-    return state.nu_raw <= policy.theta_eval_raw and nu <= policy.theta_eval
+    return _is_licensed(state.nu_raw, state.nu_with_mode(policy.penalty_mode), policy)
 
 
 def determine_reason(state: State, policy: Policy = PI_DEFAULT) -> Reason:
     """Determine why a state is or isn't licensed."""
-    nu = state.nu_with_mode(policy.penalty_mode)
+    return _determine_reason(state.nu_raw, state.nu_with_mode(policy.penalty_mode), policy)
+
+
+def null_status(state: State, policy: Policy = PI_DEFAULT) -> NullStatus:
+    """Determine the null status of a state."""
+    return _null_status(state.nu_with_mode(policy.penalty_mode), policy)
+
+
+# Scalar forms over a precomputed ν, so query() reduces penalties only once.
 
-    if state.nu_raw <= policy.theta_eval_raw and nu <= policy.theta_eval:
+def _is_licensed(nu_raw: float, nu: float, policy: Policy) -> bool:
+    return nu_raw <= policy.theta_eval_raw and nu <= policy.theta_eval
+
+
+def _determine_reason(nu_raw: float, nu: float, policy: Policy) -> Reason:
+    if nu_raw <= policy.theta_eval_raw and nu <= policy.theta_eval:
         return Reason.LICENSED
-    elif state.nu_raw <= policy.theta_eval_raw and nu > policy.theta_eval:
+    elif nu_raw <= policy.theta_eval_raw and nu > policy.theta_eval:
         return Reason.CLEAR_BUT_PENALIZED
     else:
         return Reason.STRUCTURALLY_VAGUE
 
 
-def null_status(state: State, policy: Policy = PI_DEFAULT) -> NullStatus:
-    """Determine the null status of a state."""
-    nu = state.nu_with_mode(policy.penalty_mode)
-
+def _null_status(nu: float, policy: Policy) -> NullStatus:
     if nu <= policy.theta_defined:
         return NullStatus.NOT_NULL
     elif nu >= policy.theta_null:
@@ -64,24 +74,28 @@ class QueryResponse:
     status: NullStatus
     nu: float
     nu_raw: float
-    penalties: dict[PenaltySource, float]
+    penalties: Mapping[PenaltySource, float]  # the state's own mapping; read-only
 
 
 def query(state: State, policy: Policy = PI_DEFAULT) -> QueryResponse:
     """Full query response for a state."""
     nu = state.nu_with_mode(policy.penalty_mode)
+    nu_raw = state.nu_raw
     return QueryResponse(
         target_id=state.target_id,
         context_id=state.context_id,
-        licensed=is_licensed(state, policy),
-        reason=determine_reason(state, policy),
-        status=null_status(state, policy),
+        licensed=_is_licensed(nu_raw, nu, policy),
+        reason=_determine_reason(nu_raw, nu, policy),
+        status=_null_status(nu, policy),
         nu=nu,
-        nu_raw=state.nu_raw,
-        penalties=dict(state.nu_penalties),
+        nu_raw=nu_raw,
+        penalties=state.nu_penalties,
     )
 
 
+_second = itemgetter(1)
+
+
 @dataclass(frozen=True)
 class DecisionQuery:
     """Query for decision support (normative/utility extension stub)."""
@@ -94,4 +108,4 @@ class DecisionQuery:
     def best_option(self) -> Optional[str]:
         if not self.utility_scores:
             return None
-        return max(self.utility_scores, key=self.utility_scores.get)  # type: ignore[arg-type]
+        return max(self.utility_scores.items(), key=_second)[0]
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import math
+import sys
+from typing import Any, Iterator, Optional
 
 from nn_logic.types import (
     Clock,
     ContextID,
+    EMPTY_HISTORY,
+    EMPTY_PENALTIES,
     EvidenceSet,
     Metadata,
     PenaltySource,
@@ -23,55 +27,125 @@ def make_initial_state(
 ) -> State:
     now = (clock or SystemClock()).now()
     return State(
-        target_id=target_id,
-        context_id=context_id,
+        target_id=TargetID(sys.intern(str(target_id))),
+        context_id=ContextID(sys.intern(str(context_id))),
         truth_status=None,
         nu_raw=1.0,
-        nu_penalties={},
+        nu_penalties=EMPTY_PENALTIES,
         evidence=EvidenceSet.empty(),
         metadata=Metadata(
             creation=now,
             last_modified=now,
-            history=(),
+            history=EMPTY_HISTORY,
             crossings=(),
             conflict_last_applied=None,
             penalty_clear_start=None,
-            tags={},
         ),
         constraints=(),
     )
 
 
+# Tombstone for keys removed in a delta layer but still present in its base.
+_REMOVED: Any = object()
+
+
+def _compact_threshold(base_size: int) -> int:
+    return max(8, math.isqrt(base_size))
+
+
 class InformationState:
-    """Σ: (TargetID, ContextID) → State mapping with default initialization."""
+    """Σ: (TargetID, ContextID) → State mapping with default initialization.
+
+    Versions share structure: each holds a read-only ``_base`` dict shared
+    with the versions derived from it, plus a small private ``_delta`` of
+    overrides and removals. ``set``/``remove`` copy only the delta and fold
+    it into a fresh base once it outgrows ~sqrt(len(base)), so an update
+    costs O(sqrt n) amortized instead of a full O(n) store copy.
+    """
 
     def __init__(self, clock: Optional[Clock] = None) -> None:
-        self._store: dict[tuple[TargetID, ContextID], State] = {}
+        self._base: dict[tuple[TargetID, ContextID], State] = {}
+        self._delta: dict[tuple[TargetID, ContextID], State] = {}
         self._clock = clock or SystemClock()
 
+    def _find(self, key: tuple[TargetID, ContextID]) -> Optional[State]:
+        state = self._delta.get(key)
+        if state is None:
+            return self._base.get(key)
+        return None if state is _REMOVED else state
+
+    def _materialize(self) -> dict[tuple[TargetID, ContextID], State]:
+        store = dict(self._base)
+        for key, state in self._delta.items():
+            if state is _REMOVED:
+                del store[key]
+            else:
+                store[key] = state
+        return store
+
+    def _derive(self, compact: bool = False) -> InformationState:
+        new_sigma = InformationState(self._clock)
+        if compact or len(self._delta) >= _compact_threshold(len(self._base)):
+            new_sigma._base = self._materialize()
+        else:
+            new_sigma._base = self._base
+            new_sigma._delta = dict(self._delta)
+        return new_sigma
+
     def get(self, target_id: TargetID, context_id: ContextID) -> State:
         key = (target_id, context_id)
-        if key not in self._store:
-            self._store[key] = make_initial_state(target_id, context_id, self._clock)
-        return self._store[key]
+        state = self._find(key)
+        if state is None:
+            state = make_initial_state(target_id, context_id, self._clock)
+            if self._delta.get(key) is _REMOVED:
+                # As in set(): a recreated key goes to the end, so fold the
+                # tombstone into a fresh (unshared) base first.
+                self._base = self._materialize()
+                self._delta = {}
+            self._delta[key] = state
+        return state
 
     def set(self, state: State) -> InformationState:
-        new_sigma = InformationState(self._clock)
-        new_sigma._store = dict(self._store)
-        new_sigma._store[(state.target_id, state.context_id)] = state
+        key = (state.target_id, state.context_id)
+        # Re-adding a removed key must move it to the end, as a dict would.
+        new_sigma = self._derive(compact=self._delta.get(key) is _REMOVED)
+        new_sigma._delta[key] = state
         return new_sigma
 
     def remove(self, target_id: TargetID, context_id: ContextID) -> InformationState:
-        new_sigma = InformationState(self._clock)
-        new_sigma._store = dict(self._store)
-        new_sigma._store.pop((target_id, context_id), None)
+        key = (target_id, context_id)
+        new_sigma = self._derive()
+        if key in new_sigma._base:
+            new_sigma._delta[key] = _REMOVED
+        else:
+            new_sigma._delta.pop(key, None)
         return new_sigma
 
     def keys(self) -> list[tuple[TargetID, ContextID]]:
-        return list(self._store.keys())
+        if not self._delta:
+            return list(self._base)
+        return list(self._materialize())
 
     def states(self) -> list[State]:
-        return list(self._store.values())
+        if not self._delta:
+            return list(self._base.values())
+        return list(self._materialize().values())
+
+    def iter_states(self) -> Iterator[State]:
+        """Iterate states in ``states()`` order without building the merged store."""
+        base, delta = self._base, self._delta
+        if not delta:
+            yield from base.values()
+            return
+        for key, state in base.items():
+            override = delta.get(key)
+            if override is None:
+                yield state
+            elif override is not _REMOVED:
+                yield override
+        for key, state in delta.items():
+            if key not in base:
+                yield state
 
     def __contains__(self, key: tuple[TargetID, ContextID]) -> bool:
-        return key in self._store
+        return self._find(key) is not None
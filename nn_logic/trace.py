@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from collections import deque
+from typing import MutableSequence, Optional, Sequence, TypeVar
 
 from nn_logic.types import (
     ContextID,
@@ -11,6 +12,23 @@ from nn_logic.types import (
 )
 
 
+_K = TypeVar("_K")
+
+
+def _push(index: dict[_K, deque[RefinementRecord]], key: _K, rec: RefinementRecord) -> None:
+    bucket = index.get(key)
+    if bucket is None:
+        index[key] = bucket = deque()
+    bucket.append(rec)
+
+
+def _pop_oldest(index: dict[_K, deque[RefinementRecord]], key: _K) -> None:
+    bucket = index[key]
+    bucket.popleft()
+    if not bucket:
+        del index[key]
+
+
 class Tracer:
     """Collects RefinementRecords for debugging and auditing.
 
@@ -20,43 +38,91 @@ class Tracer:
         tracer.record(record)
         # ... more operations ...
         tracer.dump()  # print all records
+
+    With skip_noops=True, records whose operation left ν_raw, ν and the
+    penalties unchanged (RefinementRecord.is_noop) are not kept.
     """
 
-    def __init__(self, enabled: bool = True) -> None:
+    def __init__(
+        self,
+        enabled: bool = True,
+        max_records: Optional[int] = None,
+        skip_noops: bool = False,
+    ) -> None:
         self._enabled = enabled
-        self._records: list[RefinementRecord] = []
+        self._max_records = max_records
+        self._skip_noops = skip_noops
+        # A bounded tracer keeps only the newest max_records records.
+        self._records: MutableSequence[RefinementRecord] = (
+            [] if max_records is None else deque(maxlen=max_records)
+        )
+        # Inverted indices, maintained on record(). Buckets are deques so a
+        # bounded tracer can evict its oldest record from each in O(1).
+        self._by_target: dict[TargetID, deque[RefinementRecord]] = {}
+        self._by_target_ctx: dict[tuple[TargetID, ContextID], deque[RefinementRecord]] = {}
+        self._by_operator: dict[str, deque[RefinementRecord]] = {}
 
     @property
     def enabled(self) -> bool:
         return self._enabled
 
     @property
-    def records(self) -> list[RefinementRecord]:
-        return list(self._records)
+    def max_records(self) -> Optional[int]:
+        return self._max_records
+
+    @property
+    def records(self) -> Sequence[RefinementRecord]:
+        """The live record buffer, not a copy. Treat it as read-only;
+        use snapshot() for an isolated copy."""
+        return self._records
+
+    def snapshot(self) -> tuple[RefinementRecord, ...]:
+        return tuple(self._records)
 
     def record(self, rec: RefinementRecord) -> None:
-        if self._enabled:
-            self._records.append(rec)
+        if not self._enabled or (self._skip_noops and rec.is_noop):
+            return
+        records = self._records
+        if self._max_records is not None and len(records) == self._max_records:
+            if not records:
+                return
+            self._unindex(records[0])
+        records.append(rec)
+        self._index(rec)
 
     def record_all(self, recs: list[RefinementRecord]) -> None:
         if self._enabled:
-            self._records.extend(recs)
+            for rec in recs:
+                self.record(rec)
+
+    def _index(self, rec: RefinementRecord) -> None:
+        _push(self._by_target, rec.target_id, rec)
+        _push(self._by_target_ctx, (rec.target_id, rec.context_id), rec)
+        _push(self._by_operator, rec.operator, rec)
+
+    def _unindex(self, rec: RefinementRecord) -> None:
+        # Eviction is FIFO, so the oldest record heads each of its buckets.
+        _pop_oldest(self._by_target, rec.target_id)
+        _pop_oldest(self._by_target_ctx, (rec.target_id, rec.context_id))
+        _pop_oldest(self._by_operator, rec.operator)
 
     def for_target(
         self,
         target_id: TargetID,
         context_id: Optional[ContextID] = None,
     ) -> list[RefinementRecord]:
-        result = [r for r in self._records if r.target_id == target_id]
-        if context_id is not None:
-            result = [r for r in result if r.context_id == context_id]
-        return result
+        if context_id is None:
+            return list(self._by_target.get(target_id, ()))
+        return list(self._by_target_ctx.get((target_id, context_id), ()))
 
     def for_operator(self, operator: str) -> list[RefinementRecord]:
-        return [r for r in self._records if r.operator == operator]
+        return list(self._by_operator.get(operator, ()))
 
     def clear(self) -> None:
         self._records.clear()
+        self._by_target.clear()
+        self._by_target_ctx.clear()
+        self._by_operator.clear()
 
     def dump(self) -> list[str]:
         """Return human-readable summary of all records."""
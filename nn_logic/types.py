@@ -3,18 +3,31 @@
 from __future__ import annotations
 
 import enum
+import sys
 import time
+import weakref
 from dataclasses import dataclass, field
+from functools import cached_property
+from operator import attrgetter
 from typing import (
     Any,
     Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
     NewType,
     Optional,
     Protocol,
+    Sequence,
+    TypeVar,
     Union,
+    overload,
     runtime_checkable,
 )
 
+from nn_logic._kernels import kind_totals_kernel, nu_kernel
+
 
 # ---------- ID types ----------
 
@@ -100,9 +113,190 @@ class MockClock:
         self._time = t
 
 
+# ---------- Penalty vector ----------
+
+_PENALTY_SOURCES: tuple[PenaltySource, ...] = tuple(PenaltySource)
+_PENALTY_INDEX: dict[PenaltySource, int] = {s: i for i, s in enumerate(_PENALTY_SOURCES)}
+_NO_PENALTIES: tuple[float, ...] = (0.0,) * len(_PENALTY_SOURCES)
+_ALL_PENALTIES_MASK = (1 << len(_PENALTY_SOURCES)) - 1
+
+
+class PenaltyVec(Mapping[PenaltySource, float]):
+    """Immutable PenaltySource -> float mapping packed as a bitmask plus a
+    fixed-slot value tuple indexed by source ordinal.
+
+    Membership is a bit test and updates return a new vector, so operators
+    never need a defensive dict copy. Iterates in PenaltySource order and
+    compares equal to a dict with the same items.
+    """
+
+    __slots__ = ("mask", "vals")
+
+    mask: int
+    vals: tuple[float, ...]
+
+    def __init__(self, items: Union[Mapping[PenaltySource, float], Iterable[tuple[PenaltySource, float]]] = ()) -> None:
+        pairs = items.items() if isinstance(items, Mapping) else items
+        vals = list(_NO_PENALTIES)
+        mask = 0
+        for source, value in pairs:
+            i = _PENALTY_INDEX[source]
+            vals[i] = value
+            mask |= 1 << i
+        object.__setattr__(self, "mask", mask)
+        object.__setattr__(self, "vals", tuple(vals))
+
+    @staticmethod
+    def _make(mask: int, vals: tuple[float, ...]) -> PenaltyVec:
+        pv = object.__new__(PenaltyVec)
+        object.__setattr__(pv, "mask", mask)
+        object.__setattr__(pv, "vals", vals)
+        return pv
+
+    @staticmethod
+    def of(penalties: Mapping[PenaltySource, float]) -> PenaltyVec:
+        """Return penalties as a PenaltyVec, converting only if needed."""
+        if isinstance(penalties, PenaltyVec):
+            return penalties
+        return PenaltyVec(penalties)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("PenaltyVec is immutable")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (PenaltyVec, (dict(self.items()),))
+
+    def __getitem__(self, source: PenaltySource) -> float:
+        i = _PENALTY_INDEX[source]
+        if self.mask >> i & 1:
+            return self.vals[i]
+        raise KeyError(source)
+
+    def __contains__(self, source: object) -> bool:
+        i = _PENALTY_INDEX.get(source)  # type: ignore[call-overload]
+        return i is not None and bool(self.mask >> i & 1)
+
+    def __iter__(self) -> Iterator[PenaltySource]:
+        mask = self.mask
+        return (s for i, s in enumerate(_PENALTY_SOURCES) if mask >> i & 1)
+
+    def __len__(self) -> int:
+        return bin(self.mask).count("1")
+
+    def __bool__(self) -> bool:
+        return self.mask != 0
+
+    def __hash__(self) -> int:
+        return hash((self.mask, self.vals))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PenaltyVec):
+            return self.mask == other.mask and self.vals == other.vals
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PenaltyVec({dict(self.items())!r})"
+
+    def values(self) -> tuple[float, ...]:  # type: ignore[override]
+        mask = self.mask
+        if mask == _ALL_PENALTIES_MASK:
+            return self.vals
+        if not mask:
+            return ()
+        return tuple([v for i, v in enumerate(self.vals) if mask >> i & 1])
+
+    def set(self, source: PenaltySource, value: float) -> PenaltyVec:
+        i = _PENALTY_INDEX[source]
+        vals = self.vals
+        return PenaltyVec._make(self.mask | 1 << i, vals[:i] + (value,) + vals[i + 1:])
+
+    def delete(self, source: PenaltySource) -> PenaltyVec:
+        i = _PENALTY_INDEX[source]
+        if not self.mask >> i & 1:
+            return self
+        vals = self.vals
+        return PenaltyVec._make(self.mask & ~(1 << i), vals[:i] + (0.0,) + vals[i + 1:])
+
+    def decay_all(
+        self,
+        factor: float,
+        cleanup_threshold: float,
+        skip: Optional[PenaltySource] = None,
+    ) -> PenaltyVec:
+        """Scale every present penalty (except skip) by factor, dropping
+        those that fall below cleanup_threshold."""
+        mask = self.mask
+        skip_bit = 1 << _PENALTY_INDEX[skip] if skip is not None else 0
+        vals = list(self.vals)
+        for i in range(len(vals)):
+            bit = 1 << i
+            if mask & bit and not skip_bit & bit:
+                v = vals[i] * factor
+                if v < cleanup_threshold:
+                    mask &= ~bit
+                    v = 0.0
+                vals[i] = v
+        return PenaltyVec._make(mask, tuple(vals))
+
+
+EMPTY_PENALTIES = PenaltyVec()
+
+
 # ---------- Core dataclasses ----------
 
-@dataclass(frozen=True)
+# Hot value types are slotted where the interpreter supports it (3.10+).
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_K = TypeVar("_K")
+_V = TypeVar("_V")
+
+
+class _FrozenDict(Mapping[_K, _V]):
+    """Read-only mapping over a private dict.
+
+    Unlike MappingProxyType it pickles (and so deep-copies) by rebuilding
+    from a plain dict.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Optional[Mapping[_K, _V]] = None) -> None:
+        self._data: dict[_K, _V] = dict(data) if data else {}
+
+    def __getitem__(self, key: _K) -> _V:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[_K]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: _K, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_FrozenDict, (self._data,))
+
+    def __repr__(self) -> str:
+        return f"_FrozenDict({self._data!r})"
+
+
+# Shared read-only empty mapping for mapping-valued defaults, so instances
+# that never set one don't each allocate an empty dict.
+_EMPTY_MAPPING: Mapping[Any, Any] = _FrozenDict()
+
+
+def _empty_mapping() -> Mapping[Any, Any]:
+    return _EMPTY_MAPPING
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Evidence:
     id: EvidenceID
     kind: EvidenceKind
@@ -111,31 +305,183 @@ class Evidence:
     src: AgentID
     time: float
     trust: float = 1.0
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=_empty_mapping)
+    # abs(valence) * trust, materialized once; every aggregate reads it.
+    _weight0: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_weight0", abs(self.valence) * self.trust)
 
     def weight(self) -> float:
-        return abs(self.valence) * self.trust
+        return self._weight0
+
+
+class EvidenceColumns(NamedTuple):
+    """Structure-of-arrays view of an EvidenceSet, aligned with its items."""
+    valence: tuple[float, ...]
+    trust: tuple[float, ...]
+    weight: tuple[float, ...]
+    time: tuple[float, ...]
+    kind: tuple[EvidenceKind, ...]
+    src: tuple[AgentID, ...]
+
+    def append(self, e: Evidence) -> EvidenceColumns:
+        return EvidenceColumns(
+            valence=self.valence + (e.valence,),
+            trust=self.trust + (e.trust,),
+            weight=self.weight + (e._weight0,),
+            time=self.time + (e.time,),
+            kind=self.kind + (e.kind,),
+            src=self.src + (e.src,),
+        )
+
+    def extend(self, es: tuple[Evidence, ...]) -> EvidenceColumns:
+        return EvidenceColumns(
+            valence=self.valence + tuple(map(_get_valence, es)),
+            trust=self.trust + tuple(map(_get_trust, es)),
+            weight=self.weight + tuple(map(_get_weight, es)),
+            time=self.time + tuple(map(_get_time, es)),
+            kind=self.kind + tuple(map(_get_kind, es)),
+            src=self.src + tuple(map(_get_src, es)),
+        )
+
+    def concat(self, other: EvidenceColumns) -> EvidenceColumns:
+        """Columns of self's items followed by other's (no per-item reads)."""
+        return EvidenceColumns._make(a + b for a, b in zip(self, other))
+
+
+_get_valence = attrgetter("valence")
+_get_trust = attrgetter("trust")
+_get_weight = attrgetter("_weight0")
+_get_time = attrgetter("time")
+_get_kind = attrgetter("kind")
+_get_src = attrgetter("src")
+
+
+_UNION_MEMO_SIZE = 16  # per-set bound on memoized union() results
 
 
 @dataclass(frozen=True)
 class EvidenceSet:
     items: tuple[Evidence, ...] = ()
 
+    @cached_property
+    def columns(self) -> EvidenceColumns:
+        """Column view of the numeric fields, built once on first use."""
+        items = self.items
+        return EvidenceColumns(
+            valence=tuple(map(_get_valence, items)),
+            trust=tuple(map(_get_trust, items)),
+            weight=tuple(map(_get_weight, items)),
+            time=tuple(map(_get_time, items)),
+            kind=tuple(map(_get_kind, items)),
+            src=tuple(map(_get_src, items)),
+        )
+
+    @cached_property
+    def kind_totals(self) -> tuple[dict[EvidenceKind, float], dict[EvidenceKind, int]]:
+        """Per-kind sum of |valence| * trust and per-kind count, in one pass."""
+        cols = self.columns
+        return kind_totals_kernel(cols.kind, cols.weight, EvidenceKind)
+
+    @cached_property
+    def kind_rows(self) -> dict[EvidenceKind, tuple[int, ...]]:
+        """Row indices of the items of each kind, in order (one bucketing pass)."""
+        rows: dict[EvidenceKind, list[int]] = {k: [] for k in EvidenceKind}
+        appenders = {k: bucket.append for k, bucket in rows.items()}
+        for i, k in enumerate(self.columns.kind):
+            appenders[k](i)
+        return {k: tuple(bucket) for k, bucket in rows.items()}
+
+    @cached_property
+    def memo(self) -> dict[Any, Any]:
+        """Per-set cache for pure functions of the (immutable) items."""
+        return {}
+
+    @cached_property
+    def has_mass(self) -> bool:
+        """False when every item has zero weight, so all aggregates are zero."""
+        return any(self.columns.weight)
+
+    @property
+    def definitional_count(self) -> int:
+        return self.kind_totals[1][EvidenceKind.DEFINITIONAL]
+
+    @cached_property
+    def sources_by_id(self) -> dict[EvidenceID, tuple[AgentID, ...]]:
+        """Index of evidence id -> sources that contributed it, in order."""
+        index: dict[EvidenceID, tuple[AgentID, ...]] = {}
+        for e in self.items:
+            index[e.id] = index.get(e.id, ()) + (e.src,)
+        return index
+
+    @staticmethod
+    def with_columns(
+        items: tuple[Evidence, ...], columns: EvidenceColumns
+    ) -> EvidenceSet:
+        """Build a set whose column view is already known (must match items)."""
+        es = EvidenceSet(items=items)
+        es.__dict__["columns"] = columns
+        return es
+
     @staticmethod
     def empty() -> EvidenceSet:
-        return EvidenceSet()
+        return _EMPTY_EVIDENCE_SET
 
     def add(self, e: Evidence) -> EvidenceSet:
-        return EvidenceSet(items=self.items + (e,))
+        items = self.items + (e,)
+        # Extend derived views that were already built rather than
+        # rebuilding them from scratch on the new set.
+        cols = self.__dict__.get("columns")
+        if cols is None:
+            result = EvidenceSet(items=items)
+        else:
+            result = EvidenceSet.with_columns(items, cols.append(e))
+        index = self.__dict__.get("sources_by_id")
+        if index is not None:
+            index = dict(index)
+            index[e.id] = index.get(e.id, ()) + (e.src,)
+            result.__dict__["sources_by_id"] = index
+        return result
 
     def union(self, other: EvidenceSet) -> EvidenceSet:
-        seen: set[EvidenceID] = set()
-        merged: list[Evidence] = []
-        for item in self.items + other.items:
-            if item.id not in seen:
-                seen.add(item.id)
-                merged.append(item)
-        return EvidenceSet(items=tuple(merged))
+        """Items of self then other, first occurrence of each id kept."""
+        # When one side has distinct ids and already covers the other, the
+        # union is that side itself (with its cached views).
+        if self.items:
+            index = self.sources_by_id
+            if len(index) == len(self.items) and all(e.id in index for e in other.items):
+                return self
+        elif len(other.sources_by_id) == len(other.items):
+            return other
+        # Memoized per left operand, keyed by the right operand's identity;
+        # the weakref guards against a recycled id().
+        cache: dict[int, tuple[weakref.ref[EvidenceSet], EvidenceSet]] = (
+            self.memo.setdefault("union", {})
+        )
+        hit = cache.get(id(other))
+        if hit is not None and hit[0]() is other:
+            return hit[1]
+        result = EvidenceSet.union_many((self, other))
+        if len(cache) >= _UNION_MEMO_SIZE:
+            cache.clear()
+        cache[id(other)] = (weakref.ref(other), result)
+        return result
+
+    @staticmethod
+    def union_many(sets: Iterable[EvidenceSet]) -> EvidenceSet:
+        """Union of all sets in one pass; same result as folding union()."""
+        merged: dict[EvidenceID, Evidence] = {}
+        setdefault = merged.setdefault
+        for es in sets:
+            for item in es.items:
+                setdefault(item.id, item)
+        return EvidenceSet(items=tuple(merged.values()))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Cached views and the union memo (which holds weakrefs) are
+        # rebuilt on demand; only the items travel.
+        return (EvidenceSet, (self.items,))
 
     def __len__(self) -> int:
         return len(self.items)
@@ -144,77 +490,211 @@ class EvidenceSet:
         return iter(self.items)
 
 
-@dataclass(frozen=True)
+_EMPTY_EVIDENCE_SET = EvidenceSet()
+
+
+class History(Sequence[str]):
+    """Persistent, append-only operator history.
+
+    Each append links a new node to its parent in O(1) instead of copying
+    the whole tuple, so long refinement sequences stay linear. Reads behave
+    like a tuple (and compare equal to one); the tuple is materialized at
+    most once per node.
+    """
+
+    __slots__ = ("_parent", "_op", "_len", "_items")
+
+    def __init__(self, ops: Iterable[str] = ()) -> None:
+        self._parent: Optional[History] = None
+        self._op = ""
+        self._items: Optional[tuple[str, ...]] = tuple(ops)
+        self._len = len(self._items)
+
+    def append(self, op: str) -> History:
+        h = History.__new__(History)
+        h._parent = self
+        h._op = op
+        h._len = self._len + 1
+        h._items = None
+        return h
+
+    def _tuple(self) -> tuple[str, ...]:
+        if self._items is None:
+            ops: list[str] = []
+            node: History = self
+            while node._items is None:
+                ops.append(node._op)
+                node = node._parent  # type: ignore[assignment]
+            ops.reverse()
+            self._items = node._items + tuple(ops)
+            self._parent = None  # the materialized tuple now covers the chain
+        return self._items
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tuple())
+
+    @overload
+    def __getitem__(self, i: int) -> str: ...
+    @overload
+    def __getitem__(self, i: slice) -> tuple[str, ...]: ...
+    def __getitem__(self, i: Union[int, slice]) -> Union[str, tuple[str, ...]]:
+        return self._tuple()[i]
+
+    def __contains__(self, op: object) -> bool:
+        node: Optional[History] = self
+        while node is not None and node._items is None:
+            if node._op == op:
+                return True
+            node = node._parent
+        return node is not None and op in node._items  # type: ignore[operator]
+
+    def __add__(self, other: Iterable[str]) -> History:
+        h = self
+        for op in other:
+            h = h.append(op)
+        return h
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, History):
+            return self._len == other._len and self._tuple() == other._tuple()
+        if isinstance(other, tuple):
+            return self._tuple() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._tuple())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Flat, so pickling and copying don't recurse once per node
+        return (History, (self._tuple(),))
+
+    def __repr__(self) -> str:
+        return f"History({self._tuple()!r})"
+
+
+EMPTY_HISTORY = History()
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Metadata:
     creation: float = 0.0
     last_modified: float = 0.0
-    history: tuple[str, ...] = ()
+    history: History = EMPTY_HISTORY  # plain tuples are accepted and converted
     crossings: tuple[str, ...] = ()
     conflict_last_applied: Optional[float] = None
     penalty_clear_start: Optional[float] = None
-    tags: dict[str, Any] = field(default_factory=dict)
+    tags: Mapping[str, Any] = field(default_factory=_empty_mapping)
 
-    def with_update(self, **kwargs: Any) -> Metadata:
-        d = {
-            "creation": self.creation,
-            "last_modified": self.last_modified,
-            "history": self.history,
-            "crossings": self.crossings,
-            "conflict_last_applied": self.conflict_last_applied,
-            "penalty_clear_start": self.penalty_clear_start,
-            "tags": dict(self.tags),
-        }
-        d.update(kwargs)
-        return Metadata(**d)
+    def __post_init__(self) -> None:
+        if not isinstance(self.history, History):
+            object.__setattr__(self, "history", History(self.history))
 
+    def append_history(self, op: str, **kwargs: Any) -> Metadata:
+        """with_update(**kwargs) that also records op in O(1)."""
+        return self.with_update(history=self.history.append(op), **kwargs)
 
-@dataclass(frozen=True)
-class State:
+    def with_update(self, **kwargs: Any) -> Metadata:
+        # Unchanged fields are shared, tags included: metadata is frozen and
+        # nothing mutates tags after construction.
+        pop = kwargs.pop
+        new = Metadata(
+            pop("creation", self.creation),
+            pop("last_modified", self.last_modified),
+            pop("history", self.history),
+            pop("crossings", self.crossings),
+            pop("conflict_last_applied", self.conflict_last_applied),
+            pop("penalty_clear_start", self.penalty_clear_start),
+            pop("tags", self.tags),
+        )
+        if kwargs:
+            raise TypeError(f"Metadata has no fields {sorted(kwargs)}")
+        return new
+
+
+class _NuCache:
+    """Slot for State's derived ν, kept outside the dataclass fields so it
+    stays out of fields(), asdict(), equality and pickles."""
+
+    __slots__ = ("_nu",)
+
+    _nu: float
+
+
+@dataclass(frozen=True, **_SLOTS)
+class State(_NuCache):
     """Per-target, per-context state."""
     target_id: TargetID
     context_id: ContextID
     truth_status: Optional[Any] = None  # pluggable truth semantics
     nu_raw: float = 1.0
-    nu_penalties: dict[PenaltySource, float] = field(default_factory=dict)
+    nu_penalties: Mapping[PenaltySource, float] = EMPTY_PENALTIES
     evidence: EvidenceSet = field(default_factory=EvidenceSet.empty)
     metadata: Metadata = field(default_factory=Metadata)
     constraints: tuple[str, ...] = ()  # definitional constraints for NegDefine
 
+    def __post_init__(self) -> None:
+        # Penalties are held as an immutable PenaltyVec, so a caller's dict
+        # can't change under the cached ν (or be shared by replace()).
+        if not isinstance(self.nu_penalties, PenaltyVec):
+            object.__setattr__(self, "nu_penalties", PenaltyVec(self.nu_penalties))
+
     @property
     def nu(self) -> float:
-        from nn_logic.helpers import compute_nu
-        return compute_nu(self.nu_raw, self.nu_penalties, PenaltyMode.MAX)
+        """ν under PenaltyMode.MAX, derived on first use and cached."""
+        try:
+            return self._nu
+        except AttributeError:
+            nu = nu_kernel(self.nu_raw, self.nu_penalties)
+            object.__setattr__(self, "_nu", nu)
+            return nu
 
     def nu_with_mode(self, mode: PenaltyMode) -> float:
-        from nn_logic.helpers import compute_nu
-        return compute_nu(self.nu_raw, self.nu_penalties, mode)
+        return nu_kernel(self.nu_raw, self.nu_penalties, mode != PenaltyMode.MAX)
 
     def replace(self, **kwargs: Any) -> State:
-        d: dict[str, Any] = {
-            "target_id": self.target_id,
-            "context_id": self.context_id,
-            "truth_status": self.truth_status,
-            "nu_raw": self.nu_raw,
-            "nu_penalties": dict(self.nu_penalties),
-            "evidence": self.evidence,
-            "metadata": self.metadata,
-            "constraints": self.constraints,
-        }
-        d.update(kwargs)
-        return State(**d)
-
-
-@dataclass(frozen=True)
+        # Spelled out rather than dataclasses.replace, which walks the field
+        # table on every call; this runs once per operator application.
+        # nu_penalties is always an immutable PenaltyVec, so sharing it is safe.
+        pop = kwargs.pop
+        new = State(
+            pop("target_id", self.target_id),
+            pop("context_id", self.context_id),
+            pop("truth_status", self.truth_status),
+            pop("nu_raw", self.nu_raw),
+            pop("nu_penalties", self.nu_penalties),
+            pop("evidence", self.evidence),
+            pop("metadata", self.metadata),
+            pop("constraints", self.constraints),
+        )
+        if kwargs:
+            raise TypeError(f"State has no fields {sorted(kwargs)}")
+        return new
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Context:
     id: ContextID
-    i_side: frozenset[AgentID] = field(default_factory=frozenset)
-    not_i_side: frozenset[AgentID] = field(default_factory=frozenset)
+    i_side: frozenset[AgentID] = frozenset()
+    not_i_side: frozenset[AgentID] = frozenset()
     time_start: float = 0.0
     time_end: float = float("inf")
-    scope: frozenset[TargetID] = field(default_factory=frozenset)
-    roles: dict[AgentID, Role] = field(default_factory=dict)
+    scope: frozenset[TargetID] = frozenset()
+    roles: Mapping[AgentID, Role] = field(default_factory=_empty_mapping)
     # policy is stored separately, referenced by context_id
 
+    def __post_init__(self) -> None:
+        # Read-only view over a private copy, so contexts can share their
+        # roles without defensive copies.
+        if not isinstance(self.roles, _FrozenDict):
+            object.__setattr__(self, "roles", _FrozenDict(self.roles))
+
+    def role_of(self, agent: AgentID) -> Role:
+        """The agent's role here; agents not listed in roles are UNKNOWN."""
+        return self.roles.get(agent, Role.UNKNOWN)
+
 
 # ---------- Semantic definedness provider protocol ----------
 
@@ -228,7 +708,7 @@ class SemanticDefinednessProvider(Protocol):
 
 # ---------- Refinement record (for trace mode) ----------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class RefinementRecord:
     target_id: TargetID
     context_id: ContextID
@@ -237,15 +717,24 @@ class RefinementRecord:
     nu_after: float
     nu_raw_before: float
     nu_raw_after: float
-    penalties_before: dict[PenaltySource, float]
-    penalties_after: dict[PenaltySource, float]
+    penalties_before: Mapping[PenaltySource, float]
+    penalties_after: Mapping[PenaltySource, float]
     timestamp: float
-    details: dict[str, Any] = field(default_factory=dict)
+    details: Mapping[str, Any] = field(default_factory=_empty_mapping)
+
+    @property
+    def is_noop(self) -> bool:
+        """True if the operation left ν_raw, ν and the penalties unchanged."""
+        return (
+            self.nu_raw_before == self.nu_raw_after
+            and self.nu_before == self.nu_after
+            and self.penalties_before == self.penalties_after
+        )
 
 
 # ---------- Aggregate result ----------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class AggregateResult:
     pos_mass: float
     neg_mass: float
@@ -5,18 +5,40 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
-from nn_logic.types import RefinementRecord, TargetID, ContextID
+from nn_logic.types import _SLOTS, RefinementRecord, TargetID, ContextID
 
 
 def rv(records: list[RefinementRecord]) -> list[float]:
     """Compute per-step refinement velocities (Δν per step)."""
+    nus = [r.nu_after for r in records]
+    return [cur - prev for prev, cur in zip(nus, nus[1:])]
+
+
+def rv_summary(
+    records: list[RefinementRecord],
+    threshold: float = 0.001,
+) -> tuple[list[float], float, float]:
+    """Velocities, their mean and the stuck rate in a single pass.
+
+    Equivalent to (rv(records), rv_mean(records),
+    rv_stuck_rate(records, threshold)).
+    """
     if len(records) < 2:
-        return []
+        return [], 0.0, 0.0
     velocities: list[float] = []
-    for i in range(1, len(records)):
-        delta_nu = records[i].nu_after - records[i - 1].nu_after
-        velocities.append(delta_nu)
-    return velocities
+    total = 0.0
+    stuck = 0
+    prev = records[0].nu_after
+    for rec in records[1:]:
+        cur = rec.nu_after
+        v = cur - prev
+        velocities.append(v)
+        total += v
+        if abs(v) < threshold:
+            stuck += 1
+        prev = cur
+    n = len(velocities)
+    return velocities, total / n, stuck / n
 
 
 def rv_from_records(records: list[RefinementRecord]) -> list[float]:
@@ -31,10 +53,7 @@ def rv_from_records(records: list[RefinementRecord]) -> list[float]:
 
 def rv_mean(records: list[RefinementRecord]) -> float:
     """Mean refinement velocity."""
-    velocities = rv(records)
-    if not velocities:
-        return 0.0
-    return sum(velocities) / len(velocities)
+    return rv_summary(records)[1]
 
 
 def rv_stuck_rate(
@@ -42,14 +61,10 @@ def rv_stuck_rate(
     threshold: float = 0.001,
 ) -> float:
     """Fraction of steps with velocity below threshold (stuck rate)."""
-    velocities = rv(records)
-    if not velocities:
-        return 0.0
-    stuck = sum(1 for v in velocities if abs(v) < threshold)
-    return stuck / len(velocities)
+    return rv_summary(records, threshold)[2]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class SystemHealth:
     """Overall system health metrics."""
     total_targets: int
@@ -2,7 +2,114 @@
 
 from __future__ import annotations
 
+import string
 from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Callable, Mapping, Optional, cast
+
+_FORMATTER = string.Formatter()
+
+
+class PromptTemplate:
+    """A str.format template parsed once.
+
+    render() produces the same text as template.format(**fields) without
+    re-parsing the template on every call. Templates using features beyond
+    plain named fields with format specs (positional fields, attribute or
+    index lookups, conversions, nested specs) fall back to str.format_map.
+
+    bind() fills in fields that stay fixed for a while (e.g. the task
+    specification for one run), so later renders only format the rest.
+
+    The parsed parts are compiled into a single join expression
+    (_compile_parts), so a render is one call rather than a loop over the
+    parts.
+    """
+
+    __slots__ = ("template", "_parts", "_bound", "_render")
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        parts: list[tuple[str, Optional[str], str]] = []
+        supported = True
+        for literal, name, spec, conversion in _FORMATTER.parse(template):
+            spec = spec or ""
+            if name is None:
+                parts.append((literal, None, ""))
+            elif name.isidentifier() and not conversion and "{" not in spec:
+                parts.append((literal, name, spec))
+            else:
+                supported = False
+                break
+        self._parts: Optional[tuple[tuple[str, Optional[str], str], ...]] = None
+        self._render: Optional[Callable[[Mapping[str, Any]], str]] = None
+        self._bound: Mapping[str, Any] = {}
+        if supported:
+            self._parts = tuple(parts)
+            self._render = _compile_parts(self._parts)
+
+    def bind(self, **fields: Any) -> PromptTemplate:
+        """A copy of this template with the given fields already rendered."""
+        bound = PromptTemplate.__new__(PromptTemplate)
+        bound.template = self.template
+        if self._parts is None:
+            bound._parts = None
+            bound._bound = {**self._bound, **fields}
+            bound._render = None
+            return bound
+        parts: list[tuple[str, Optional[str], str]] = []
+        pending = ""
+        for literal, name, spec in self._parts:
+            pending += literal
+            if name is None:
+                continue
+            if name in fields:
+                pending += format(fields[name], spec)
+            else:
+                parts.append((pending, name, spec))
+                pending = ""
+        if pending:
+            parts.append((pending, None, ""))
+        bound._parts = tuple(parts)
+        bound._bound = self._bound
+        bound._render = _compile_parts(bound._parts)
+        return bound
+
+    def render(self, **fields: Any) -> str:
+        return self.render_map(fields)
+
+    def render_map(self, fields: Mapping[str, Any]) -> str:
+        render = self._render
+        if render is None:
+            if self._bound:
+                fields = {**self._bound, **fields}
+            return self.template.format_map(fields)
+        return render(fields)
+
+
+def _compile_parts(
+    parts: tuple[tuple[str, Optional[str], str], ...]
+) -> Callable[[Mapping[str, Any]], str]:
+    """Generate a renderer for parsed template parts.
+
+    Literals, field names and specs enter the generated source only as
+    repr() constants, so the template text is never executed.
+    """
+    terms: list[str] = []
+    for literal, name, spec in parts:
+        if literal:
+            terms.append(repr(literal))
+        if name is not None:
+            terms.append(f"format(fields[{name!r}], {spec!r})")
+    source = (
+        "def render(fields, format=format):\n"
+        f"    return ''.join(({', '.join(terms)},))\n"
+        if terms else
+        "def render(fields):\n    return ''\n"
+    )
+    namespace: dict[str, Any] = {}
+    exec(compile(source, "<PromptTemplate>", "exec"), namespace)
+    return cast(Callable[[Mapping[str, Any]], str], namespace["render"])
 
 
 @dataclass(frozen=True)
@@ -29,6 +136,25 @@ class LoopConfig:
     w_ep: float = 0.35
     w_proc: float = 0.25
 
+    # Convergence history: keep only the newest N snapshots (None keeps all).
+    # Strategies then see, and RunResult.snapshots holds, just that window.
+    history_window: Optional[int] = None
+
+    # Keep every IterationRecord in RunSummary.iteration_records. Turn off
+    # for long batch runs that stream records through RWTLoop's
+    # on_iteration callback instead.
+    keep_iteration_records: bool = True
+
+    # Append each IterationRecord as a JSON line to this file (RecordLog)
+    records_path: Optional[str] = None
+
+    # Self-consistency: draw this many candidates per generation and keep
+    # the most common one (providers with generate_batch get one call)
+    samples_per_iteration: int = 1
+
+    # Evaluation: concurrent runs in EvaluationHarness.run_comparison
+    max_workers: int = 1  # 1 runs sequentially
+
     # Calibration
     empty_flags_skepticism_penalty: float = 0.1
     confidence_count_weight: float = 0.6  # weight issue counts vs stated confidence
@@ -89,3 +215,16 @@ Focus especially on: {refinement_priority}""")
 {task_specification}
 
 Produce a thorough, well-structured response.""")
+
+    # Parsed forms of the templates above, built on first use.
+    @cached_property
+    def assessment_prompt(self) -> PromptTemplate:
+        return PromptTemplate(self.assessment_prompt_template)
+
+    @cached_property
+    def refinement_prompt(self) -> PromptTemplate:
+        return PromptTemplate(self.refinement_prompt_template)
+
+    @cached_property
+    def initial_prompt(self) -> PromptTemplate:
+        return PromptTemplate(self.initial_prompt_template)
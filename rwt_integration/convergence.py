@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
-from typing import Any, Optional, Protocol, runtime_checkable
+from functools import lru_cache
+from typing import Any, Optional, Protocol, Sequence, runtime_checkable
 
+from nn_logic.types import _SLOTS
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class ConvergenceResult:
     converged: bool
     reason: str
@@ -15,7 +19,7 @@ class ConvergenceResult:
     diagnostics: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class IterationSnapshot:
     """Minimal view of one iteration, used by convergence strategies."""
 
@@ -27,23 +31,116 @@ class IterationSnapshot:
     def_sem: float = 0.0
     def_ep: float = 0.0
     def_proc: float = 0.0
+    # Fingerprint of output, computed once; equal outputs hash equal.
+    output_hash: int = field(init=False, repr=False, compare=False, default=0)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "output_hash", hash(self.output))
 
 
 @runtime_checkable
 class ConvergenceStrategy(Protocol):
-    def should_stop(self, history: list[IterationSnapshot]) -> ConvergenceResult: ...
+    def should_stop(self, history: Sequence[IterationSnapshot]) -> ConvergenceResult: ...
 
     @property
     def name(self) -> str: ...
 
 
-def _output_similarity(a: str, b: str) -> float:
-    """Compute similarity ratio between two strings."""
+def _output_similarity(a: str, b: str, cutoff: float = 0.0) -> float:
+    """Compute similarity ratio between two strings.
+
+    With a cutoff, a pair that provably scores below it returns an upper
+    bound (still below the cutoff) instead of the exact ratio.
+    """
     if a == b:
         return 1.0
     if not a or not b:
         return 0.0
-    return SequenceMatcher(None, a, b).ratio()
+    # SequenceMatcher.real_quick_ratio(), from the lengths alone
+    la, lb = len(a), len(b)
+    bound = 2.0 * min(la, lb) / (la + lb)
+    if bound < cutoff:
+        return bound
+    return _sequence_ratio(a, b, cutoff)
+
+
+def _snapshot_similarity(
+    a: IterationSnapshot, b: IterationSnapshot, cutoff: float = 0.0
+) -> float:
+    """_output_similarity for two snapshots, prefiltered by fingerprint."""
+    if a.output_hash == b.output_hash and a.output == b.output:
+        return 1.0
+    return _output_similarity(a.output, b.output, cutoff)
+
+
+_matchers = threading.local()
+
+
+def _matcher_for(b: str) -> SequenceMatcher[str]:
+    """This thread's SequenceMatcher, with b as its second sequence.
+
+    SequenceMatcher indexes its second sequence (b2j) in set_seq2 and
+    skips the rebuild when handed the same object again, so consecutive
+    comparisons against the same b reuse the index.
+    """
+    matcher = getattr(_matchers, "matcher", None)
+    if matcher is None:
+        matcher = _matchers.matcher = SequenceMatcher(None)
+    matcher.set_seq2(b)
+    return matcher
+
+
+@lru_cache(maxsize=1024)
+def _sequence_ratio(a: str, b: str, cutoff: float = 0.0) -> float:
+    # Every should_stop call rescans the same adjacent output pairs, and the
+    # Diff and Hybrid strategies compare the same pairs, so each pair's
+    # quadratic ratio() is computed once.
+    matcher = _matcher_for(b)
+    matcher.set_seq1(a)
+    if cutoff:
+        bound = matcher.quick_ratio()
+        if bound < cutoff:
+            return bound
+    return matcher.ratio()
+
+
+def _deltas(nus: list[float]) -> list[float]:
+    """Successive differences nus[i] - nus[i-1], computed once per check."""
+    return [b - a for a, b in zip(nus, nus[1:])]
+
+
+def _nu_scan(
+    nus: list[float],
+    nu_threshold: float,
+    stable_epsilon: float,
+    stable_count: int,
+) -> tuple[int, int, bool]:
+    """NuConvergence's trajectory statistics in one backward pass.
+
+    Returns (consecutive_stable_below, oscillation_count, tail_flat):
+    the run of newest steps that stay at or below nu_threshold with
+    |Δν| < stable_epsilon, the number of direction changes, and whether
+    the newest stable_count steps all have |Δν| < stable_epsilon.
+    """
+    stable_below = 0
+    oscillations = 0
+    tail_flat = len(nus) >= stable_count + 1
+    below_open = True
+    later = 0.0  # Δν of the step after this one (none yet)
+    for k, i in enumerate(range(len(nus) - 1, 0, -1)):
+        d = nus[i] - nus[i - 1]
+        small = abs(d) < stable_epsilon
+        if below_open:
+            if nus[i] <= nu_threshold and small:
+                stable_below += 1
+            else:
+                below_open = False
+        if k < stable_count and not small:
+            tail_flat = False
+        if later * d < 0:
+            oscillations += 1
+        later = d
+    return stable_below, oscillations, tail_flat
 
 
 # ---------- DiffConvergence ----------
@@ -63,7 +160,7 @@ class DiffConvergence:
     def name(self) -> str:
         return "diff"
 
-    def should_stop(self, history: list[IterationSnapshot]) -> ConvergenceResult:
+    def should_stop(self, history: Sequence[IterationSnapshot]) -> ConvergenceResult:
         if len(history) < 2:
             return ConvergenceResult(
                 converged=False, reason="insufficient_history", confidence=0.0
@@ -72,15 +169,17 @@ class DiffConvergence:
         # Check last N pairs for stability
         consecutive_stable = 0
         for i in range(len(history) - 1, 0, -1):
-            sim = _output_similarity(history[i].output, history[i - 1].output)
+            sim = _snapshot_similarity(
+                history[i], history[i - 1], self.similarity_threshold
+            )
             if sim >= self.similarity_threshold:
                 consecutive_stable += 1
             else:
                 break
 
         if consecutive_stable >= self.stable_count:
-            last_sim = _output_similarity(
-                history[-1].output, history[-2].output
+            last_sim = _snapshot_similarity(
+                history[-1], history[-2], self.similarity_threshold
             )
             return ConvergenceResult(
                 converged=True,
@@ -126,14 +225,19 @@ class NuConvergence:
     def name(self) -> str:
         return "nu"
 
-    def should_stop(self, history: list[IterationSnapshot]) -> ConvergenceResult:
+    def should_stop(self, history: Sequence[IterationSnapshot]) -> ConvergenceResult:
         if len(history) < 2:
             return ConvergenceResult(
                 converged=False, reason="insufficient_history", confidence=0.0
             )
 
         current = history[-1]
-        nus = [s.nu for s in history]
+        consecutive_stable_below, oscillation_count, tail_flat = _nu_scan(
+            [s.nu for s in history],
+            self.nu_threshold,
+            self.stable_epsilon,
+            self.stable_count,
+        )
 
         # Check if licensed
         is_licensed = (
@@ -141,14 +245,6 @@ class NuConvergence:
             and current.nu <= self.nu_threshold
         )
 
-        # Check ν stability (below threshold)
-        consecutive_stable_below = 0
-        for i in range(len(nus) - 1, 0, -1):
-            if nus[i] <= self.nu_threshold and abs(nus[i] - nus[i - 1]) < self.stable_epsilon:
-                consecutive_stable_below += 1
-            else:
-                break
-
         if is_licensed and consecutive_stable_below >= self.stable_count:
             return ConvergenceResult(
                 converged=True,
@@ -161,21 +257,8 @@ class NuConvergence:
                 },
             )
 
-        # Detect oscillation
-        oscillation_count = 0
-        for i in range(2, len(nus)):
-            if (nus[i] - nus[i - 1]) * (nus[i - 1] - nus[i - 2]) < 0:
-                oscillation_count += 1
-
-        # Detect stalling above threshold
-        is_stalled = False
-        if len(nus) >= self.stable_count + 1:
-            recent_deltas = [
-                abs(nus[i] - nus[i - 1])
-                for i in range(len(nus) - self.stable_count, len(nus))
-            ]
-            if all(d < self.stable_epsilon for d in recent_deltas) and current.nu > self.nu_threshold:
-                is_stalled = True
+        # Stalling: flat tail while still above threshold
+        is_stalled = tail_flat and current.nu > self.nu_threshold
 
         # Build diagnostic suggestion
         suggestion = ""
@@ -226,7 +309,7 @@ class HybridConvergence:
     def name(self) -> str:
         return "hybrid"
 
-    def should_stop(self, history: list[IterationSnapshot]) -> ConvergenceResult:
+    def should_stop(self, history: Sequence[IterationSnapshot]) -> ConvergenceResult:
         if len(history) < 2:
             return ConvergenceResult(
                 converged=False, reason="insufficient_history", confidence=0.0
@@ -234,16 +317,34 @@ class HybridConvergence:
 
         current = history[-1]
         nus = [s.nu for s in history]
-
-        # --- Output stability check ---
+        deltas = _deltas(nus)
+
+        # --- One backward walk: output stability, ν stability, oscillation ---
+        # The two stability runs stop extending at their first break (no more
+        # similarity calls once the output run is broken); oscillation needs
+        # every adjacent pair of deltas.
+        threshold = self.similarity_threshold
+        epsilon = self.stable_epsilon
         consecutive_diff_stable = 0
+        consecutive_nu_stable = 0
+        oscillation_count = 0
+        diff_open = nu_open = True
         for i in range(len(history) - 1, 0, -1):
-            sim = _output_similarity(history[i].output, history[i - 1].output)
-            if sim >= self.similarity_threshold:
-                consecutive_diff_stable += 1
-            else:
-                break
+            d = deltas[i - 1]
+            if diff_open:
+                if _snapshot_similarity(history[i], history[i - 1], threshold) >= threshold:
+                    consecutive_diff_stable += 1
+                else:
+                    diff_open = False
+            if nu_open:
+                if abs(d) < epsilon:
+                    consecutive_nu_stable += 1
+                else:
+                    nu_open = False
+            if i >= 2 and d * deltas[i - 2] < 0:
+                oscillation_count += 1
         output_is_stable = consecutive_diff_stable >= self.diff_stable_count
+        nu_is_stable = consecutive_nu_stable >= self.nu_stable_count
 
         # --- ν licensing check ---
         is_licensed = (
@@ -251,18 +352,11 @@ class HybridConvergence:
             and current.nu <= self.nu_threshold
         )
 
-        # --- ν stability check ---
-        consecutive_nu_stable = 0
-        for i in range(len(nus) - 1, 0, -1):
-            if abs(nus[i] - nus[i - 1]) < self.stable_epsilon:
-                consecutive_nu_stable += 1
-            else:
-                break
-        nu_is_stable = consecutive_nu_stable >= self.nu_stable_count
-
         # --- Convergence: both stable AND licensed ---
         if output_is_stable and is_licensed and nu_is_stable:
-            sim = _output_similarity(history[-1].output, history[-2].output)
+            sim = _snapshot_similarity(
+                history[-1], history[-2], self.similarity_threshold
+            )
             return ConvergenceResult(
                 converged=True,
                 reason="output_stable_and_nu_licensed",
@@ -279,10 +373,7 @@ class HybridConvergence:
         # --- Detect spinning: output changes but ν not improving ---
         is_spinning = False
         if len(history) >= 3 and not output_is_stable:
-            recent_nu_deltas = [
-                nus[i] - nus[i - 1]
-                for i in range(max(1, len(nus) - 3), len(nus))
-            ]
+            recent_nu_deltas = deltas[-3:]
             # Output changing but ν not improving (deltas positive or near zero)
             if all(d >= -self.stable_epsilon for d in recent_nu_deltas):
                 is_spinning = True
@@ -290,12 +381,6 @@ class HybridConvergence:
         # --- Detect premature convergence: output stable but ν still high ---
         premature = output_is_stable and not is_licensed
 
-        # --- Oscillation detection ---
-        oscillation_count = 0
-        for i in range(2, len(nus)):
-            if (nus[i] - nus[i - 1]) * (nus[i - 1] - nus[i - 2]) < 0:
-                oscillation_count += 1
-
         reason = "in_progress"
         suggestion = ""
         if premature:
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, TypeVar, Union
 
 from nn_logic.types import Clock, MockClock
 from nn_logic.policy import Policy
@@ -12,9 +15,11 @@ from rwt_integration.convergence import ConvergenceStrategy
 from rwt_integration.loop import RWTLoop, RunResult
 from rwt_integration.metacognition import MetacognitionBridge
 from rwt_integration.metrics import ComparisonReport, RunSummary
-from rwt_integration.providers import ModelProvider
+from rwt_integration.providers import AsyncModelProvider, ModelProvider
 from rwt_integration.tasks import Task
 
+_P = TypeVar("_P")
+
 
 class EvaluationHarness:
     """Run each task with each strategy and collect comparison metrics."""
@@ -36,19 +41,34 @@ class EvaluationHarness:
         provider: ModelProvider,
     ) -> RunResult:
         """Run a single task with a single strategy."""
+        return self._make_loop(strategy, provider).run(task)
+
+    async def run_single_async(
+        self,
+        task: Task,
+        strategy: ConvergenceStrategy,
+        provider: Union[ModelProvider, AsyncModelProvider],
+    ) -> RunResult:
+        """Run a single task with a single strategy, awaiting the provider."""
+        return await self._make_loop(strategy, provider).run_async(task)
+
+    def _make_loop(
+        self,
+        strategy: ConvergenceStrategy,
+        provider: Union[ModelProvider, AsyncModelProvider],
+    ) -> RWTLoop:
         bridge = MetacognitionBridge(
             policy=self._policy,
             config=self._config,
             clock=self._clock,
         )
-        loop = RWTLoop(
-            provider=provider,
+        return RWTLoop(
+            provider=provider,  # type: ignore[arg-type]
             strategy=strategy,
             bridge=bridge,
             config=self._config,
             clock=self._clock,
         )
-        return loop.run(task)
 
     def run_comparison(
         self,
@@ -62,17 +82,84 @@ class EvaluationHarness:
         Note: With deterministic mock providers, runs_per_config > 1 will
         produce identical results. Use runs_per_config > 1 with stochastic
         providers for statistical significance.
+
+        With config.max_workers > 1 the runs execute on a thread pool. A
+        provider with reset() is stateful, so each run gets its own deep
+        copy; providers without it are shared and must be thread-safe.
+        Runs are reported in the same order either way.
         """
         report = ComparisonReport()
+        jobs = _jobs(tasks, strategies, runs_per_config)
+
+        if self._config.max_workers <= 1:
+            for task, strategy in jobs:
+                # Reset provider state if possible
+                if hasattr(provider, "reset"):
+                    provider.reset()
+
+                result = self.run_single(task, strategy, provider)
+                report.add_run(result.summary)
+            return report
 
-        for strategy in strategies:
-            for task in tasks:
-                for run_idx in range(runs_per_config):
-                    # Reset provider state if possible
-                    if hasattr(provider, "reset"):
-                        provider.reset()  # type: ignore[union-attr]
+        def run_job(job: tuple[Task, ConvergenceStrategy]) -> RunResult:
+            task, strategy = job
+            return self.run_single(task, strategy, _worker_provider(provider))
 
-                    result = self.run_single(task, strategy, provider)
-                    report.add_run(result.summary)
+        with ThreadPoolExecutor(max_workers=self._config.max_workers) as pool:
+            for result in pool.map(run_job, jobs):
+                report.add_run(result.summary)
 
         return report
+
+    async def run_comparison_async(
+        self,
+        tasks: list[Task],
+        strategies: list[ConvergenceStrategy],
+        provider: Union[ModelProvider, AsyncModelProvider],
+        runs_per_config: int = 1,
+        max_concurrency: int = 8,
+    ) -> ComparisonReport:
+        """Run every (strategy, task) combination concurrently.
+
+        At most max_concurrency runs are in flight at once, which bounds
+        the load on a rate-limited provider. Provider copies follow the
+        same rule as run_comparison, and runs are reported in job order.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_job(task: Task, strategy: ConvergenceStrategy) -> RunResult:
+            async with semaphore:
+                return await self.run_single_async(
+                    task, strategy, _worker_provider(provider)
+                )
+
+        jobs = _jobs(tasks, strategies, runs_per_config)
+        results = await asyncio.gather(
+            *(run_job(task, strategy) for task, strategy in jobs)
+        )
+        report = ComparisonReport()
+        for result in results:
+            report.add_run(result.summary)
+        return report
+
+
+def _jobs(
+    tasks: list[Task],
+    strategies: list[ConvergenceStrategy],
+    runs_per_config: int,
+) -> list[tuple[Task, ConvergenceStrategy]]:
+    return [
+        (task, strategy)
+        for strategy in strategies
+        for task in tasks
+        for _ in range(runs_per_config)
+    ]
+
+
+def _worker_provider(provider: _P) -> _P:
+    """A fresh copy of a stateful (resettable) provider, else the shared one."""
+    if not hasattr(provider, "reset"):
+        return provider
+    worker = copy.deepcopy(provider)
+    worker.reset()
+    return worker
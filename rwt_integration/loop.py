@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import time as _time
+from collections import deque
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher
-from typing import Optional
+from typing import Any, Callable, Generator, MutableSequence, Optional, cast
 
 from nn_logic.types import (
     Clock,
@@ -20,13 +22,18 @@ from rwt_integration.convergence import (
     ConvergenceResult,
     ConvergenceStrategy,
     IterationSnapshot,
+    _snapshot_similarity,
 )
 from rwt_integration.metacognition import MetacognitionBridge
-from rwt_integration.metrics import IterationRecord, RunSummary
+from rwt_integration.metrics import IterationRecord, RecordLog, RunSummary
 from rwt_integration.providers import ModelProvider, SelfAssessment
 from rwt_integration.tasks import Task
 
 
+# A provider call requested by the loop body: (method name, positional args)
+_ProviderCall = tuple[str, tuple[Any, ...]]
+
+
 @dataclass(frozen=True)
 class RunResult:
     """Full result from an RWT loop execution."""
@@ -45,12 +52,15 @@ class RWTLoop:
         bridge: MetacognitionBridge,
         config: LoopConfig = LoopConfig(),
         clock: Optional[Clock] = None,
+        on_iteration: Optional[Callable[[IterationRecord], None]] = None,
     ) -> None:
         self._provider = provider
         self._strategy = strategy
         self._bridge = bridge
         self._config = config
         self._clock = clock or MockClock(0.0)
+        # Called with each IterationRecord as soon as it is built
+        self._on_iteration = on_iteration
 
     def run(self, task: Task) -> RunResult:
         """Execute the RWT loop on a task.
@@ -65,6 +75,56 @@ class RWTLoop:
            e. Record metrics
         4. Return final output + full trace
         """
+        steps = self._steps(task)
+        try:
+            method, args = next(steps)
+            while True:
+                method, args = steps.send(getattr(self._provider, method)(*args))
+        except StopIteration as stop:
+            return cast(RunResult, stop.value)
+        finally:
+            # Runs the body's cleanup (e.g. closing the record log) now if
+            # a provider call raised, rather than whenever it is collected
+            steps.close()
+
+    async def run_async(self, task: Task) -> RunResult:
+        """Execute the RWT loop on a task, awaiting provider calls.
+
+        Iterations stay sequential (each refines the previous output), so
+        the gain comes from running many tasks concurrently. Coroutine
+        methods on the provider are awaited directly; plain methods run
+        in a worker thread so they don't block the event loop.
+        """
+        steps = self._steps(task)
+        try:
+            method, args = next(steps)
+            while True:
+                call = getattr(self._provider, method)
+                if inspect.iscoroutinefunction(call):
+                    result = await call(*args)
+                else:
+                    result = await asyncio.to_thread(call, *args)
+                method, args = steps.send(result)
+        except StopIteration as stop:
+            return cast(RunResult, stop.value)
+        finally:
+            steps.close()
+
+    def _steps(self, task: Task) -> Generator[_ProviderCall, Any, RunResult]:
+        """The loop body, yielding each provider call to the driver.
+
+        run() and run_async() differ only in how a yielded
+        (method, args) call is answered, so they share this body.
+        """
+        path = self._config.records_path
+        if path is None:
+            return (yield from self._iterate(task, None))
+        with RecordLog(path, task.id, self._strategy.name) as log:
+            return (yield from self._iterate(task, log))
+
+    def _iterate(
+        self, task: Task, log: Optional[RecordLog]
+    ) -> Generator[_ProviderCall, Any, RunResult]:
         target_id = TargetID(task.id)
         context_id = ContextID(f"rwt_{task.id}")
 
@@ -72,19 +132,40 @@ class RWTLoop:
         self._bridge.reset()
         state = self._bridge.initialize_state(target_id, context_id)
 
-        snapshots: list[IterationSnapshot] = []
+        window = self._config.history_window
+        snapshots: MutableSequence[IterationSnapshot] = (
+            [] if window is None else deque(maxlen=window)
+        )
         records: list[IterationRecord] = []
         nu_trajectory: list[float] = []
         nu_raw_trajectory: list[float] = []
+        # Bound appenders, resolved once rather than every iteration
+        add_snapshot = snapshots.append
+        add_record = records.append
+        add_nu = nu_trajectory.append
+        add_nu_raw = nu_raw_trajectory.append
+        keep_records = self._config.keep_iteration_records
+        on_iteration = self._on_iteration
+        observed = keep_records or on_iteration is not None or log is not None
+        iterations_done = 0
         total_tokens = 0
-        start_time = _time.monotonic()
+        start_ns = _time.monotonic_ns()
 
         # Generate initial output
-        initial_prompt = self._config.initial_prompt_template.format(
+        initial_prompt = self._config.initial_prompt.render(
+            task_specification=task.specification
+        )
+        current_output, tokens = yield from self._generate(initial_prompt)
+        total_tokens += tokens
+
+        # The task spec is fixed for the run: render it into the
+        # per-iteration templates once
+        assessment_prompt = self._config.assessment_prompt.bind(
+            task_specification=task.specification
+        )
+        refinement_prompt = self._config.refinement_prompt.bind(
             task_specification=task.specification
         )
-        current_output = self._provider.generate(initial_prompt)
-        total_tokens += _estimate_tokens(initial_prompt + current_output)
 
         converged = False
         convergence_reason = "max_iterations"
@@ -93,14 +174,13 @@ class RWTLoop:
         )
 
         for iteration in range(self._config.max_iterations):
-            iter_start = _time.monotonic()
+            iter_start_ns = _time.monotonic_ns()
 
             # Step a: Get self-assessment
-            assess_prompt = self._config.assessment_prompt_template.format(
-                task_specification=task.specification,
-                current_output=current_output,
+            assess_prompt = assessment_prompt.render(current_output=current_output)
+            assessment = yield (
+                "assess", (task.specification, current_output, assess_prompt)
             )
-            assessment = self._provider.assess(task.specification, current_output, assess_prompt)
             total_tokens += _estimate_tokens(assess_prompt)
 
             # Step b: Update N/N-N state
@@ -110,16 +190,8 @@ class RWTLoop:
 
             nu = diagnostics.nu
             nu_raw = diagnostics.nu_raw
-            nu_trajectory.append(nu)
-            nu_raw_trajectory.append(nu_raw)
-
-            # Compute output diff
-            if iteration > 0 and snapshots:
-                diff_ratio = 1.0 - SequenceMatcher(
-                    None, snapshots[-1].output, current_output
-                ).ratio()
-            else:
-                diff_ratio = 1.0
+            add_nu(nu)
+            add_nu_raw(nu_raw)
 
             # Build snapshot for convergence strategy
             snapshot = IterationSnapshot(
@@ -132,31 +204,46 @@ class RWTLoop:
                 def_ep=diagnostics.def_ep,
                 def_proc=diagnostics.def_proc,
             )
-            snapshots.append(snapshot)
+
+            prev_snapshot = snapshots[-1] if snapshots else None
+            add_snapshot(snapshot)
 
             # Step c: Check convergence
             convergence_check = self._strategy.should_stop(snapshots)
-
-            iter_time = _time.monotonic() - iter_start
-
-            # Record metrics
-            record = IterationRecord(
-                iteration=iteration,
-                output=current_output,
-                assessment=assessment,
-                nu=nu,
-                nu_raw=nu_raw,
-                nu_penalty=diagnostics.nu_penalty,
-                def_sem=diagnostics.def_sem,
-                def_ep=diagnostics.def_ep,
-                def_proc=diagnostics.def_proc,
-                conflict_score=diagnostics.conflict,
-                output_diff_ratio=diff_ratio,
-                convergence_check=convergence_check,
-                wall_time_seconds=iter_time,
-                prompt_tokens_estimate=total_tokens,
-            )
-            records.append(record)
+            iterations_done = iteration + 1
+
+            # Record metrics. Nothing else reads the record, so the output
+            # diff and the record are only built when it is kept or streamed.
+            if observed:
+                # Output diff: fingerprint check, then the shared memoized
+                # similarity the strategies also use
+                if prev_snapshot is None:
+                    diff_ratio = 1.0
+                else:
+                    diff_ratio = 1.0 - _snapshot_similarity(prev_snapshot, snapshot)
+
+                record = IterationRecord(
+                    iteration=iteration,
+                    output=current_output,
+                    assessment=assessment,
+                    nu=nu,
+                    nu_raw=nu_raw,
+                    nu_penalty=diagnostics.nu_penalty,
+                    def_sem=diagnostics.def_sem,
+                    def_ep=diagnostics.def_ep,
+                    def_proc=diagnostics.def_proc,
+                    conflict_score=diagnostics.conflict,
+                    output_diff_ratio=diff_ratio,
+                    convergence_check=convergence_check,
+                    wall_time_ns=_time.monotonic_ns() - iter_start_ns,
+                    prompt_tokens_estimate=total_tokens,
+                )
+                if keep_records:
+                    add_record(record)
+                if log is not None:
+                    log.write(record)
+                if on_iteration is not None:
+                    on_iteration(record)
 
             if convergence_check.converged and iteration >= self._config.min_iterations - 1:
                 converged = True
@@ -170,8 +257,7 @@ class RWTLoop:
             if suggestion:
                 guidance = f"{suggestion}. {guidance}"
 
-            refine_prompt = self._config.refinement_prompt_template.format(
-                task_specification=task.specification,
+            refine_prompt = refinement_prompt.render(
                 current_output=current_output,
                 assessment_summary=assessment.to_summary(),
                 nu=nu,
@@ -185,15 +271,15 @@ class RWTLoop:
                 refinement_guidance=guidance,
                 refinement_priority=assessment.refinement_priority,
             )
-            current_output = self._provider.generate(refine_prompt)
-            total_tokens += _estimate_tokens(refine_prompt + current_output)
+            current_output, tokens = yield from self._generate(refine_prompt)
+            total_tokens += tokens
 
-        total_time = _time.monotonic() - start_time
+        total_time = (_time.monotonic_ns() - start_ns) * 1e-9
 
         summary = RunSummary(
             task_id=task.id,
             strategy_name=self._strategy.name,
-            iterations=len(records),
+            iterations=iterations_done,
             converged=converged,
             convergence_reason=convergence_reason,
             final_nu=nu_trajectory[-1] if nu_trajectory else 1.0,
@@ -211,7 +297,32 @@ class RWTLoop:
             snapshots=tuple(snapshots),
         )
 
+    def _generate(self, prompt: str) -> Generator[_ProviderCall, Any, tuple[str, int]]:
+        """Generate one output for prompt; returns (output, tokens spent).
 
-def _estimate_tokens(text: str) -> int:
-    """Rough token estimate: ~4 chars per token."""
-    return len(text) // 4
+        With samples_per_iteration > 1 the candidates come from a single
+        generate_batch call when the provider has one (else k generate
+        calls) and the most common candidate wins, earliest on ties.
+        """
+        k = self._config.samples_per_iteration
+        if k <= 1:
+            output = yield ("generate", (prompt,))
+            return output, _estimate_tokens(prompt, output)
+
+        if hasattr(self._provider, "generate_batch"):
+            outputs = yield ("generate_batch", ([prompt] * k,))
+        else:
+            outputs = []
+            for _ in range(k):
+                outputs.append((yield ("generate", (prompt,))))
+        tokens = sum(_estimate_tokens(prompt, output) for output in outputs)
+        return max(outputs, key=outputs.count), tokens
+
+
+def _estimate_tokens(*texts: str) -> int:
+    """Rough token estimate: ~4 chars per token.
+
+    Takes the texts separately so callers don't concatenate a prompt and
+    its output just to measure them.
+    """
+    return sum(map(len, texts)) // 4
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import deque
+from functools import lru_cache
 from typing import Optional
 
 from nn_logic.types import (
@@ -19,7 +21,6 @@ from nn_logic.types import (
     State,
     TargetID,
 )
-from nn_logic.aggregate import aggregate, compute_conflict
 from nn_logic.definedness import (
     DefEpFn,
     DefProcFn,
@@ -56,7 +57,9 @@ class MetacognitionBridge:
         self._policy = policy
         self._config = config
         self._clock = clock or MockClock(0.0)
-        self._iteration_assessments: list[SelfAssessment] = []
+        # Calibration only looks back one assessment, so keep just the
+        # current and previous ones
+        self._iteration_assessments: deque[SelfAssessment] = deque(maxlen=2)
 
     def initialize_state(
         self, target_id: TargetID, context_id: ContextID
@@ -80,32 +83,20 @@ class MetacognitionBridge:
         # Step 1: Calibrate
         calibrated = self._calibrate(assessment, iteration)
 
-        # Step 2: Convert to evidence
-        evidence_items = self._assessment_to_evidence(calibrated, iteration)
+        # Step 2: Convert to evidence (a prebuilt batch, columns included)
+        evidence_batch = self._evidence_batch(calibrated, iteration)
 
-        # Step 3: Create Def overrides from calibrated assessment
-        def_sem_val = self._compute_def_sem(calibrated)
-        def_ep_val = self._compute_def_ep(calibrated)
-        def_proc_val = self._compute_def_proc(calibrated)
-
-        def sem_override(t: TargetID, ev: EvidenceSet, c: tuple[str, ...]) -> float:
-            return def_sem_val
-
-        def ep_override(t: TargetID, ev: EvidenceSet) -> float:
-            return def_ep_val
-
-        def proc_override(t: TargetID, ev: EvidenceSet) -> float:
-            return def_proc_val
+        # Step 3: Def overrides from calibrated assessment
+        components = _def_components(calibrated)
+        def_sem_val, def_ep_val, def_proc_val = components
 
         # Step 4: Incorporate evidence
         state, inc_record = incorporate(
             state,
-            evidence_items,
+            evidence_batch,
             policy=self._policy,
             clock=self._clock,
-            def_sem_override=sem_override,
-            def_ep_override=ep_override,
-            def_proc_override=proc_override,
+            def_overrides=components,
         )
 
         # Step 5: Run conflict detection
@@ -116,22 +107,16 @@ class MetacognitionBridge:
             )
             conflict_score = agg_result.conflict
 
-        # Compute aggregate for diagnostics
-        agg = aggregate(
-            state.evidence,
-            state.target_id,
-            state.context_id,
-            self._policy.relevance_fn,
-            (self._clock).now() if hasattr(self._clock, 'now') else 0.0,
-            0.0,
-        )
-
         nu = state.nu_with_mode(self._policy.penalty_mode)
         nu_penalty = nu - state.nu_raw if nu > state.nu_raw else 0.0
 
-        # Determine weakest component
-        components = {"def_sem": def_sem_val, "def_ep": def_ep_val, "def_proc": def_proc_val}
-        weakest = min(components, key=components.get)  # type: ignore[arg-type]
+        # Determine weakest component (ties go to the earlier one, as min would)
+        if def_sem_val <= def_ep_val and def_sem_val <= def_proc_val:
+            weakest = "def_sem"
+        elif def_ep_val <= def_proc_val:
+            weakest = "def_ep"
+        else:
+            weakest = "def_proc"
 
         diagnostics = IterationDiagnostics(
             nu=nu,
@@ -154,59 +139,139 @@ class MetacognitionBridge:
         - If unsupported_claims is empty on iteration > 0, add skepticism penalty
         - Weight issue counts more than stated confidence
         """
-        conf_weight = self._config.confidence_count_weight
-
-        # Calibrated definition confidence
-        def_conf = raw.definition_confidence
-        if not raw.ambiguity_flags and def_conf < 0.9:
-            def_conf *= 0.8  # discount: claims no issues but not highly confident
-        # Blend stated confidence with issue-count-based estimate
-        issue_based_def = clamp(1.0 - len(raw.ambiguity_flags) * 0.15)
-        def_conf = (1 - conf_weight) * def_conf + conf_weight * issue_based_def
-
-        # Calibrated evidence confidence
-        ev_conf = raw.evidence_confidence
-        if not raw.unsupported_claims and iteration > 0:
-            ev_conf -= self._config.empty_flags_skepticism_penalty
-        issue_based_ev = clamp(1.0 - len(raw.unsupported_claims) * 0.15)
-        ev_conf = (1 - conf_weight) * ev_conf + conf_weight * issue_based_ev
-
-        # Calibrated task coverage
-        cov = raw.task_coverage
-        issue_based_cov = clamp(1.0 - len(raw.missing_elements) * 0.12)
-        cov = (1 - conf_weight) * cov + conf_weight * issue_based_cov
-
-        # Confidence calibration across iterations
+        # Confidence calibration across iterations: if confidence went up
+        # but issues didn't decrease, discount
+        discount = False
         if len(self._iteration_assessments) >= 2:
             prev = self._iteration_assessments[-2]
-            # If confidence went up but issues didn't decrease, discount
-            if (raw.definition_confidence > prev.definition_confidence
-                    and len(raw.ambiguity_flags) >= len(prev.ambiguity_flags)):
-                def_conf *= 0.9
-
-        return SelfAssessment(
-            definition_confidence=clamp(def_conf),
-            ambiguity_flags=raw.ambiguity_flags,
-            evidence_confidence=clamp(ev_conf),
-            unsupported_claims=raw.unsupported_claims,
-            contradictions=raw.contradictions,
-            task_coverage=clamp(cov),
-            missing_elements=raw.missing_elements,
-            refinement_priority=raw.refinement_priority,
-            refinement_suggestion=raw.refinement_suggestion,
+            discount = (raw.definition_confidence > prev.definition_confidence
+                        and len(raw.ambiguity_flags) >= len(prev.ambiguity_flags))
+
+        return _calibrated(
+            raw,
+            iteration > 0,
+            discount,
+            self._config.confidence_count_weight,
+            self._config.empty_flags_skepticism_penalty,
         )
 
     def _assessment_to_evidence(
         self, assessment: SelfAssessment, iteration: int
     ) -> list[Evidence]:
         """Convert calibrated assessment into N/N-N evidence items."""
+        return list(self._evidence_batch(assessment, iteration).items)
+
+    def _evidence_batch(
+        self, assessment: SelfAssessment, iteration: int
+    ) -> EvidenceSet:
+        """The evidence items as a shared, cached batch."""
         now = self._clock.now() if hasattr(self._clock, 'now') else 0.0
-        items: list[Evidence] = []
-        src = AgentID("self_assessment")
-        prefix = f"iter{iteration}"
+        return _evidence_for(assessment, iteration, now)
+
+    def _compute_def_sem(self, assessment: SelfAssessment) -> float:
+        """Semantic definedness from definition confidence and ambiguity flags."""
+        return _def_components(assessment)[0]
+
+    def _compute_def_ep(self, assessment: SelfAssessment) -> float:
+        """Epistemic definedness from evidence confidence and unsupported claims."""
+        return _def_components(assessment)[1]
+
+    def _compute_def_proc(self, assessment: SelfAssessment) -> float:
+        """Procedural definedness from task coverage and missing elements."""
+        return _def_components(assessment)[2]
+
+    def reset(self) -> None:
+        """Reset bridge state for a new run."""
+        self._iteration_assessments.clear()
+
+
+# Calibration and evidence construction are pure functions of hashable
+# inputs, so repeated assessments (a stalled model, or the same task under
+# several strategies) reuse the earlier result.
+
+@lru_cache(maxsize=1024)
+def _calibrated(
+    raw: SelfAssessment,
+    skeptical: bool,
+    discount: bool,
+    conf_weight: float,
+    skepticism_penalty: float,
+) -> SelfAssessment:
+    """Pure core of MetacognitionBridge._calibrate."""
+    # Calibrated definition confidence
+    def_conf = raw.definition_confidence
+    if not raw.ambiguity_flags and def_conf < 0.9:
+        def_conf *= 0.8  # discount: claims no issues but not highly confident
+    # Blend stated confidence with issue-count-based estimate
+    issue_based_def = clamp(1.0 - len(raw.ambiguity_flags) * 0.15)
+    def_conf = (1 - conf_weight) * def_conf + conf_weight * issue_based_def
+
+    # Calibrated evidence confidence
+    ev_conf = raw.evidence_confidence
+    if not raw.unsupported_claims and skeptical:
+        ev_conf -= skepticism_penalty
+    issue_based_ev = clamp(1.0 - len(raw.unsupported_claims) * 0.15)
+    ev_conf = (1 - conf_weight) * ev_conf + conf_weight * issue_based_ev
+
+    # Calibrated task coverage
+    cov = raw.task_coverage
+    issue_based_cov = clamp(1.0 - len(raw.missing_elements) * 0.12)
+    cov = (1 - conf_weight) * cov + conf_weight * issue_based_cov
+
+    # Confidence calibration across iterations
+    if discount:
+        def_conf *= 0.9
+
+    return SelfAssessment(
+        definition_confidence=clamp(def_conf),
+        ambiguity_flags=raw.ambiguity_flags,
+        evidence_confidence=clamp(ev_conf),
+        unsupported_claims=raw.unsupported_claims,
+        contradictions=raw.contradictions,
+        task_coverage=clamp(cov),
+        missing_elements=raw.missing_elements,
+        refinement_priority=raw.refinement_priority,
+        refinement_suggestion=raw.refinement_suggestion,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _evidence_for(
+    assessment: SelfAssessment, iteration: int, now: float
+) -> EvidenceSet:
+    """Pure core of MetacognitionBridge._assessment_to_evidence.
+
+    Returned as an EvidenceSet so the batch's column view is built once per
+    cached result and reused by every incorporate that adds it.
+    """
+    src = AgentID("self_assessment")
+    prefix = f"iter{iteration}"
+
+    def issues(
+        tag: str,
+        kind: EvidenceKind,
+        label: str,
+        entries: tuple[str, ...],
+        valence: float,
+        trust: float,
+    ) -> list[Evidence]:
+        """One negative evidence item per flagged issue."""
+        return [
+            Evidence(
+                id=EvidenceID(f"{prefix}_{tag}_{i}"),
+                kind=kind,
+                claim=f"{label}: {entry}",
+                valence=valence,
+                src=src,
+                time=now,
+                trust=trust,
+            )
+            for i, entry in enumerate(entries)
+        ]
 
+    items = (
         # Definitional evidence from definition_confidence
-        items.append(Evidence(
+        Evidence(
             id=EvidenceID(f"{prefix}_def_conf"),
             kind=EvidenceKind.DEFINITIONAL,
             claim=f"Definition confidence at iteration {iteration}",
@@ -214,22 +279,12 @@ class MetacognitionBridge:
             src=src,
             time=now,
             trust=0.8,
-        ))
-
+        ),
         # Negative definitional evidence from ambiguity flags
-        for i, flag in enumerate(assessment.ambiguity_flags):
-            items.append(Evidence(
-                id=EvidenceID(f"{prefix}_ambiguity_{i}"),
-                kind=EvidenceKind.DEFINITIONAL,
-                claim=f"Ambiguity: {flag}",
-                valence=-0.3,
-                src=src,
-                time=now,
-                trust=0.9,
-            ))
-
+        *issues("ambiguity", EvidenceKind.DEFINITIONAL, "Ambiguity",
+                assessment.ambiguity_flags, -0.3, 0.9),
         # Epistemic evidence from evidence_confidence
-        items.append(Evidence(
+        Evidence(
             id=EvidenceID(f"{prefix}_ev_conf"),
             kind=EvidenceKind.EPISTEMIC,
             claim=f"Evidence confidence at iteration {iteration}",
@@ -237,34 +292,15 @@ class MetacognitionBridge:
             src=src,
             time=now,
             trust=0.8,
-        ))
-
+        ),
         # Negative epistemic from unsupported claims
-        for i, claim in enumerate(assessment.unsupported_claims):
-            items.append(Evidence(
-                id=EvidenceID(f"{prefix}_unsupported_{i}"),
-                kind=EvidenceKind.EPISTEMIC,
-                claim=f"Unsupported: {claim}",
-                valence=-0.3,
-                src=src,
-                time=now,
-                trust=0.9,
-            ))
-
+        *issues("unsupported", EvidenceKind.EPISTEMIC, "Unsupported",
+                assessment.unsupported_claims, -0.3, 0.9),
         # Contradiction evidence (triggers conflict detection)
-        for i, contradiction in enumerate(assessment.contradictions):
-            items.append(Evidence(
-                id=EvidenceID(f"{prefix}_contradiction_{i}"),
-                kind=EvidenceKind.EPISTEMIC,
-                claim=f"Contradiction: {contradiction}",
-                valence=-0.5,
-                src=src,
-                time=now,
-                trust=1.0,
-            ))
-
+        *issues("contradiction", EvidenceKind.EPISTEMIC, "Contradiction",
+                assessment.contradictions, -0.5, 1.0),
         # Procedural evidence from task_coverage
-        items.append(Evidence(
+        Evidence(
             id=EvidenceID(f"{prefix}_coverage"),
             kind=EvidenceKind.PROCEDURAL,
             claim=f"Task coverage at iteration {iteration}",
@@ -272,44 +308,34 @@ class MetacognitionBridge:
             src=src,
             time=now,
             trust=0.8,
-        ))
-
+        ),
         # Negative procedural from missing elements
-        for i, elem in enumerate(assessment.missing_elements):
-            items.append(Evidence(
-                id=EvidenceID(f"{prefix}_missing_{i}"),
-                kind=EvidenceKind.PROCEDURAL,
-                claim=f"Missing: {elem}",
-                valence=-0.25,
-                src=src,
-                time=now,
-                trust=0.9,
-            ))
-
-        return items
+        *issues("missing", EvidenceKind.PROCEDURAL, "Missing",
+                assessment.missing_elements, -0.25, 0.9),
+    )
+    return EvidenceSet(items=items)
 
-    def _compute_def_sem(self, assessment: SelfAssessment) -> float:
-        """Semantic definedness from definition confidence and ambiguity flags."""
-        # Blend confidence with inverse of ambiguity count
-        ambiguity_penalty = len(assessment.ambiguity_flags) * 0.1
-        return clamp(assessment.definition_confidence - ambiguity_penalty)
 
-    def _compute_def_ep(self, assessment: SelfAssessment) -> float:
-        """Epistemic definedness from evidence confidence and unsupported claims."""
-        unsupported_penalty = len(assessment.unsupported_claims) * 0.1
-        contradiction_penalty = len(assessment.contradictions) * 0.15
-        return clamp(
-            assessment.evidence_confidence - unsupported_penalty - contradiction_penalty
-        )
+@lru_cache(maxsize=1024)
+def _def_components(assessment: SelfAssessment) -> tuple[float, float, float]:
+    """(def_sem, def_ep, def_proc) for a calibrated assessment, in one pass.
 
-    def _compute_def_proc(self, assessment: SelfAssessment) -> float:
-        """Procedural definedness from task coverage and missing elements."""
-        missing_penalty = len(assessment.missing_elements) * 0.1
-        return clamp(assessment.task_coverage - missing_penalty)
-
-    def reset(self) -> None:
-        """Reset bridge state for a new run."""
-        self._iteration_assessments.clear()
+    Each component is the stated confidence less a per-issue penalty,
+    clamped to [0, 1].
+    """
+    # Blend confidence with inverse of ambiguity count
+    sem = assessment.definition_confidence - len(assessment.ambiguity_flags) * 0.1
+    ep = (
+        assessment.evidence_confidence
+        - len(assessment.unsupported_claims) * 0.1
+        - len(assessment.contradictions) * 0.15
+    )
+    proc = assessment.task_coverage - len(assessment.missing_elements) * 0.1
+    return (
+        max(0.0, min(1.0, sem)),
+        max(0.0, min(1.0, ep)),
+        max(0.0, min(1.0, proc)),
+    )
 
 
 class IterationDiagnostics:
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import json
+import os
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from math import fsum
+from typing import Any, Iterator, Optional, Union
 
 from rwt_integration.convergence import ConvergenceResult
 from rwt_integration.providers import SelfAssessment
@@ -23,9 +26,92 @@ class IterationRecord:
     conflict_score: float
     output_diff_ratio: float  # 0 = identical to previous, 1 = completely different
     convergence_check: ConvergenceResult
-    wall_time_seconds: float
+    wall_time_ns: int  # integer monotonic_ns delta; seconds via wall_time_seconds
     prompt_tokens_estimate: int
 
+    @property
+    def wall_time_seconds(self) -> float:
+        return self.wall_time_ns * 1e-9
+
+    def to_dict(self) -> dict[str, Any]:
+        check = self.convergence_check
+        return {
+            "iteration": self.iteration,
+            "output": self.output,
+            "assessment": self.assessment.to_dict(),
+            "nu": self.nu,
+            "nu_raw": self.nu_raw,
+            "nu_penalty": self.nu_penalty,
+            "def_sem": self.def_sem,
+            "def_ep": self.def_ep,
+            "def_proc": self.def_proc,
+            "conflict_score": self.conflict_score,
+            "output_diff_ratio": self.output_diff_ratio,
+            "convergence_check": {
+                "converged": check.converged,
+                "reason": check.reason,
+                "confidence": check.confidence,
+                "diagnostics": dict(check.diagnostics),
+            },
+            "wall_time_ns": self.wall_time_ns,
+            "prompt_tokens_estimate": self.prompt_tokens_estimate,
+        }
+
+
+class RecordLog:
+    """Append-only JSON Lines sink for one run's IterationRecords.
+
+    Each line is the record's to_dict() tagged with task_id and strategy.
+    Lines are buffered and written in batches of whole lines (one write
+    per ~buffer_size bytes), so runs appending to the same file never
+    interleave within a line.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        task_id: str = "",
+        strategy_name: str = "",
+        buffer_size: int = 64 * 1024,
+    ) -> None:
+        self._file = open(path, "ab", buffering=0)
+        self._tag = {"task_id": task_id, "strategy": strategy_name}
+        self._buffer_size = buffer_size
+        self._pending: list[bytes] = []
+        self._pending_size = 0
+
+    def write(self, record: IterationRecord) -> None:
+        line = json.dumps({**self._tag, **record.to_dict()}, default=str)
+        data = (line + "\n").encode("utf-8")
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._pending_size >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self._file.write(b"".join(self._pending))
+            self._pending.clear()
+            self._pending_size = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> RecordLog:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def read_record_log(path: Union[str, os.PathLike[str]]) -> Iterator[dict[str, Any]]:
+    """Iterate the records a RecordLog wrote, one dict per line."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
 
 @dataclass(frozen=True)
 class RunSummary:
@@ -46,66 +132,67 @@ class RunSummary:
 
     @property
     def mean_nu_delta(self) -> float:
-        if len(self.nu_trajectory) < 2:
+        # The step deltas telescope: their mean is (last - first) / steps.
+        traj = self.nu_trajectory
+        if len(traj) < 2:
             return 0.0
-        deltas = [
-            self.nu_trajectory[i] - self.nu_trajectory[i - 1]
-            for i in range(1, len(self.nu_trajectory))
-        ]
-        return sum(deltas) / len(deltas)
+        return (traj[-1] - traj[0]) / (len(traj) - 1)
 
 
 @dataclass
 class ComparisonReport:
-    """Results from running multiple strategies across multiple tasks."""
+    """Results from running multiple strategies across multiple tasks.
+
+    Alongside the nested results, add_run keeps one set of flat columns per
+    strategy (_RunColumns), so the per-strategy aggregates are reductions
+    over plain lists rather than walks of the task -> runs nesting. Add
+    runs through add_run (or the constructor) to keep the two in step.
+    """
 
     results: dict[str, dict[str, list[RunSummary]]] = field(default_factory=dict)
     # strategy_name -> task_id -> list of run summaries
+    _columns: dict[str, _RunColumns] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        for strat, tasks in self.results.items():
+            columns = self._columns[strat] = _RunColumns()
+            for task_runs in tasks.values():
+                for r in task_runs:
+                    columns.add(r)
 
     def add_run(self, summary: RunSummary) -> None:
         strat = summary.strategy_name
         task = summary.task_id
         if strat not in self.results:
             self.results[strat] = {}
+            self._columns[strat] = _RunColumns()
         if task not in self.results[strat]:
             self.results[strat][task] = []
         self.results[strat][task].append(summary)
+        self._columns[strat].add(summary)
 
     def iterations_comparison(self) -> dict[str, float]:
         """Average iterations to convergence per strategy."""
-        result: dict[str, float] = {}
-        for strat, tasks in self.results.items():
-            all_iters: list[int] = []
-            for task_runs in tasks.values():
-                all_iters.extend(r.iterations for r in task_runs)
-            result[strat] = sum(all_iters) / len(all_iters) if all_iters else 0.0
-        return result
+        return {
+            strat: sum(c.iterations) / len(c.iterations) if c.iterations else 0.0
+            for strat, c in self._columns.items()
+        }
 
     def convergence_rate(self) -> dict[str, float]:
         """Fraction of runs that converged per strategy."""
-        result: dict[str, float] = {}
-        for strat, tasks in self.results.items():
-            total = 0
-            converged = 0
-            for task_runs in tasks.values():
-                for r in task_runs:
-                    total += 1
-                    if r.converged:
-                        converged += 1
-            result[strat] = converged / total if total > 0 else 0.0
-        return result
+        return {
+            strat: sum(c.converged) / len(c.converged) if c.converged else 0.0
+            for strat, c in self._columns.items()
+        }
 
     def quality_comparison(self) -> dict[str, Optional[float]]:
         """Average quality score per strategy (None if no scores available)."""
-        result: dict[str, Optional[float]] = {}
-        for strat, tasks in self.results.items():
-            scores: list[float] = []
-            for task_runs in tasks.values():
-                for r in task_runs:
-                    if r.quality_score is not None:
-                        scores.append(r.quality_score)
-            result[strat] = sum(scores) / len(scores) if scores else None
-        return result
+        return {
+            strat: fsum(c.quality) / len(c.quality) if c.quality else None
+            for strat, c in self._columns.items()
+        }
 
     def nu_trajectory_summary(self) -> dict[str, dict[str, list[tuple[float, ...]]]]:
         """ν trajectories per strategy per task."""
@@ -118,10 +205,30 @@ class ComparisonReport:
 
     def final_nu_comparison(self) -> dict[str, float]:
         """Average final ν per strategy."""
-        result: dict[str, float] = {}
-        for strat, tasks in self.results.items():
-            nus: list[float] = []
-            for task_runs in tasks.values():
-                nus.extend(r.final_nu for r in task_runs)
-            result[strat] = sum(nus) / len(nus) if nus else 1.0
-        return result
+        return {
+            strat: fsum(c.final_nu) / len(c.final_nu) if c.final_nu else 1.0
+            for strat, c in self._columns.items()
+        }
+
+
+class _RunColumns:
+    """One strategy's runs as parallel columns, in add_run order.
+
+    Float columns are reduced with math.fsum, so the aggregates don't depend
+    on the order runs arrived in (e.g. from a concurrent comparison).
+    """
+
+    __slots__ = ("iterations", "converged", "final_nu", "quality")
+
+    def __init__(self) -> None:
+        self.iterations: list[int] = []
+        self.converged: list[bool] = []
+        self.final_nu: list[float] = []
+        self.quality: list[float] = []  # runs with a quality score only
+
+    def add(self, summary: RunSummary) -> None:
+        self.iterations.append(summary.iterations)
+        self.converged.append(summary.converged)
+        self.final_nu.append(summary.final_nu)
+        if summary.quality_score is not None:
+            self.quality.append(summary.quality_score)
@@ -4,10 +4,23 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional, Protocol, runtime_checkable
-
-
-@dataclass(frozen=True)
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    Optional,
+    Protocol,
+    Sequence,
+    Union,
+    overload,
+    runtime_checkable,
+)
+
+from nn_logic.types import _SLOTS
+
+
+@dataclass(frozen=True, **_SLOTS)
 class SelfAssessment:
     """LLM's structured reflection on its own output."""
 
@@ -42,18 +55,32 @@ class SelfAssessment:
         }
 
     def to_summary(self) -> str:
-        lines = [
-            f"Definition confidence: {self.definition_confidence:.2f}",
-            f"Ambiguity flags: {list(self.ambiguity_flags)}",
-            f"Evidence confidence: {self.evidence_confidence:.2f}",
-            f"Unsupported claims: {list(self.unsupported_claims)}",
-            f"Contradictions: {list(self.contradictions)}",
-            f"Task coverage: {self.task_coverage:.2f}",
-            f"Missing elements: {list(self.missing_elements)}",
-            f"Refinement priority: {self.refinement_priority}",
-            f"Refinement suggestion: {self.refinement_suggestion}",
-        ]
-        return "\n".join(lines)
+        return _SUMMARY_FORMAT.format(
+            self.definition_confidence,
+            list(self.ambiguity_flags),
+            self.evidence_confidence,
+            list(self.unsupported_claims),
+            list(self.contradictions),
+            self.task_coverage,
+            list(self.missing_elements),
+            self.refinement_priority,
+            self.refinement_suggestion,
+        )
+
+
+# to_summary's lines as one format string, so a summary is a single
+# str.format call instead of nine f-strings and a join.
+_SUMMARY_FORMAT = "\n".join([
+    "Definition confidence: {:.2f}",
+    "Ambiguity flags: {}",
+    "Evidence confidence: {:.2f}",
+    "Unsupported claims: {}",
+    "Contradictions: {}",
+    "Task coverage: {:.2f}",
+    "Missing elements: {}",
+    "Refinement priority: {}",
+    "Refinement suggestion: {}",
+])
 
 
 @runtime_checkable
@@ -62,6 +89,19 @@ class ModelProvider(Protocol):
     def assess(self, task: str, output: str, prompt: str) -> SelfAssessment: ...
 
 
+@runtime_checkable
+class BatchModelProvider(ModelProvider, Protocol):
+    """A provider that can serve several independent prompts in one call."""
+
+    def generate_batch(self, prompts: list[str]) -> list[str]: ...
+
+
+@runtime_checkable
+class AsyncModelProvider(Protocol):
+    async def generate(self, prompt: str) -> str: ...
+    async def assess(self, task: str, output: str, prompt: str) -> SelfAssessment: ...
+
+
 @dataclass
 class MockProvider:
     """Returns pre-scripted (output, assessment) pairs in sequence.
@@ -71,28 +111,84 @@ class MockProvider:
 
     script: list[tuple[str, SelfAssessment]] = field(default_factory=list)
     _call_index: int = field(default=0, init=False, repr=False)
+    # The script split into parallel columns once, so each call is a
+    # single index with no pair unpacking
+    _outputs: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _assessments: tuple[SelfAssessment, ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._outputs = tuple(output for output, _ in self.script)
+        self._assessments = tuple(assessment for _, assessment in self.script)
 
     def generate(self, prompt: str) -> str:
-        if not self.script:
+        outputs = self._outputs
+        if not outputs:
             return ""
-        idx = min(self._call_index, len(self.script) - 1)
+        idx = min(self._call_index, len(outputs) - 1)
         self._call_index += 1
-        return self.script[idx][0]
+        return outputs[idx]
 
     def assess(self, task: str, output: str, prompt: str) -> SelfAssessment:
-        if not self.script:
+        assessments = self._assessments
+        if not assessments:
             return SelfAssessment()
         # Assessment is paired with the previous generate call
-        idx = min(self._call_index - 1, len(self.script) - 1)
+        idx = min(self._call_index - 1, len(assessments) - 1)
         idx = max(0, idx)
-        return self.script[idx][1]
+        return assessments[idx]
 
     def reset(self) -> None:
         self._call_index = 0
 
 
+class IterationHistory(Sequence[tuple[str, SelfAssessment]]):
+    """Read-only snapshot of a ScriptedProvider's (output, assessment) pairs.
+
+    Wraps the provider's append-only columns and fixes the length at
+    creation, so taking a snapshot each iteration is O(1) instead of a
+    copy of the whole history. Indexing and iteration yield pairs like
+    the list it replaces.
+    """
+
+    __slots__ = ("_outputs", "_assessments", "_len")
+
+    def __init__(
+        self,
+        outputs: Sequence[str] = (),
+        assessments: Sequence[SelfAssessment] = (),
+    ) -> None:
+        self._outputs = outputs
+        self._assessments = assessments
+        self._len = min(len(outputs), len(assessments))
+
+    def __len__(self) -> int:
+        return self._len
+
+    @overload
+    def __getitem__(self, i: int) -> tuple[str, SelfAssessment]: ...
+    @overload
+    def __getitem__(self, i: slice) -> list[tuple[str, SelfAssessment]]: ...
+    def __getitem__(
+        self, i: Union[int, slice]
+    ) -> Union[tuple[str, SelfAssessment], list[tuple[str, SelfAssessment]]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._len))]
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("history index out of range")
+        return self._outputs[i], self._assessments[i]
+
+    def __iter__(self) -> Iterator[tuple[str, SelfAssessment]]:
+        return zip(islice(self._outputs, self._len), self._assessments)
+
+    def __repr__(self) -> str:
+        return f"IterationHistory({list(self)!r})"
+
+
 # Type alias for scripted provider functions
-IterationHistory = list[tuple[str, SelfAssessment]]
 ScriptFn = Callable[[int, IterationHistory], tuple[str, SelfAssessment]]
 
 
@@ -100,60 +196,80 @@ ScriptFn = Callable[[int, IterationHistory], tuple[str, SelfAssessment]]
 class ScriptedProvider:
     """Flexible mock that uses a function to generate responses.
 
-    The function receives the iteration number and full history,
-    and returns the next (output, assessment) pair.
+    The function receives the iteration number and a read-only view of
+    the full history, and returns the next (output, assessment) pair.
     """
 
     script_fn: ScriptFn = field(default=lambda i, h: ("", SelfAssessment()))
-    _history: list[tuple[str, SelfAssessment]] = field(
+    # History as parallel columns: outputs and their assessments
+    _outputs: list[str] = field(default_factory=list, init=False, repr=False)
+    _assessments: list[SelfAssessment] = field(
         default_factory=list, init=False, repr=False
     )
     _iteration: int = field(default=0, init=False, repr=False)
 
     def generate(self, prompt: str) -> str:
-        result = self.script_fn(self._iteration, list(self._history))
-        self._history.append(result)
+        history = IterationHistory(self._outputs, self._assessments)
+        output, assessment = self.script_fn(self._iteration, history)
+        self._outputs.append(output)
+        self._assessments.append(assessment)
         self._iteration += 1
-        return result[0]
+        return output
 
     def assess(self, task: str, output: str, prompt: str) -> SelfAssessment:
-        if not self._history:
+        if not self._assessments:
             return SelfAssessment()
-        return self._history[-1][1]
+        return self._assessments[-1]
 
     def reset(self) -> None:
-        self._history.clear()
+        # Rebind rather than clear so views handed out earlier stay intact
+        self._outputs = []
+        self._assessments = []
         self._iteration = 0
 
 
 # ---------- Pre-built scenarios ----------
 
 
+# Scenario steps are pure functions of the iteration number, so the first
+# _SCENARIO_TABLE_SIZE steps are built once at import and shared; later
+# iterations fall back to building the step.
+_SCENARIO_TABLE_SIZE = 32
+
+
+def _steady_step(n: int) -> tuple[str, SelfAssessment]:
+    # Each iteration: fewer issues, higher confidence, output changes
+    base_conf = min(0.3 + n * 0.15, 0.95)
+    ambiguities = max(5 - n, 0)
+    unsupported = max(4 - n, 0)
+    missing = max(3 - n, 0)
+    coverage = min(0.4 + n * 0.12, 0.98)
+
+    output = f"Version {n + 1}: Refined output with {5 - ambiguities} clarifications applied."
+    assessment = SelfAssessment(
+        definition_confidence=base_conf,
+        ambiguity_flags=tuple(f"ambiguity_{i}" for i in range(ambiguities)),
+        evidence_confidence=base_conf,
+        unsupported_claims=tuple(f"claim_{i}" for i in range(unsupported)),
+        contradictions=(),
+        task_coverage=coverage,
+        missing_elements=tuple(f"element_{i}" for i in range(missing)),
+        refinement_priority="clarity" if ambiguities > 0 else "polish",
+        refinement_suggestion=f"Address remaining {ambiguities} ambiguities",
+    )
+    return output, assessment
+
+
+_STEADY = tuple(_steady_step(n) for n in range(_SCENARIO_TABLE_SIZE))
+
+
 def steady_improvement_scenario() -> ScriptFn:
     """LLM steadily improves: ν decreases each iteration, output changes."""
 
     def fn(iteration: int, history: IterationHistory) -> tuple[str, SelfAssessment]:
-        # Each iteration: fewer issues, higher confidence, output changes
-        n = iteration
-        base_conf = min(0.3 + n * 0.15, 0.95)
-        ambiguities = max(5 - n, 0)
-        unsupported = max(4 - n, 0)
-        missing = max(3 - n, 0)
-        coverage = min(0.4 + n * 0.12, 0.98)
-
-        output = f"Version {n + 1}: Refined output with {5 - ambiguities} clarifications applied."
-        assessment = SelfAssessment(
-            definition_confidence=base_conf,
-            ambiguity_flags=tuple(f"ambiguity_{i}" for i in range(ambiguities)),
-            evidence_confidence=base_conf,
-            unsupported_claims=tuple(f"claim_{i}" for i in range(unsupported)),
-            contradictions=(),
-            task_coverage=coverage,
-            missing_elements=tuple(f"element_{i}" for i in range(missing)),
-            refinement_priority="clarity" if ambiguities > 0 else "polish",
-            refinement_suggestion=f"Address remaining {ambiguities} ambiguities",
-        )
-        return output, assessment
+        if iteration < _SCENARIO_TABLE_SIZE:
+            return _STEADY[iteration]
+        return _steady_step(iteration)
 
     return fn
 
@@ -244,46 +360,58 @@ def premature_convergence_scenario() -> ScriptFn:
     return fn
 
 
+def _oscillation_step(iteration: int) -> tuple[str, SelfAssessment]:
+    # Alternating good/bad: confidence oscillates
+    is_good = iteration % 2 == 0
+    conf = 0.7 if is_good else 0.35
+    ambiguities = 1 if is_good else 3
+    coverage = 0.75 if is_good else 0.5
+
+    output = f"Approach {'A' if is_good else 'B'} — iteration {iteration + 1}"
+    assessment = SelfAssessment(
+        definition_confidence=conf,
+        ambiguity_flags=tuple(f"ambiguity_{i}" for i in range(ambiguities)),
+        evidence_confidence=conf,
+        unsupported_claims=tuple(f"claim_{i}" for i in range(2 if is_good else 4)),
+        contradictions=("approach conflict",) if not is_good else (),
+        task_coverage=coverage,
+        missing_elements=tuple(f"missing_{i}" for i in range(1 if is_good else 3)),
+        refinement_priority="consistency",
+        refinement_suggestion="Pick one approach and stick with it",
+    )
+    return output, assessment
+
+
+_OSCILLATION = tuple(_oscillation_step(n) for n in range(_SCENARIO_TABLE_SIZE))
+
+
 def oscillation_scenario() -> ScriptFn:
     """ν bounces up and down — model keeps changing approach."""
 
     def fn(iteration: int, history: IterationHistory) -> tuple[str, SelfAssessment]:
-        # Alternating good/bad: confidence oscillates
-        is_good = iteration % 2 == 0
-        conf = 0.7 if is_good else 0.35
-        ambiguities = 1 if is_good else 3
-        coverage = 0.75 if is_good else 0.5
-
-        output = f"Approach {'A' if is_good else 'B'} — iteration {iteration + 1}"
-        assessment = SelfAssessment(
-            definition_confidence=conf,
-            ambiguity_flags=tuple(f"ambiguity_{i}" for i in range(ambiguities)),
-            evidence_confidence=conf,
-            unsupported_claims=tuple(f"claim_{i}" for i in range(2 if is_good else 4)),
-            contradictions=("approach conflict",) if not is_good else (),
-            task_coverage=coverage,
-            missing_elements=tuple(f"missing_{i}" for i in range(1 if is_good else 3)),
-            refinement_priority="consistency",
-            refinement_suggestion="Pick one approach and stick with it",
-        )
-        return output, assessment
+        if iteration < _SCENARIO_TABLE_SIZE:
+            return _OSCILLATION[iteration]
+        return _oscillation_step(iteration)
 
     return fn
 
 
+_STUCK = ("The same mediocre output every time.", SelfAssessment(
+    definition_confidence=0.4,
+    ambiguity_flags=("vague_term",),
+    evidence_confidence=0.35,
+    unsupported_claims=("main_claim",),
+    task_coverage=0.5,
+    missing_elements=("key_requirement",),
+    refinement_priority="everything",
+    refinement_suggestion="Need a different approach entirely",
+))
+
+
 def stuck_scenario() -> ScriptFn:
     """Nothing changes — model is completely stuck."""
 
     def fn(iteration: int, history: IterationHistory) -> tuple[str, SelfAssessment]:
-        return "The same mediocre output every time.", SelfAssessment(
-            definition_confidence=0.4,
-            ambiguity_flags=("vague_term",),
-            evidence_confidence=0.35,
-            unsupported_claims=("main_claim",),
-            task_coverage=0.5,
-            missing_elements=("key_requirement",),
-            refinement_priority="everything",
-            refinement_suggestion="Need a different approach entirely",
-        )
+        return _STUCK
 
     return fn
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+
 import pytest
 
 from nn_logic.types import (
@@ -13,7 +15,8 @@ from nn_logic.types import (
     EvidenceSet,
     TargetID,
 )
-from nn_logic.aggregate import aggregate, compute_conflict
+from nn_logic.aggregate import aggregate, aggregate_and_definedness, compute_conflict
+from nn_logic.definedness import definedness
 
 
 TID = TargetID("t")
@@ -58,6 +61,17 @@ class TestAggregate:
         assert result.neg_mass == 0.0
         assert result.conflict == 0.0
 
+    def test_zero_mass_skips_relevance(self) -> None:
+        es = EvidenceSet(items=(_e("a", 0.0), _e("b", 0.5, trust=0.0)))
+
+        def never(e: Evidence, t: TargetID, c: ContextID) -> float:
+            raise AssertionError("relevance should not be evaluated")
+
+        result = aggregate(es, TID, CID, relevance_fn=never, now=10.0, decay_rate=0.1)
+        assert result.pos_mass == 0.0
+        assert result.neg_mass == 0.0
+        assert result.def_ep == 0.0
+
     def test_all_positive(self) -> None:
         es = EvidenceSet(items=(_e("a", 0.5), _e("b", 0.3)))
         result = aggregate(es, TID, CID)
@@ -103,7 +117,51 @@ class TestAggregate:
         assert result.pos_mass < 0.5
         assert result.pos_mass > 0.0
 
+    def test_decay_shared_timestamps(self) -> None:
+        es = EvidenceSet(items=(
+            _e("a", 0.5, t=100.0),
+            _e("b", -0.3, t=100.0),
+            _e("c", 0.2, t=400.0),
+        ))
+        result = aggregate(es, TID, CID, now=1000.0, decay_rate=0.002)
+        assert result.pos_mass == pytest.approx(
+            0.5 * math.exp(-0.002 * 900.0) + 0.2 * math.exp(-0.002 * 600.0)
+        )
+        assert result.neg_mass == pytest.approx(0.3 * math.exp(-0.002 * 900.0))
+
     def test_trust_weighting(self) -> None:
         es = EvidenceSet(items=(_e("a", 0.5, trust=0.5),))
         result = aggregate(es, TID, CID)
         assert result.pos_mass == pytest.approx(0.25)
+
+    def test_column_fast_path_matches_custom_relevance(self) -> None:
+        es = EvidenceSet(items=(
+            _e("a", 0.5, trust=0.8, t=10.0),
+            _e("b", -0.4, trust=0.6, t=500.0),
+            _e("c", 0.2, t=900.0),
+        ))
+
+        def unit(e: Evidence, t: TargetID, c: ContextID) -> float:
+            return 1.0
+
+        fast = aggregate(es, TID, CID, now=1000.0, decay_rate=0.001)
+        slow = aggregate(es, TID, CID, relevance_fn=unit, now=1000.0, decay_rate=0.001)
+        assert fast.pos_mass == pytest.approx(slow.pos_mass)
+        assert fast.neg_mass == pytest.approx(slow.neg_mass)
+        assert fast.conflict == pytest.approx(slow.conflict)
+        assert fast.def_ep == pytest.approx(slow.def_ep)
+
+    def test_fused_definedness_matches_separate_calls(self) -> None:
+        items = (
+            _e("a", 0.5, trust=0.8, t=10.0),
+            _e("b", -0.4, trust=0.6, t=10.0),
+            _e("c", 0.2, t=900.0),
+        )
+        fused_es = EvidenceSet(items=items)
+        agg, def_value = aggregate_and_definedness(
+            fused_es, TID, CID, now=1000.0, decay_rate=0.001, constraints=("c1",)
+        )
+        es = EvidenceSet(items=items)
+        assert agg == aggregate(es, TID, CID, now=1000.0, decay_rate=0.001)
+        assert def_value == definedness(TID, es, ("c1",))
+        assert fused_es.kind_totals == es.kind_totals
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+
 import pytest
 
 from nn_logic.types import (
     AgentID,
+    Context,
+    ContextID,
     Evidence,
     EvidenceID,
     EvidenceKind,
@@ -86,3 +91,40 @@ class TestBoundaryTransform:
         result = boundary_transform(es, {}, PI_DEFAULT)
         items = list(result)
         assert items[0].trust == pytest.approx(PI_DEFAULT.unknown_trust_factor)
+
+    def test_columns_track_transformed_trust(self) -> None:
+        e1 = _e(src="internal", trust=0.8)
+        e2 = _e(src="external", trust=1.0)
+        es = EvidenceSet(items=(e1, e2))
+        roles = {AgentID("internal"): Role.I, AgentID("external"): Role.NOT_I}
+
+        result = boundary_transform(es, roles, PI_DEFAULT)
+        assert result.columns.trust == tuple(e.trust for e in result)
+        assert result.columns.src == es.columns.src
+
+    def test_identity_transform_returns_input(self) -> None:
+        es = EvidenceSet(items=(_e(src="internal", trust=0.8),))
+        roles = {AgentID("internal"): Role.I}
+        assert boundary_transform(es, roles, PI_DEFAULT) is es
+
+    def test_context_roles_are_a_read_only_snapshot(self) -> None:
+        roles = {AgentID("agent_a"): Role.NOT_I}
+        ctx = Context(id=ContextID("c"), roles=roles)
+        roles[AgentID("agent_a")] = Role.I
+        with pytest.raises(TypeError):
+            ctx.roles[AgentID("agent_b")] = Role.I  # type: ignore[index]
+        result = boundary_transform(EvidenceSet(items=(_e(),)), ctx.roles, PI_DEFAULT)
+        assert result.items[0].trust == PI_DEFAULT.not_i_trust_factor
+
+    def test_context_role_of(self) -> None:
+        ctx = Context(id=ContextID("c"), roles={AgentID("a"): Role.BOTH})
+        assert ctx.role_of(AgentID("a")) is Role.BOTH
+        assert ctx.role_of(AgentID("z")) is Role.UNKNOWN
+
+    def test_context_pickle_and_deepcopy_round_trip(self) -> None:
+        ctx = Context(id=ContextID("c"), roles={AgentID("a"): Role.BOTH})
+        for clone in (pickle.loads(pickle.dumps(ctx)), copy.deepcopy(ctx)):
+            assert clone == ctx
+            assert clone.role_of(AgentID("a")) is Role.BOTH
+            with pytest.raises(TypeError):
+                clone.roles[AgentID("b")] = Role.I  # type: ignore[index]
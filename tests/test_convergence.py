@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from difflib import SequenceMatcher
+
 import pytest
 
 from rwt_integration.convergence import (
@@ -9,6 +11,10 @@ from rwt_integration.convergence import (
     HybridConvergence,
     IterationSnapshot,
     NuConvergence,
+    _output_similarity,
+    _sequence_ratio,
+    _nu_scan,
+    _snapshot_similarity,
 )
 
 
@@ -130,6 +136,15 @@ class TestNuConvergence:
         assert "Split" in result.diagnostics.get("suggestion", "")
 
 
+class TestNuScan:
+    def test_trajectory_statistics(self) -> None:
+        # down, up, down, flat, flat
+        nus = [0.8, 0.5, 0.6, 0.35, 0.35, 0.35]
+        assert _nu_scan(nus, 0.4, 0.01, 2) == (2, 2, True)
+        assert _nu_scan(nus, 0.3, 0.01, 3) == (0, 2, False)
+        assert _nu_scan([0.5, 0.5], 0.4, 0.01, 2) == (0, 0, False)
+
+
 # ---------- HybridConvergence ----------
 
 class TestHybridConvergence:
@@ -201,3 +216,41 @@ class TestHybridConvergence:
         ]
         result = strategy.should_stop(history)
         assert result.diagnostics.get("is_spinning") is True
+
+
+# ---------- Similarity ----------
+
+class TestOutputSimilarity:
+    def test_pairs_scored_once_across_calls(self) -> None:
+        _sequence_ratio.cache_clear()
+        history = [_snap(i, "x = 1\n" * 20 + str(i % 2), 0.3) for i in range(5)]
+        DiffConvergence(stable_count=10).should_stop(history)
+        HybridConvergence().should_stop(history)
+        DiffConvergence(stable_count=10).should_stop(history)
+        info = _sequence_ratio.cache_info()
+        assert info.misses == 2  # only two distinct (a, b) pairs
+        assert info.hits > 0
+
+    def test_fast_paths(self) -> None:
+        assert _output_similarity("abc", "abc") == 1.0
+        assert _output_similarity("", "abc") == 0.0
+
+    def test_cutoff_only_bounds_failing_pairs(self) -> None:
+        a, b = "x" * 10, "x" * 10 + "y" * 90
+        assert _output_similarity(a, b, cutoff=0.95) < 0.95
+        a, b = "abcdefghij" * 3, "abcdefghij" * 3 + "k"
+        exact = SequenceMatcher(None, a, b).ratio()
+        assert _output_similarity(a, b, cutoff=0.95) == exact
+
+    def test_snapshot_fingerprint(self) -> None:
+        a = _snap(0, "same output", 0.3)
+        b = _snap(1, "".join(["same ", "output"]), 0.2)
+        assert a.output_hash == b.output_hash
+        assert _snapshot_similarity(a, b) == 1.0
+        assert _snapshot_similarity(a, _snap(2, "other", 0.2)) < 1.0
+
+    def test_reused_matcher_gives_fresh_ratios(self) -> None:
+        _sequence_ratio.cache_clear()
+        b = "def f(x):\n    return x + 1\n"
+        for a in ("def f(x):\n    return x\n", "def g(y): pass", b + "# done"):
+            assert _sequence_ratio(a, b) == SequenceMatcher(None, a, b).ratio()
@@ -50,6 +50,20 @@ class TestDefSem:
         result = def_sem(TID, EvidenceSet.empty(), override=custom)
         assert result == pytest.approx(0.42)
 
+    def test_fused_default_matches_provider_methods(self) -> None:
+        class Unfused(DefaultSemanticProvider):
+            pass
+
+        es = EvidenceSet(items=(
+            _e("d1", EvidenceKind.DEFINITIONAL),
+            _e("d2", EvidenceKind.DEFINITIONAL),
+            _e("p1", EvidenceKind.EPISTEMIC),
+        ))
+        for constraints in ((), ("c1",), ("c1", "c2", "c3", "c4", "c5", "c6", "c7")):
+            fused = def_sem(TID, es, constraints)
+            unfused = def_sem(TID, es, constraints, provider=Unfused())
+            assert fused == unfused
+
 
 class TestDefEp:
     def test_empty(self) -> None:
@@ -116,6 +130,28 @@ class TestDefinedness:
         )
         assert result == pytest.approx(0.5)
 
+    def test_kernel_path_matches_component_path(self) -> None:
+        class Unfused(DefaultSemanticProvider):
+            pass
+
+        es = EvidenceSet(items=(
+            _e("d1", EvidenceKind.DEFINITIONAL),
+            _e("e1", EvidenceKind.EPISTEMIC, valence=0.9),
+            _e("e2", EvidenceKind.EPISTEMIC, valence=-0.7),
+            _e("p1", EvidenceKind.PROCEDURAL, valence=0.4),
+        ))
+        for constraints in ((), ("c1", "c2")):
+            fused = definedness(TID, es, constraints)
+            unfused = definedness(TID, es, constraints, sem_provider=Unfused())
+            assert fused == unfused
+
+    def test_default_path_memoized_on_evidence(self) -> None:
+        es = EvidenceSet(items=(_e("e1", EvidenceKind.EPISTEMIC),))
+        first = definedness(TID, es, ("c1",))
+        assert ("definedness", 1, 0.4, 0.35, 0.25) in es.memo
+        assert definedness(TID, es, ("c2",)) == first
+        assert definedness(TID, es, ()) != first
+
 
 class TestNuRawFromDefinedness:
     def test_zero_def(self) -> None:
@@ -6,6 +6,9 @@ catches premature convergence that Diff misses.
 
 from __future__ import annotations
 
+import asyncio
+import sys
+
 import pytest
 
 from nn_logic.types import MockClock
@@ -20,7 +23,9 @@ from rwt_integration.convergence import (
 from rwt_integration.evaluation import EvaluationHarness
 from rwt_integration.loop import RWTLoop
 from rwt_integration.metacognition import MetacognitionBridge
+from rwt_integration.metrics import ComparisonReport
 from rwt_integration.providers import (
+    IterationHistory,
     ScriptedProvider,
     SelfAssessment,
     premature_convergence_scenario,
@@ -222,6 +227,36 @@ class TestOscillation:
         assert result.summary.converged is False
 
 
+class TestScriptedProvider:
+    def test_history_views_are_stable_snapshots(self) -> None:
+        seen: list[IterationHistory] = []
+
+        def fn(i, history):
+            seen.append(history)
+            return f"out{i}", SelfAssessment(task_coverage=i / 10)
+
+        provider = ScriptedProvider(script_fn=fn)
+        for _ in range(3):
+            provider.generate("p")
+        assert [len(h) for h in seen] == [0, 1, 2]
+        first, second = seen[2]
+        assert first == ("out0", SelfAssessment(task_coverage=0.0))
+        assert seen[2][-1][0] == "out1"
+        assert [out for out, _ in seen[2]] == ["out0", "out1"]
+        assert seen[2][:1] == [first]
+        with pytest.raises(IndexError):
+            seen[1][1]
+        provider.reset()
+        assert list(seen[2]) == [first, second]
+
+    def test_self_assessment_has_no_instance_dict(self) -> None:
+        assessment = SelfAssessment(definition_confidence=0.9)
+        if sys.version_info >= (3, 10):
+            assert not hasattr(assessment, "__dict__")
+        with pytest.raises(AttributeError):
+            assessment.task_coverage = 0.1  # type: ignore[misc]
+
+
 # ============================================================
 # EVALUATION HARNESS INTEGRATION TEST
 # ============================================================
@@ -279,3 +314,91 @@ class TestEvaluationHarness:
         assert "diff" in report.results
         # Should have entries for all three tasks
         assert len(report.results["diff"]) == 3
+
+    def test_parallel_matches_sequential(self) -> None:
+        strategies = [
+            DiffConvergence(similarity_threshold=0.99, stable_count=2),
+            NuConvergence(nu_threshold=0.45, stable_count=2, stable_epsilon=0.03),
+        ]
+        reports = []
+        for workers in (1, 4):
+            harness = EvaluationHarness(
+                config=LoopConfig(max_iterations=6, max_workers=workers),
+                clock=MockClock(1000.0),
+            )
+            provider = ScriptedProvider(script_fn=steady_improvement_scenario())
+            reports.append(harness.run_comparison(
+                tasks=ALL_TASKS, strategies=strategies, provider=provider,
+            ))
+        sequential, parallel = reports
+
+        def outcomes(report: ComparisonReport) -> dict:
+            return {
+                (name, task): [(r.iterations, r.final_nu, r.final_output) for r in runs]
+                for name, by_task in report.results.items()
+                for task, runs in by_task.items()
+            }
+
+        assert outcomes(parallel) == outcomes(sequential)
+
+    def test_history_window_bounds_snapshots(self) -> None:
+        """A window that covers the strategy's tail gives the same run."""
+        results = []
+        for window in (None, 3):
+            clock = MockClock(1000.0)
+            config = LoopConfig(max_iterations=12, history_window=window)
+            provider = ScriptedProvider(script_fn=premature_convergence_scenario())
+            strategy = DiffConvergence(similarity_threshold=0.95, stable_count=2)
+            bridge = MetacognitionBridge(clock=clock, config=config)
+            results.append(RWTLoop(provider, strategy, bridge, config, clock).run(TASK_RATE_LIMITER))
+        full, windowed = results
+        assert windowed.summary.iterations == full.summary.iterations
+        assert windowed.summary.final_output == full.summary.final_output
+        assert len(windowed.snapshots) == 3
+        assert windowed.snapshots == full.snapshots[-3:]
+
+    def test_async_comparison_matches_sync(self) -> None:
+        strategies = [
+            DiffConvergence(similarity_threshold=0.99, stable_count=2),
+            HybridConvergence(),
+        ]
+        harness = EvaluationHarness(
+            config=LoopConfig(max_iterations=6), clock=MockClock(1000.0)
+        )
+        sync = harness.run_comparison(
+            tasks=ALL_TASKS, strategies=strategies,
+            provider=ScriptedProvider(script_fn=oscillation_scenario()),
+        )
+        concurrent = asyncio.run(harness.run_comparison_async(
+            tasks=ALL_TASKS, strategies=strategies,
+            provider=ScriptedProvider(script_fn=oscillation_scenario()),
+            max_concurrency=3,
+        ))
+        for name, by_task in sync.results.items():
+            for task, runs in by_task.items():
+                other = concurrent.results[name][task]
+                assert [r.final_output for r in other] == [r.final_output for r in runs]
+                assert [r.nu_trajectory for r in other] == [r.nu_trajectory for r in runs]
+
+    def test_async_provider_bounded_by_semaphore(self) -> None:
+        class SlowProvider:
+            in_flight = 0
+            peak = 0
+
+            async def generate(self, prompt: str) -> str:
+                SlowProvider.in_flight += 1
+                SlowProvider.peak = max(SlowProvider.peak, SlowProvider.in_flight)
+                await asyncio.sleep(0)
+                SlowProvider.in_flight -= 1
+                return "fixed output"
+
+            async def assess(self, task: str, output: str, prompt: str) -> SelfAssessment:
+                return SelfAssessment(definition_confidence=0.9)
+
+        harness = EvaluationHarness(config=LoopConfig(max_iterations=3))
+        report = asyncio.run(harness.run_comparison_async(
+            tasks=ALL_TASKS, strategies=[NuConvergence()],
+            provider=SlowProvider(), max_concurrency=2,
+        ))
+        assert len(report.results["nu"]) == len(ALL_TASKS)
+        assert 1 < SlowProvider.peak <= 2
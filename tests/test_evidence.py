@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+
 import pytest
 
 from nn_logic.types import (
@@ -14,7 +17,9 @@ from nn_logic.types import (
 )
 from nn_logic.evidence import (
     add_evidence,
+    add_evidence_many,
     compute_evidence_id,
+    compute_evidence_ids_batch,
     make_evidence,
     partition_by_kind,
     should_add,
@@ -22,6 +27,20 @@ from nn_logic.evidence import (
 )
 
 
+def _ev(
+    eid: str,
+    src: str = "a",
+    valence: float = 0.5,
+    kind: EvidenceKind = EvidenceKind.EPISTEMIC,
+    time: float = 0.0,
+    trust: float = 1.0,
+) -> Evidence:
+    return Evidence(
+        id=EvidenceID(eid), kind=kind, claim=eid,
+        valence=valence, src=AgentID(src), time=time, trust=trust,
+    )
+
+
 class TestTimeBucket:
     def test_same_bucket(self) -> None:
         assert time_bucket(10.0, 60.0) == time_bucket(50.0, 60.0)
@@ -46,6 +65,37 @@ class TestEvidenceIdentity:
         id2 = compute_evidence_id(EvidenceKind.EPISTEMIC, "claim", AgentID("b"), 10.0)
         assert id1 != id2
 
+    def test_batch_matches_single(self) -> None:
+        kinds = [EvidenceKind.EPISTEMIC, EvidenceKind.PROCEDURAL, EvidenceKind.EPISTEMIC]
+        claims = ["claim", "other", "claim"]
+        srcs = [AgentID("a"), AgentID("b"), AgentID("a")]
+        times = [10.0, 130.0, 70.0]
+        batch = compute_evidence_ids_batch(kinds, claims, srcs, times)
+        single = [
+            compute_evidence_id(k, c, s, t)
+            for k, c, s, t in zip(kinds, claims, srcs, times)
+        ]
+        assert batch == single
+
+    def test_blake2b_ids_same_width(self) -> None:
+        sha = compute_evidence_id(EvidenceKind.EPISTEMIC, "claim", AgentID("a"), 10.0)
+        fast = compute_evidence_id(
+            EvidenceKind.EPISTEMIC, "claim", AgentID("a"), 10.0, id_hash="blake2b"
+        )
+        assert len(fast) == len(sha) == 16
+        assert fast != sha
+        batch = compute_evidence_ids_batch(
+            [EvidenceKind.EPISTEMIC], ["claim"], [AgentID("a")], [10.0], id_hash="blake2b"
+        )
+        assert batch == [fast]
+
+    def test_repeated_ids_share_one_string(self) -> None:
+        a = compute_evidence_id(EvidenceKind.EPISTEMIC, "claim", AgentID("a"), 10.0)
+        b = compute_evidence_ids_batch(
+            [EvidenceKind.EPISTEMIC], ["claim"], [AgentID("a")], [10.0]
+        )[0]
+        assert a is b
+
 
 class TestDedup:
     def test_strict_skips_duplicate(self) -> None:
@@ -96,6 +146,64 @@ class TestDedup:
         es = EvidenceSet(items=(e1,))
         assert not should_add(e2, es, DedupMode.CORROBORATION)
 
+    def test_add_many_matches_sequential_add(self) -> None:
+        base = EvidenceSet(items=(_ev("e1"),))
+        batch = [_ev("e1"), _ev("e1", "b"), _ev("e2"), _ev("e2"), _ev("e1", "b")]
+        for mode in DedupMode:
+            expected = base
+            for e in batch:
+                expected = add_evidence(expected, e, mode)
+            result = add_evidence_many(base, batch, mode)
+            assert result.items == expected.items
+            assert result.sources_by_id == EvidenceSet(items=result.items).sources_by_id
+
+    def test_add_many_accepts_prebuilt_batch(self) -> None:
+        base = EvidenceSet(items=(_ev("e1"),))
+        base.columns  # build the view so the batch's columns get spliced on
+        batch = EvidenceSet(items=(_ev("e2", valence=-0.25), _ev("e3", valence=0.75)))
+        for start in (base, EvidenceSet.empty()):
+            result = add_evidence_many(start, batch, DedupMode.STRICT)
+            expected = add_evidence_many(start, list(batch.items), DedupMode.STRICT)
+            assert result.items == expected.items
+            assert result.columns == EvidenceSet(items=result.items).columns
+        # A partially accepted batch falls back to the per-item path
+        dup = EvidenceSet(items=(_ev("e1"), _ev("e4", valence=0.1)))
+        result = add_evidence_many(base, dup, DedupMode.STRICT)
+        assert [e.id for e in result.items] == ["e1", "e4"]
+        assert result.columns == EvidenceSet(items=result.items).columns
+
+    def test_union_many_matches_fold(self) -> None:
+        sets = [
+            EvidenceSet(items=(_ev("e1"), _ev("e2"))),
+            EvidenceSet(items=(_ev("e2", "b"), _ev("e3", "b"))),
+            EvidenceSet(items=(_ev("e1", "c"),)),
+        ]
+        folded = EvidenceSet.empty()
+        for es in sets:
+            folded = folded.union(es)
+        assert EvidenceSet.union_many(sets).items == folded.items
+
+    def test_union_fast_paths(self) -> None:
+        base = EvidenceSet(items=(_ev("e1"), _ev("e2")))
+        assert base.union(EvidenceSet.empty()) is base
+        assert EvidenceSet.empty().union(base) is base
+        assert base.union(EvidenceSet(items=(_ev("e2", "b"),))) is base
+        # Duplicate ids on the left still get deduped
+        dup = EvidenceSet(items=(_ev("e1"), _ev("e1", "b")))
+        assert [e.src for e in dup.union(EvidenceSet.empty())] == ["a"]
+        assert [e.src for e in EvidenceSet.empty().union(dup)] == ["a"]
+
+    def test_union_memoized_per_operand(self) -> None:
+        a = EvidenceSet(items=(_ev("e1"),))
+        b = EvidenceSet(items=(_ev("e2"),))
+        merged = a.union(b)
+        assert [e.id for e in merged] == ["e1", "e2"]
+        assert a.union(b) is merged
+        assert a.union(EvidenceSet(items=(_ev("e2"),))) is not merged
+        # The memo holds weakrefs; it must not leak into pickles or copies
+        assert pickle.loads(pickle.dumps(a)) == a
+        assert copy.deepcopy(a) == a
+
 
 class TestPartitionByKind:
     def test_empty(self) -> None:
@@ -129,3 +237,67 @@ class TestPartitionByKind:
             for eid in ids:
                 assert eid not in all_ids
                 all_ids.append(eid)
+
+
+class TestEvidenceColumns:
+    def test_columns_align_with_items(self) -> None:
+        e1 = _ev("e1", time=1.0, trust=0.8)
+        e2 = _ev("e2", "b", valence=-0.2, kind=EvidenceKind.PROCEDURAL, time=2.0)
+        cols = EvidenceSet(items=(e1, e2)).columns
+        assert cols.valence == (0.5, -0.2)
+        assert cols.trust == (0.8, 1.0)
+        assert cols.time == (1.0, 2.0)
+        assert cols.kind == (EvidenceKind.EPISTEMIC, EvidenceKind.PROCEDURAL)
+        assert cols.src == (AgentID("a"), AgentID("b"))
+
+    def test_add_extends_built_columns(self) -> None:
+        e1 = _ev("e1", time=1.0)
+        e2 = _ev("e2", valence=0.3, kind=EvidenceKind.DEFINITIONAL, time=2.0)
+        es = EvidenceSet(items=(e1,))
+        _ = es.columns
+        grown = es.add(e2)
+        assert grown.columns == EvidenceSet(items=(e1, e2)).columns
+
+    def test_add_extends_built_id_index(self) -> None:
+        e2 = _ev("e1", "b")
+        es = EvidenceSet(items=(_ev("e1"),))
+        _ = es.sources_by_id
+        grown = es.add(e2)
+        assert grown.sources_by_id == {EvidenceID("e1"): (AgentID("a"), AgentID("b"))}
+        assert not should_add(e2, grown, DedupMode.CORROBORATION)
+
+    def test_kind_totals_single_pass(self) -> None:
+        items = (
+            _ev("e1", trust=0.8),
+            _ev("e2", valence=-0.2),
+            _ev("e3", valence=0.3, kind=EvidenceKind.DEFINITIONAL),
+        )
+        weights, counts = EvidenceSet(items=items).kind_totals
+        assert weights[EvidenceKind.EPISTEMIC] == pytest.approx(0.6)
+        assert weights[EvidenceKind.DEFINITIONAL] == pytest.approx(0.3)
+        assert weights[EvidenceKind.PROCEDURAL] == 0.0
+        assert counts == {
+            EvidenceKind.EPISTEMIC: 2,
+            EvidenceKind.DEFINITIONAL: 1,
+            EvidenceKind.PROCEDURAL: 0,
+        }
+
+    def test_weight_follows_replace(self) -> None:
+        import dataclasses
+        e = _ev("e1", valence=-0.5, trust=0.8)
+        assert e.weight() == pytest.approx(0.4)
+        assert dataclasses.replace(e, trust=0.5).weight() == pytest.approx(0.25)
+        assert EvidenceSet(items=(e,)).columns.weight == (e.weight(),)
+
+    def test_kind_rows_index_items(self) -> None:
+        items = (
+            _ev("e1", kind=EvidenceKind.PROCEDURAL),
+            _ev("e2"),
+            _ev("e3", kind=EvidenceKind.PROCEDURAL),
+        )
+        rows = EvidenceSet(items=items).kind_rows
+        assert rows == {
+            EvidenceKind.EPISTEMIC: (1,),
+            EvidenceKind.DEFINITIONAL: (),
+            EvidenceKind.PROCEDURAL: (0, 2),
+        }
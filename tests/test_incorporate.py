@@ -78,6 +78,22 @@ class TestIncorporate:
         added = list(new_state.evidence)[0]
         assert added.trust == pytest.approx(PI_DEFAULT.not_i_trust_factor)
 
+    def test_identity_roles_pass_through(self) -> None:
+        clock = MockClock(100.0)
+        state = make_initial_state(TargetID("t"), ContextID("c"), clock)
+        e = _e("e_self")
+        new_state, _ = incorporate(state, [e], roles={AgentID("agent"): Role.I}, clock=clock)
+        assert list(new_state.evidence) == [e]
+        # A source missing from roles is still UNKNOWN and gets discounted.
+        other = Evidence(
+            id=EvidenceID("e_other"), kind=EvidenceKind.EPISTEMIC, claim="other",
+            valence=0.5, src=AgentID("stranger"), time=100.0,
+        )
+        new_state, _ = incorporate(state, [e, other], roles={AgentID("agent"): Role.I}, clock=clock)
+        assert [x.trust for x in new_state.evidence] == [
+            1.0, pytest.approx(PI_DEFAULT.unknown_trust_factor),
+        ]
+
     def test_record_emitted(self) -> None:
         clock = MockClock(100.0)
         state = make_initial_state(TargetID("t"), ContextID("c"), clock)
@@ -91,3 +107,17 @@ class TestIncorporate:
         state = make_initial_state(TargetID("t"), ContextID("c"), clock)
         new_state, _ = incorporate(state, [_e("e1")], clock=clock)
         assert "incorporate" in new_state.metadata.history
+
+    def test_constant_def_overrides_match_callables(self) -> None:
+        clock = MockClock(100.0)
+        state = make_initial_state(TargetID("t"), ContextID("c"), clock)
+        ev = [_e("e1"), _e("e2", -0.3)]
+        via_fns, _ = incorporate(
+            state, ev, clock=clock,
+            def_sem_override=lambda t, e, c: 0.7,
+            def_ep_override=lambda t, e: 0.2,
+            def_proc_override=lambda t, e: 0.9,
+        )
+        via_tuple, _ = incorporate(state, ev, clock=clock, def_overrides=(0.7, 0.2, 0.9))
+        assert via_tuple.nu_raw == via_fns.nu_raw
+        assert via_tuple.evidence.items == via_fns.evidence.items
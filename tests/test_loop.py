@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+from difflib import SequenceMatcher
+
 import pytest
 
 from nn_logic.types import MockClock
 from nn_logic.policy import Policy
 
-from rwt_integration.config import LoopConfig
+from rwt_integration.config import LoopConfig, PromptTemplate
 from rwt_integration.convergence import DiffConvergence, HybridConvergence, NuConvergence
 from rwt_integration.loop import RWTLoop
 from rwt_integration.metacognition import MetacognitionBridge
+from rwt_integration.metrics import read_record_log
 from rwt_integration.providers import (
     MockProvider,
     ScriptedProvider,
@@ -60,6 +63,8 @@ class TestRWTLoopBasic:
         for rec in result.summary.iteration_records:
             assert rec.nu >= 0.0
             assert rec.nu <= 1.0
+            assert isinstance(rec.wall_time_ns, int) and rec.wall_time_ns >= 0
+            assert rec.wall_time_seconds == rec.wall_time_ns * 1e-9
 
     def test_respects_max_iterations(self, clock: MockClock) -> None:
         config = LoopConfig(max_iterations=3)
@@ -91,6 +96,128 @@ class TestRWTLoopBasic:
         assert len(result.summary.nu_trajectory) > 0
         assert all(0.0 <= n <= 1.0 for n in result.summary.nu_trajectory)
 
+    def test_output_diff_ratio(self, clock: MockClock, config: LoopConfig) -> None:
+        provider = ScriptedProvider(script_fn=steady_improvement_scenario())
+        strategy = NuConvergence(nu_threshold=0.1)  # run every iteration
+        bridge = MetacognitionBridge(clock=clock, config=config)
+        loop = RWTLoop(provider, strategy, bridge, config, clock)
+
+        records = loop.run(TASK_EMAIL_VALIDATOR).summary.iteration_records
+        assert records[0].output_diff_ratio == 1.0
+        for prev, rec in zip(records, records[1:]):
+            expected = 1.0 - SequenceMatcher(None, prev.output, rec.output).ratio()
+            assert rec.output_diff_ratio == expected
+
+    def test_on_iteration_streams_records(self, clock: MockClock) -> None:
+        seen = []
+        for keep in (True, False):
+            config = LoopConfig(max_iterations=5, keep_iteration_records=keep)
+            provider = ScriptedProvider(script_fn=steady_improvement_scenario())
+            bridge = MetacognitionBridge(clock=clock, config=config)
+            loop = RWTLoop(
+                provider, NuConvergence(nu_threshold=0.1), bridge, config, clock,
+                on_iteration=seen.append,
+            )
+            summary = loop.run(TASK_EMAIL_VALIDATOR).summary
+            assert summary.iterations == 5
+            assert len(summary.iteration_records) == (5 if keep else 0)
+        assert [r.iteration for r in seen] == [0, 1, 2, 3, 4] * 2
+        assert [r.nu for r in seen[:5]] == [r.nu for r in seen[5:]]
+
+    def test_unobserved_records_skip_diff(
+        self, clock: MockClock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = []
+        monkeypatch.setattr(
+            "rwt_integration.loop._snapshot_similarity",
+            lambda a, b: calls.append((a, b)) or 0.5,
+        )
+        config = LoopConfig(max_iterations=4, keep_iteration_records=False)
+        provider = ScriptedProvider(script_fn=steady_improvement_scenario())
+        bridge = MetacognitionBridge(clock=clock, config=config)
+        loop = RWTLoop(provider, NuConvergence(nu_threshold=0.1), bridge, config, clock)
+        assert loop.run(TASK_EMAIL_VALIDATOR).summary.iterations == 4
+        assert calls == []
+
+    def test_records_path_appends_jsonl(self, clock: MockClock, tmp_path) -> None:
+        path = tmp_path / "records.jsonl"
+        config = LoopConfig(
+            max_iterations=3, keep_iteration_records=False, records_path=str(path)
+        )
+        for strategy in (NuConvergence(nu_threshold=0.1), HybridConvergence()):
+            provider = ScriptedProvider(script_fn=steady_improvement_scenario())
+            bridge = MetacognitionBridge(clock=clock, config=config)
+            RWTLoop(provider, strategy, bridge, config, clock).run(TASK_EMAIL_VALIDATOR)
+        rows = list(read_record_log(path))
+        assert [(r["strategy"], r["iteration"]) for r in rows] == [
+            ("nu", 0), ("nu", 1), ("nu", 2), ("hybrid", 0), ("hybrid", 1), ("hybrid", 2)
+        ]
+        assert all(r["task_id"] == TASK_EMAIL_VALIDATOR.id for r in rows)
+        assert rows[0]["output_diff_ratio"] == 1.0
+        assert isinstance(rows[1]["assessment"], dict)
+
+    def test_provider_error_closes_record_log(self, clock: MockClock, tmp_path) -> None:
+        path = tmp_path / "records.jsonl"
+        config = LoopConfig(max_iterations=5, records_path=str(path))
+
+        class Failing(ScriptedProvider):
+            def generate(self, prompt: str) -> str:
+                if self._iteration == 3:
+                    raise RuntimeError("provider down")
+                return super().generate(prompt)
+
+        provider = Failing(script_fn=steady_improvement_scenario())
+        bridge = MetacognitionBridge(clock=clock, config=config)
+        loop = RWTLoop(provider, HybridConvergence(), bridge, config, clock)
+        with pytest.raises(RuntimeError) as excinfo:
+            loop.run(TASK_EMAIL_VALIDATOR)
+        # excinfo keeps the loop's frames alive, so the buffered records
+        # are on disk only if the driver closed the body itself
+        assert [r["iteration"] for r in read_record_log(path)] == [0, 1, 2]
+        assert "provider down" in str(excinfo.value)
+
+
+class TestSampling:
+    class _Voting:
+        """Emits "a", "b", "a" per batch; counts the calls it receives."""
+
+        def __init__(self) -> None:
+            self.batches: list[int] = []
+            self.singles = 0
+
+        def generate(self, prompt: str) -> str:
+            self.singles += 1
+            return "ab"[(self.singles - 1) % 3 == 1]
+
+        def assess(self, task: str, output: str, prompt: str) -> SelfAssessment:
+            return SelfAssessment()
+
+    def test_batch_call_and_majority(self, clock: MockClock) -> None:
+        class Batching(self._Voting):
+            def generate_batch(self, prompts: list[str]) -> list[str]:
+                self.batches.append(len(prompts))
+                return ["a", "b", "a"]
+
+        provider = Batching()
+        config = LoopConfig(max_iterations=3, samples_per_iteration=3)
+        bridge = MetacognitionBridge(clock=clock, config=config)
+        result = RWTLoop(provider, NuConvergence(nu_threshold=0.0), bridge, config, clock).run(
+            TASK_EMAIL_VALIDATOR
+        )
+        assert provider.batches == [3, 3, 3, 3]
+        assert provider.singles == 0
+        assert {r.output for r in result.summary.iteration_records} == {"a"}
+
+    def test_falls_back_to_generate(self, clock: MockClock) -> None:
+        provider = self._Voting()
+        config = LoopConfig(max_iterations=2, samples_per_iteration=3)
+        bridge = MetacognitionBridge(clock=clock, config=config)
+        result = RWTLoop(provider, NuConvergence(nu_threshold=0.0), bridge, config, clock).run(
+            TASK_EMAIL_VALIDATOR
+        )
+        assert provider.singles == 9
+        assert result.summary.final_output == "a"
+
 
 class TestRWTLoopConvergence:
     def test_diff_converges_on_stable_output(self, clock: MockClock) -> None:
@@ -119,3 +246,43 @@ class TestRWTLoopConvergence:
 
         result = loop.run(TASK_EMAIL_VALIDATOR)
         assert result.summary.strategy_name == "hybrid"
+
+
+class TestPromptTemplate:
+    def test_matches_str_format(self) -> None:
+        config = LoopConfig()
+        fields = dict(
+            task_specification="Write f", current_output="def f(): {}",
+            assessment_summary="ok", nu=0.41234, nu_raw=0.3, nu_penalty=0.0,
+            def_sem=0.5, def_ep=0.6, def_proc=0.7, conflict=0.1,
+            weakest_component="def_sem", refinement_guidance="tighten",
+            refinement_priority="edge cases",
+        )
+        assert config.refinement_prompt.render(**fields) == (
+            config.refinement_prompt_template.format(**fields)
+        )
+        assert config.assessment_prompt.render(**fields) == (
+            config.assessment_prompt_template.format(**fields)
+        )
+
+    def test_fallback_for_complex_fields(self) -> None:
+        tmpl = PromptTemplate("{x!r} {y[a]:>3}")
+        assert tmpl.render(x="s", y={"a": 1}) == "'s'   1"
+
+    def test_missing_field_raises(self) -> None:
+        with pytest.raises(KeyError):
+            PromptTemplate("{a} {b}").render(a=1)
+
+    def test_bind_prefills_fields(self) -> None:
+        tmpl = PromptTemplate("Task {spec}: {out:>4} / {spec}")
+        bound = tmpl.bind(spec="{literal}")
+        assert bound.render(out="ab") == "Task {literal}:   ab / {literal}"
+        assert tmpl.bind(spec="s").bind(out="o").render() == "Task s:    o / s"
+        fallback = PromptTemplate("{x!r} {y}").bind(x="s")
+        assert fallback.render(y=2) == "'s' 2"
+
+    def test_compiled_render_keeps_literals_verbatim(self) -> None:
+        text = "q'\"\\n {{x}} ''' {a:>3}\n{b}"
+        tmpl = PromptTemplate(text)
+        assert tmpl.render(a=1, b="z") == text.format(a=1, b="z")
+        assert PromptTemplate("").render() == ""
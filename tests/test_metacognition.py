@@ -262,3 +262,69 @@ class TestCalibration:
         # The "realistic" assessment should produce lower ν than the "optimistic" one
         # because issue counts are weighted more heavily
         assert diag2.nu < diag1.nu
+
+    def test_repeated_assessment_reuses_results(self, bridge: MetacognitionBridge) -> None:
+        """Calibration and evidence depend only on their inputs, so a repeat
+        of the same assessment at the same iteration and time is shared."""
+        a = SelfAssessment(
+            definition_confidence=0.55,
+            ambiguity_flags=("x",),
+            unsupported_claims=("y",),
+            task_coverage=0.65,
+        )
+        other = MetacognitionBridge(
+            policy=bridge._policy, config=bridge._config, clock=bridge._clock
+        )
+        first = bridge._calibrate(a, 1)
+        assert other._calibrate(a, 1) is first
+        ev = bridge._assessment_to_evidence(first, 1)
+        again = other._assessment_to_evidence(first, 1)
+        assert ev == again and ev is not again
+        assert all(x is y for x, y in zip(ev, again))
+
+    def test_def_components_fused(self, bridge: MetacognitionBridge) -> None:
+        a = SelfAssessment(
+            definition_confidence=0.6,
+            ambiguity_flags=("x", "y"),
+            evidence_confidence=0.3,
+            unsupported_claims=("z",),
+            contradictions=("c", "d"),
+            task_coverage=0.95,
+        )
+        assert bridge._compute_def_sem(a) == pytest.approx(0.4)
+        assert bridge._compute_def_ep(a) == 0.0
+        assert bridge._compute_def_proc(a) == pytest.approx(0.95)
+
+
+class TestDiagnostics:
+    @pytest.mark.parametrize("flags, unsupported, missing", [
+        ((), (), ()),
+        (("a", "b", "c"), (), ()),
+        ((), ("a", "b", "c"), ()),
+        ((), (), ("a", "b", "c", "d")),
+    ])
+    def test_weakest_component_matches_min(
+        self,
+        bridge: MetacognitionBridge,
+        flags: tuple[str, ...],
+        unsupported: tuple[str, ...],
+        missing: tuple[str, ...],
+    ) -> None:
+        state = bridge.initialize_state(TargetID("t"), ContextID("c"))
+        a = SelfAssessment(
+            definition_confidence=0.5, ambiguity_flags=flags,
+            evidence_confidence=0.5, unsupported_claims=unsupported,
+            task_coverage=0.5, missing_elements=missing,
+        )
+        _, diag = bridge.process_iteration(state, "out", a, 0)
+        components = {"def_sem": diag.def_sem, "def_ep": diag.def_ep, "def_proc": diag.def_proc}
+        assert diag.weakest_component == min(components, key=components.get)
+
+    def test_assessment_history_is_bounded(self, bridge: MetacognitionBridge) -> None:
+        state = bridge.initialize_state(TargetID("t"), ContextID("c"))
+        for i in range(6):
+            a = SelfAssessment(definition_confidence=0.1 * i)
+            state, _ = bridge.process_iteration(state, f"v{i}", a, i)
+        assert [a.definition_confidence for a in bridge._iteration_assessments] == [
+            pytest.approx(0.4), pytest.approx(0.5)
+        ]
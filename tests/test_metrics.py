@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 import pytest
 
 from rwt_integration.convergence import ConvergenceResult
@@ -50,6 +52,12 @@ class TestRunSummary:
         )
         assert s.mean_nu_delta == 0.0
 
+    def test_mean_nu_delta_matches_stepwise(self) -> None:
+        traj = (0.9, 0.7, 0.75, 0.4, 0.42, 0.1)
+        s = replace(_make_summary(), nu_trajectory=traj)
+        steps = [b - a for a, b in zip(traj, traj[1:])]
+        assert s.mean_nu_delta == pytest.approx(sum(steps) / len(steps))
+
 
 class TestComparisonReport:
     def test_iterations_comparison(self) -> None:
@@ -95,3 +103,24 @@ class TestComparisonReport:
         assert "diff" in summary
         assert "t1" in summary["diff"]
         assert len(summary["diff"]["t1"]) == 1
+
+    def test_prebuilt_results_match_add_run(self) -> None:
+        runs = [
+            _make_summary(strategy="diff", task_id="t1", iterations=3, final_nu=0.1),
+            replace(_make_summary(strategy="diff", task_id="t2", converged=False),
+                    quality_score=0.8),
+            _make_summary(strategy="nu", task_id="t1", iterations=6, final_nu=0.7),
+        ]
+        added = ComparisonReport()
+        for r in runs:
+            added.add_run(r)
+        prebuilt = ComparisonReport(results={
+            "diff": {"t1": [runs[0]], "t2": [runs[1]]},
+            "nu": {"t1": [runs[2]]},
+        })
+        for report in (added, prebuilt):
+            assert report.iterations_comparison() == {"diff": 4.0, "nu": 6.0}
+            assert report.convergence_rate() == {"diff": 0.5, "nu": 1.0}
+            assert report.quality_comparison() == {"diff": 0.8, "nu": None}
+            assert report.final_nu_comparison() == pytest.approx({"diff": 0.2, "nu": 0.7})
+        assert prebuilt == added
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+
 import pytest
 
 from nn_logic.types import (
@@ -9,6 +12,7 @@ from nn_logic.types import (
     Metadata,
     MockClock,
     PenaltySource,
+    PenaltyVec,
     State,
     TargetID,
 )
@@ -30,6 +34,13 @@ class TestPenaltyDecay:
         # Penalties unchanged
         assert new_state.nu_penalties[PenaltySource.CONFLICT] == 0.15
 
+    def test_no_penalties_returns_state_unchanged(self) -> None:
+        clock = MockClock(100.0)
+        state = State(target_id=TargetID("t"), context_id=ContextID("c"), nu_raw=0.5)
+        new_state, record = penalty_decay(state, Policy(), clock)
+        assert new_state is state
+        assert record.operator == "penalty_decay"
+
     def test_conflict_decay_after_clear_window(self) -> None:
         clock = MockClock(100000.0)
         state = State(
@@ -100,3 +111,45 @@ class TestPenaltyDecay:
         )
         new_state, _ = penalty_decay(state, policy, clock)
         assert new_state.nu_penalties[PenaltySource.SCOPE_EXPANSION] == pytest.approx(0.09)
+
+
+class TestPenaltyVec:
+    def test_behaves_like_dict(self) -> None:
+        pv = PenaltyVec({PenaltySource.MANUAL: 0.2, PenaltySource.CONFLICT: 0.1})
+        assert pv == {PenaltySource.CONFLICT: 0.1, PenaltySource.MANUAL: 0.2}
+        assert PenaltySource.MANUAL in pv
+        assert PenaltySource.SCOPE_EXPANSION not in pv
+        assert pv.get(PenaltySource.SCOPE_EXPANSION, 0.0) == 0.0
+        assert len(pv) == 2
+        assert list(pv) == [PenaltySource.CONFLICT, PenaltySource.MANUAL]
+        with pytest.raises(KeyError):
+            pv[PenaltySource.SCOPE_EXPANSION]
+
+    def test_updates_return_new_vectors(self) -> None:
+        pv = PenaltyVec({PenaltySource.MANUAL: 0.2})
+        added = pv.set(PenaltySource.CONFLICT, 0.3)
+        assert added[PenaltySource.CONFLICT] == 0.3
+        assert PenaltySource.CONFLICT not in pv
+        assert added.delete(PenaltySource.MANUAL) == {PenaltySource.CONFLICT: 0.3}
+
+    def test_decay_all_skips_and_cleans_up(self) -> None:
+        pv = PenaltyVec({
+            PenaltySource.CONFLICT: 0.5,
+            PenaltySource.MANUAL: 0.2,
+            PenaltySource.SCOPE_EXPANSION: 0.011,
+        })
+        decayed = pv.decay_all(0.9, 0.01, skip=PenaltySource.CONFLICT)
+        assert decayed[PenaltySource.CONFLICT] == 0.5
+        assert decayed[PenaltySource.MANUAL] == pytest.approx(0.18)
+        assert PenaltySource.SCOPE_EXPANSION not in decayed
+
+    def test_values_in_source_order(self) -> None:
+        full = PenaltyVec((s, 0.1 * (i + 1)) for i, s in enumerate(PenaltySource))
+        assert full.values() == tuple(full[s] for s in PenaltySource)
+        assert PenaltyVec().values() == ()
+        assert PenaltyVec({PenaltySource.MANUAL: 0.2}).values() == (0.2,)
+
+    def test_pickle_and_deepcopy_round_trip(self) -> None:
+        pv = PenaltyVec({PenaltySource.MANUAL: 0.2, PenaltySource.CONFLICT: 0.1})
+        assert pickle.loads(pickle.dumps(pv)) == pv
+        assert copy.deepcopy(pv) == pv
@@ -6,6 +6,7 @@ import pytest
 
 from nn_logic.types import (
     ContextID,
+    MockClock,
     NullStatus,
     PenaltySource,
     State,
@@ -17,6 +18,8 @@ from nn_logic.query import (
     query,
     QueryResponse,
 )
+from nn_logic.operators import query_next
+from nn_logic.state import InformationState
 from nn_logic.policy import Policy
 
 
@@ -74,3 +77,27 @@ class TestDecisionQuery:
             context_id=ContextID("c"),
         )
         assert dq.best_option() is None
+
+
+class TestQueryNext:
+    def _s(self, tid: str, nu_raw: float) -> State:
+        return State(target_id=TargetID(tid), context_id=ContextID("c"), nu_raw=nu_raw)
+
+    def test_empty(self) -> None:
+        assert query_next([], POLICY) is None
+
+    def test_prefers_most_vague_above_null(self) -> None:
+        states = [self._s("a", 0.5), self._s("b", 0.9), self._s("c", 0.8)]
+        assert query_next(states, POLICY).target_id == TargetID("b")
+
+    def test_falls_back_to_highest_overall(self) -> None:
+        states = [self._s("a", 0.2), self._s("b", 0.6), self._s("c", 0.6)]
+        assert query_next(states, POLICY).target_id == TargetID("b")
+
+    def test_accepts_information_state(self) -> None:
+        sigma = InformationState(MockClock(0.0))
+        for tid, nu in (("a", 0.5), ("b", 0.9), ("c", 0.8)):
+            sigma = sigma.set(self._s(tid, nu))
+        sigma = sigma.remove(TargetID("b"), ContextID("c"))
+        assert query_next(sigma, POLICY).target_id == TargetID("c")
+        assert query_next(InformationState(MockClock(0.0)), POLICY) is None
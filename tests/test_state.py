@@ -0,0 +1,173 @@
+"""Tests for InformationState (Σ) and state metadata."""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import pickle
+import sys
+
+import pytest
+
+from nn_logic.types import (
+    AgentID,
+    ContextID,
+    Evidence,
+    EvidenceID,
+    EvidenceKind,
+    History,
+    Metadata,
+    MockClock,
+    PenaltyMode,
+    PenaltySource,
+    PenaltyVec,
+    State,
+    TargetID,
+)
+from nn_logic.helpers import make_refinement_record
+from nn_logic.state import InformationState, make_initial_state
+
+
+C = ContextID("c")
+
+
+def _s(tid: str, nu_raw: float = 0.5) -> State:
+    return State(target_id=TargetID(tid), context_id=C, nu_raw=nu_raw)
+
+
+class TestInformationState:
+    def test_get_initializes_default(self) -> None:
+        sigma = InformationState(MockClock(10.0))
+        state = sigma.get(TargetID("t"), C)
+        assert state.nu_raw == 1.0
+        assert (TargetID("t"), C) in sigma
+        assert sigma.get(TargetID("t"), C) is state
+
+    def test_set_does_not_touch_previous_version(self) -> None:
+        sigma0 = InformationState(MockClock(0.0))
+        sigma1 = sigma0.set(_s("a"))
+        sigma2 = sigma1.set(_s("a", nu_raw=0.2))
+        assert (TargetID("a"), C) not in sigma0
+        assert sigma1.get(TargetID("a"), C).nu_raw == 0.5
+        assert sigma2.get(TargetID("a"), C).nu_raw == 0.2
+
+    def test_remove(self) -> None:
+        sigma = InformationState(MockClock(0.0)).set(_s("a")).set(_s("b"))
+        removed = sigma.remove(TargetID("a"), C)
+        assert (TargetID("a"), C) not in removed
+        assert (TargetID("a"), C) in sigma
+        assert removed.keys() == [(TargetID("b"), C)]
+
+    def test_matches_dict_semantics_across_compaction(self) -> None:
+        sigma = InformationState(MockClock(0.0))
+        expected: dict[tuple[TargetID, ContextID], State] = {}
+        for i in range(200):
+            state = _s(f"t{i % 37}", nu_raw=i / 200.0)
+            sigma = sigma.set(state)
+            expected[(state.target_id, C)] = state
+            if i % 5 == 0:
+                key = (TargetID(f"t{(i * 7) % 37}"), C)
+                sigma = sigma.remove(*key)
+                expected.pop(key, None)
+        assert sigma.keys() == list(expected)
+        assert sigma.states() == list(expected.values())
+        assert list(sigma.iter_states()) == list(expected.values())
+
+    def test_get_recreates_removed_key_at_end(self) -> None:
+        sigma = InformationState(MockClock(0.0))
+        for i in range(20):
+            sigma = sigma.set(_s(f"k{i:02d}"))
+        sigma = sigma.remove(TargetID("k03"), C)
+        sigma.get(TargetID("k03"), C)
+        expected = [(TargetID(f"k{i:02d}"), C) for i in range(20) if i != 3]
+        expected.append((TargetID("k03"), C))
+        assert sigma.keys() == expected
+        assert [s.target_id for s in sigma.iter_states()] == [k for k, _ in expected]
+
+
+class TestMakeInitialState:
+    def test_ids_are_interned(self) -> None:
+        tid = TargetID("".join(["tar", "get"]))
+        state = make_initial_state(tid, ContextID("".join(["c", "tx"])))
+        assert state.target_id is sys.intern("target")
+        assert state.context_id is sys.intern("ctx")
+
+    def test_empty_defaults_are_shared(self) -> None:
+        a = make_initial_state(TargetID("a"), C)
+        b = make_initial_state(TargetID("b"), C)
+        assert a.evidence is b.evidence
+        assert a.metadata.tags is b.metadata.tags
+        assert a.metadata.tags == {}
+
+
+class TestStateNu:
+    def test_penalties_are_copied_from_caller_dict(self) -> None:
+        penalties = {PenaltySource.MANUAL: 0.2}
+        state = State(target_id=TargetID("t"), context_id=C, nu_raw=0.1, nu_penalties=penalties)
+        penalties[PenaltySource.MANUAL] = 0.9
+        assert isinstance(state.nu_penalties, PenaltyVec)
+        assert state.nu == pytest.approx(0.3)
+        assert state.nu == state.nu_with_mode(PenaltyMode.MAX)
+        assert state.replace(nu_raw=0.0).nu == pytest.approx(0.2)
+
+    def test_cached_nu_is_not_a_field(self) -> None:
+        state = _s("a", nu_raw=0.4)
+        assert state.nu == 0.4
+        assert "_nu" not in dataclasses.asdict(state)
+        assert pickle.loads(pickle.dumps(state)).nu == 0.4
+
+
+class TestHistory:
+    def test_append_shares_prefix(self) -> None:
+        base = Metadata(history=("merge",))
+        a = base.append_history("incorporate", last_modified=5.0)
+        b = base.append_history("decay")
+        assert base.history == ("merge",)
+        assert a.history == ("merge", "incorporate")
+        assert b.history == ("merge", "decay")
+        assert a.last_modified == 5.0
+
+    def test_reads_like_a_tuple(self) -> None:
+        h = History().append("a").append("b") + ("c",)
+        assert len(h) == 3
+        assert "b" in h and "z" not in h
+        assert list(h) == ["a", "b", "c"]
+        assert h[-1] == "c"
+        assert h == History(("a", "b", "c"))
+        assert hash(h) == hash(("a", "b", "c"))
+
+    def test_with_update_shares_unchanged_fields(self) -> None:
+        base = Metadata(tags={"parent": "p"}, crossings=("a->b",))
+        updated = base.with_update(last_modified=3.0)
+        assert updated.tags is base.tags
+        assert updated.crossings is base.crossings
+        assert updated.last_modified == 3.0
+        with pytest.raises(TypeError):
+            base.with_update(nope=1)
+
+
+class TestSerialization:
+    @pytest.mark.parametrize("make", [
+        lambda: Evidence(EvidenceID("e"), EvidenceKind.EPISTEMIC, "c", 0.5, AgentID("a"), 0.0),
+        lambda: _s("a"),
+        lambda: make_refinement_record(_s("a"), _s("a", 0.2), "incorporate", 1.0),
+    ])
+    def test_default_mappings_round_trip(self, make) -> None:
+        obj = make()
+        assert pickle.loads(pickle.dumps(obj)) == obj
+        assert copy.deepcopy(obj) == obj
+        assert dataclasses.asdict(obj) == dataclasses.asdict(copy.deepcopy(obj))
+
+    @pytest.mark.parametrize("round_trip", [
+        lambda s: pickle.loads(pickle.dumps(s)),
+        copy.deepcopy,
+        lambda s: dataclasses.asdict(s)["metadata"]["history"],
+    ])
+    def test_long_history_round_trips_without_recursion(self, round_trip) -> None:
+        # A fresh (unmaterialized) 1000-node history chain per case
+        metadata = Metadata()
+        for i in range(1000):
+            metadata = metadata.append_history(f"op{i % 3}")
+        clone = round_trip(_s("a").replace(metadata=metadata))
+        history = clone if isinstance(clone, History) else clone.metadata.history
+        assert history == tuple(f"op{i % 3}" for i in range(1000))
@@ -0,0 +1,65 @@
+"""Tests for trace mode (Tracer)."""
+
+from __future__ import annotations
+
+from nn_logic.types import (
+    ContextID,
+    RefinementRecord,
+    State,
+    TargetID,
+)
+from nn_logic.helpers import make_refinement_record
+from nn_logic.trace import Tracer
+
+
+def _rec(tid: str, operator: str = "incorporate", t: float = 0.0) -> RefinementRecord:
+    state = State(target_id=TargetID(tid), context_id=ContextID("c"))
+    return make_refinement_record(state, state, operator, t)
+
+
+class TestTracer:
+    def test_records_is_live_view(self) -> None:
+        tracer = Tracer()
+        view = tracer.records
+        tracer.record(_rec("a"))
+        assert len(view) == 1
+        snap = tracer.snapshot()
+        tracer.record(_rec("b"))
+        assert len(snap) == 1
+        assert len(tracer.records) == 2
+
+    def test_bounded_keeps_newest(self) -> None:
+        tracer = Tracer(max_records=2)
+        tracer.record_all([_rec("a", t=1.0), _rec("b", t=2.0), _rec("c", t=3.0)])
+        assert [r.timestamp for r in tracer.records] == [2.0, 3.0]
+
+    def test_disabled_records_nothing(self) -> None:
+        tracer = Tracer(enabled=False)
+        tracer.record(_rec("a"))
+        assert tracer.snapshot() == ()
+
+    def test_filters_use_indices(self) -> None:
+        tracer = Tracer()
+        tracer.record_all([_rec("a"), _rec("b", "decay"), _rec("a", "decay")])
+        assert [r.operator for r in tracer.for_target(TargetID("a"))] == ["incorporate", "decay"]
+        assert len(tracer.for_target(TargetID("a"), ContextID("c"))) == 2
+        assert tracer.for_target(TargetID("a"), ContextID("other")) == []
+        assert [r.target_id for r in tracer.for_operator("decay")] == ["b", "a"]
+        tracer.clear()
+        assert tracer.for_operator("decay") == []
+
+    def test_bounded_indices_track_eviction(self) -> None:
+        tracer = Tracer(max_records=2)
+        tracer.record_all([_rec("a", t=1.0), _rec("b", t=2.0), _rec("a", t=3.0)])
+        assert [r.timestamp for r in tracer.for_target(TargetID("a"))] == [3.0]
+        assert [r.timestamp for r in tracer.for_operator("incorporate")] == [2.0, 3.0]
+
+    def test_skip_noops(self) -> None:
+        state = State(target_id=TargetID("a"), context_id=ContextID("c"), nu_raw=0.4)
+        moved = state.replace(nu_raw=0.2)
+        noop = make_refinement_record(state, state, "penalty_decay", 1.0)
+        assert noop.is_noop
+        tracer = Tracer(skip_noops=True)
+        tracer.record(noop)
+        tracer.record(make_refinement_record(state, moved, "decay", 2.0))
+        assert [r.operator for r in tracer.records] == ["decay"]
@@ -10,7 +10,7 @@ from nn_logic.types import (
     RefinementRecord,
     TargetID,
 )
-from nn_logic.velocity import rv, rv_mean, rv_stuck_rate, SystemHealth
+from nn_logic.velocity import rv, rv_mean, rv_stuck_rate, rv_summary, SystemHealth
 
 
 def _record(nu_after: float, nu_raw_after: float = 0.5) -> RefinementRecord:
@@ -47,6 +47,18 @@ class TestRV:
         assert all(v == 0.0 for v in velocities)
 
 
+class TestRVSummary:
+    def test_matches_separate_metrics(self) -> None:
+        records = [_record(nu) for nu in (0.9, 0.7, 0.7, 0.65, 0.6504)]
+        velocities, mean, stuck = rv_summary(records, threshold=0.001)
+        assert velocities == rv(records)
+        assert mean == rv_mean(records)
+        assert stuck == rv_stuck_rate(records, 0.001) == pytest.approx(0.5)
+
+    def test_empty(self) -> None:
+        assert rv_summary([_record(0.5)]) == ([], 0.0, 0.0)
+
+
 class TestRVMean:
     def test_empty(self) -> None:
         assert rv_mean([]) == 0.0